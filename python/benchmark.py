@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# Copyright 2026 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Simulated Asset Management (SAM) Demo - Build Benchmarks
+
+Runs performance benchmarks for individual build steps against an existing
+SAM demo environment. Benchmarks compare alternative query strategies on the
+same warehouse and report runtime and bytes scanned from query history.
+Offline benchmarks (e.g. pdf_render) run locally and need no connection.
+
+Usage:
+    python benchmark.py --connection-name CONNECTION BENCHMARK [--test-mode]
+    python benchmark.py OFFLINE_BENCHMARK [--iterations N]
+
+Examples:
+    python benchmark.py --connection-name my_demo sec_financials   # Single-pass vs legacy XBRL pivot
+    python benchmark.py --connection-name my_demo pdf_cache        # PDF report cache hit rate
+    python benchmark.py pdf_render --iterations 10                 # Local PDF render p50/p95 and memory
+    python benchmark.py hydration --iterations 3                   # Local template hydration docs/sec per doc type
+    python benchmark.py --connection-name my_demo semantic_views   # Semantic view query timings vs previous run
+    python benchmark.py --connection-name my_demo holdings         # Logical vs materialized V_HOLDINGS_WITH_ESG
+    python benchmark.py --connection-name my_demo concentration_alerts --iterations 3  # Set-based vs loop alerts
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from logging_utils import set_verbosity, log_phase, log_phase_complete, log_step, log_info
+
+
+def _benchmark_sec_financials(session, args):
+    import generate_market_data
+    generate_market_data.benchmark_sec_financials_build(session, args.test_mode)
+
+
+def _benchmark_pdf_cache(session, args):
+    import build_ai
+    build_ai.report_pdf_cache_stats(session)
+
+
+def _representative_pdf_reports() -> dict:
+    """Agent-style markdown outputs: long tables, many headings and a mixed client review."""
+    holdings_rows = '\n'.join(
+        f"| SEC{i:04d} | Issuer {i} Holdings plc | {['Information Technology', 'Financials', 'Health Care', 'Industrials'][i % 4]} "
+        f"| {1_000_000 + i * 7919:,} | {(250 - i) / 100:.2f}% | {((i * 37) % 200 - 100) / 10:+.1f}% |"
+        for i in range(250)
+    )
+    holdings_table = (
+        "# Portfolio Holdings Review\n\n"
+        "| Ticker | Issuer | Sector | Market Value (USD) | Weight | 1Y Return |\n"
+        "|---|---|---|---|---|---|\n" + holdings_rows
+    )
+
+    many_headings = "# Quarterly Research Digest\n\n" + '\n\n'.join(
+        f"## Section {i}: Sector Outlook\n\n### Key Themes\n\n"
+        f"Demand trends remained resilient in segment {i}, with margins expanding modestly.\n\n"
+        f"- Revenue growth of {i % 9 + 2}% year on year\n- Guidance reiterated\n- Valuation in line with peers\n\n"
+        f"### Risks\n\nExecution and regulatory risks remain the primary watch items."
+        for i in range(80)
+    )
+
+    client_review = "# Q4 Client Review\n\n" + '\n\n'.join(
+        f"## {title}\n\n{body}\n\n| Metric | Portfolio | Benchmark |\n|---|---|---|\n"
+        + '\n'.join(f"| Metric {j} | {j * 1.3:.1f}% | {j * 1.1:.1f}% |" for j in range(12))
+        for title, body in [
+            ('Performance Summary', 'The portfolio outperformed its benchmark over the quarter.'),
+            ('Attribution', 'Stock selection in technology was the largest contributor.'),
+            ('ESG Profile', 'Portfolio ESG scores remain above the benchmark average.'),
+            ('Outlook', 'We maintain a quality bias heading into the new year.'),
+        ]
+    ) + "\n\n```\nAll figures are illustrative and net of fees.\n```"
+
+    return {
+        'holdings_table': (holdings_table, 'Holdings Review', 'internal'),
+        'many_headings': (many_headings, 'Research Digest', 'internal'),
+        'client_review': (client_review, 'Q4 Client Review', 'external_client'),
+        'regulatory_review': (client_review, 'Q4 Regulatory Return', 'external_regulatory'),
+    }
+
+
+def _percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _benchmark_pdf_render(session, args):
+    import pdf_report_renderer
+    
+    reports = _representative_pdf_reports()
+    font_config = pdf_report_renderer.create_font_config()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (markdown_content, report_title, document_audience) in reports.items():
+            log_step(f"Render {name} ({len(markdown_content):,} chars, {args.iterations} iterations)")
+            report = pdf_report_renderer.prepare_report(markdown_content, report_title, document_audience)
+            pdf_path = os.path.join(tmpdir, report['pdf_filename'])
+            
+            latencies_ms = []
+            tracemalloc.start()
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                pdf_report_renderer.render_pdf(report, pdf_path, font_config)
+                latencies_ms.append((time.perf_counter() - started) * 1000)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            log_info(f"  p50 {statistics.median(latencies_ms):.0f} ms, p95 {_percentile(latencies_ms, 95):.0f} ms, "
+                     f"max {max(latencies_ms):.0f} ms, peak Python memory {peak_bytes / 1024 / 1024:.1f} MB, "
+                     f"PDF {os.path.getsize(pdf_path) / 1024:.0f} KB")
+        
+        # End-to-end batch through the local disk store: first pass renders, second pass hits the cache
+        log_step("Batch render through local report store")
+        store = pdf_report_renderer.local_report_store(os.path.join(tmpdir, 'store'))
+        for label in ('cold', 'cached'):
+            started = time.perf_counter()
+            pdf_report_renderer.generate_reports(list(reports.values()), store)
+            log_info(f"  {label}: {len(reports)} reports in {(time.perf_counter() - started) * 1000:.0f} ms")
+    
+    # ru_maxrss is KB on Linux, bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_mb = max_rss / 1024 / 1024 if os.uname().sysname == 'Darwin' else max_rss / 1024
+    log_info(f"Process peak RSS: {max_rss_mb:.0f} MB")
+
+
+# Synthetic documents hydrated per doc type and iteration
+HYDRATION_BENCHMARK_DOCS = 200
+
+
+def _synthetic_hydration_inputs(linkage_level: str, count: int, sectors: list) -> dict:
+    """
+    Synthetic prefetched rows shaped like snowflake_io_utils.index_security_contexts /
+    index_issuer_contexts / index_portfolio_contexts, plus fiscal calendar,
+    SEC financials and Tier 2 portfolio metrics caches for the same entities.
+    """
+    rows, fiscal_calendars, sec_financials, tier2 = {}, {}, {}, {}
+    for i in range(1, count + 1):
+        cik = f"{1_000_000 + i:010d}"
+        if linkage_level in ('security', 'issuer'):
+            rows[i] = {
+                'SECURITYID': i, 'ISSUERID': i, 'TICKER': f"SYN{i}", 'COMPANY_NAME': f"Synthetic Company {i} Inc",
+                'ASSETCLASS': 'Equity', 'ISSUER_NAME': f"Synthetic Company {i} Inc",
+                'SIC_DESCRIPTION': sectors[i % len(sectors)], 'COUNTRYOFINCORPORATION': 'US', 'CIK': cik,
+            }
+            fiscal_calendars[cik] = [
+                {'CIK': cik, 'FISCAL_PERIOD': f"Q{4 - q}", 'FISCAL_YEAR': 2024,
+                 'PERIOD_END_DATE': date(2024, 12, 31) - timedelta(days=91 * q)}
+                for q in range(4)
+            ]
+            sec_financials[cik] = {
+                (2024, f"Q{4 - q}"): {
+                    'REVENUE': (5 + i % 40) * 1e9, 'NET_INCOME': (0.5 + i % 7) * 1e8, 'GROSS_PROFIT': (2 + i % 9) * 1e9,
+                    'OPERATING_INCOME': (1 + i % 5) * 1e9, 'EPS_DILUTED': 1.5 + (i % 30) / 10, 'EPS_BASIC': 1.6 + (i % 30) / 10,
+                    'GROSS_MARGIN_PCT': 40 + i % 30, 'OPERATING_MARGIN_PCT': 15 + i % 20, 'NET_MARGIN_PCT': 8 + i % 15,
+                    'ROE_PCT': 10 + i % 25, 'ROA_PCT': 4 + i % 10, 'DEBT_TO_EQUITY': 0.3 + (i % 20) / 10,
+                    'CURRENT_RATIO': 1.0 + (i % 15) / 10, 'FREE_CASH_FLOW': (0.4 + i % 6) * 1e9,
+                    'YOY_REVENUE_GROWTH_PCT': -5 + i % 30,
+                }
+                for q in range(4)
+            }
+        elif linkage_level == 'portfolio':
+            rows[i] = {
+                'PORTFOLIOID': i, 'PORTFOLIONAME': f"Synthetic Portfolio {i}", 'STRATEGY': ['Growth', 'Value', 'ESG'][i % 3],
+                'BASECURRENCY': 'USD', 'INCEPTIONDATE': date(2015, 1, 1),
+            }
+            top10 = [
+                {'TICKER': f"SYN{j}", 'COMPANY_NAME': f"Synthetic Company {j} Inc", 'WEIGHT_PCT': 8.0 - j * 0.5,
+                 'MARKET_VALUE_USD': (80 - j * 5) * 1e6}
+                for j in range(10)
+            ]
+            tier2[i] = {
+                'TOP10_HOLDINGS': top10, 'TOP10_WEIGHT_PCT': round(sum(h['WEIGHT_PCT'] for h in top10), 1),
+                'LARGEST_POSITION_NAME': top10[0]['COMPANY_NAME'], 'LARGEST_POSITION_WEIGHT': top10[0]['WEIGHT_PCT'],
+                'CONCENTRATION_WARNING': 'YES',
+                'SECTOR_ALLOCATION_TABLE': [{'SECTOR': sector, 'WEIGHT_PCT': 100 / len(sectors)} for sector in sectors],
+            }
+        else:  # global
+            rows[i] = {}
+    return {'rows': rows, 'fiscal_calendars': fiscal_calendars, 'sec_financials': sec_financials, 'tier2': tier2}
+
+
+def _hydrate_synthetic_document(hydration_engine, doc_type: str, linkage_level: str, entity_id: int,
+                                inputs: dict, templates: list, timings: dict) -> str:
+    """Hydrate one document like hydrate_documents does, accumulating per-phase seconds."""
+    started = time.perf_counter()
+    random.seed(f"{hydration_engine.config.RNG_SEED}:{doc_type}:{entity_id}")
+    row = inputs['rows'][entity_id]
+    if linkage_level == 'security':
+        context = hydration_engine.build_security_context_from_prefetch(
+            row, doc_type, inputs['fiscal_calendars'], inputs['sec_financials'], inputs.get('tier1'))
+    elif linkage_level == 'issuer':
+        context = hydration_engine.build_issuer_context_from_prefetch(row, doc_type, inputs['fiscal_calendars'])
+    elif linkage_level == 'portfolio':
+        context = hydration_engine.build_portfolio_context_from_prefetch(
+            None, row, doc_type, tier2_metrics=inputs['tier2'].get(entity_id), tier1_samples=inputs.get('tier1'))
+    else:
+        context = hydration_engine.build_global_context(doc_type, entity_id)
+    selected = time.perf_counter()
+    timings['context'] += selected - started
+    
+    if doc_type == 'portfolio_review':
+        template = hydration_engine.select_portfolio_review_variant(templates, context)
+    else:
+        template = hydration_engine.select_template(templates, context)
+    if doc_type == 'ngo_reports' and template['metadata'].get('severity'):
+        context['SEVERITY_LEVEL'] = template['metadata']['severity'].title()
+    conditioned = time.perf_counter()
+    timings['select'] += conditioned - selected
+    
+    context = hydration_engine.process_conditional_placeholders(template, context)
+    rendering = time.perf_counter()
+    timings['conditionals'] += rendering - conditioned
+    
+    rendered, _ = hydration_engine.fill_placeholders(template, context)
+    timings['render'] += time.perf_counter() - rendering
+    return rendered
+
+
+def _presample_tier1(hydration_engine, doc_type: str, linkage_level: str, inputs: dict) -> dict:
+    """Batch Tier 1 samples for the synthetic rows, as hydrate_documents does for its prefetch."""
+    if linkage_level == 'security':
+        return hydration_engine.sample_tier1_numerics_batch(doc_type, [
+            {'SECURITY_ID': row.get('SECURITYID'), 'SIC_DESCRIPTION': row.get('SIC_DESCRIPTION')}
+            for row in inputs['rows'].values()
+        ])
+    if linkage_level == 'portfolio':
+        return hydration_engine.sample_tier1_numerics_batch(doc_type, [
+            {'PORTFOLIO_ID': row.get('PORTFOLIOID')} for row in inputs['rows'].values()
+        ])
+    return {}
+
+
+def _benchmark_hydration(session, args):
+    import config
+    import hydration_engine
+    
+    doc_types = [dt for dt, cfg in config.DOCUMENT_TYPES.items() if cfg.get('source') != 'real']
+    templates_by_type = {}
+    load_started = time.perf_counter()
+    for doc_type in doc_types:
+        templates_by_type[doc_type] = hydration_engine.load_templates(doc_type)
+    log_info(f"Loaded {sum(len(t) for t in templates_by_type.values())} templates for {len(doc_types)} doc types "
+             f"in {(time.perf_counter() - load_started) * 1000:.0f} ms")
+    
+    # Cycle synthetic entities through every sector the templates route on (plus a SIC-style fallback)
+    sectors = sorted({tag for templates in templates_by_type.values() for t in templates
+                      for tag in t['metadata'].get('sector_tags', [])}) or ['Information Technology']
+    sectors.append('Services-Prepackaged Software')
+    
+    summary = []
+    for doc_type in doc_types:
+        linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
+        templates = templates_by_type[doc_type]
+        inputs = _synthetic_hydration_inputs(linkage_level, HYDRATION_BENCHMARK_DOCS, sectors)
+        timings = {'context': 0.0, 'select': 0.0, 'conditionals': 0.0, 'render': 0.0}
+        rendered_chars = 0
+        
+        # Warnings (e.g. unresolved placeholders) are counted rather than printed inside the timed loop
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            for _ in range(args.iterations):
+                # Presampled once per run like hydrate_documents; counted in the context phase
+                presample_started = time.perf_counter()
+                inputs['tier1'] = _presample_tier1(hydration_engine, doc_type, linkage_level, inputs)
+                timings['context'] += time.perf_counter() - presample_started
+                for entity_id in inputs['rows']:
+                    rendered_chars += len(_hydrate_synthetic_document(
+                        hydration_engine, doc_type, linkage_level, entity_id, inputs, templates, timings))
+        
+        # Rules-only passes (part of the context phase above): provider context, Tier 1 sampled
+        # per document, and Tier 1 presampled for all entities in one batch
+        rules_contexts = [
+            {'SECURITY_ID': entity_id, 'ISSUER_ID': entity_id, 'SIC_DESCRIPTION': sectors[entity_id % len(sectors)]}
+            for entity_id in inputs['rows']
+        ]
+        rules_timings = dict.fromkeys(('provider', 'tier1', 'tier1 batch'), 0.0)
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            for rules_context in rules_contexts:
+                hydration_engine.generate_provider_context(rules_context, doc_type)
+            scalar_started = time.perf_counter()
+            for rules_context in rules_contexts:
+                hydration_engine.generate_tier1_numerics(rules_context, doc_type)
+            batch_started = time.perf_counter()
+            hydration_engine.sample_tier1_numerics_batch(doc_type, rules_contexts)
+            rules_timings['provider'] += scalar_started - started
+            rules_timings['tier1'] += batch_started - scalar_started
+            rules_timings['tier1 batch'] += time.perf_counter() - batch_started
+        
+        # Separate traced pass (tracemalloc slows allocation); documents are retained like hydrate_documents
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            documents_held = [
+                _hydrate_synthetic_document(hydration_engine, doc_type, linkage_level, entity_id, inputs, templates,
+                                            dict.fromkeys(timings, 0.0))
+                for entity_id in inputs['rows']
+            ]
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        del documents_held
+        
+        documents = HYDRATION_BENCHMARK_DOCS * args.iterations
+        total_s = sum(timings.values())
+        docs_per_sec = documents / total_s if total_s else 0.0
+        warnings = captured.getvalue().count('⚠️')
+        summary.append((doc_type, docs_per_sec))
+        phases = ', '.join(f"{phase} {seconds / documents * 1e6:.0f}" for phase, seconds in timings.items())
+        rules = ', '.join(f"{phase} {seconds / documents * 1e6:.1f}" for phase, seconds in rules_timings.items())
+        log_step(f"{doc_type} ({linkage_level}, {len(templates)} templates)")
+        log_info(f"  {docs_per_sec:,.0f} docs/s, per doc µs: {phases} ({rules}); avg {rendered_chars / documents:,.0f} chars, "
+                 f"peak Python memory {peak_bytes / 1024 / 1024:.1f} MB, {warnings} warnings")
+    
+    log_step("Slowest doc types")
+    for doc_type, docs_per_sec in sorted(summary, key=lambda item: item[1])[:5]:
+        log_info(f"  {doc_type}: {docs_per_sec:,.0f} docs/s")
+
+
+def _benchmark_semantic_views(session, args):
+    import create_semantic_views
+    create_semantic_views.benchmark_semantic_views(session)
+
+
+def _benchmark_holdings(session, args):
+    import generate_structured
+    generate_structured.benchmark_holdings_materialization(session)
+
+
+def _benchmark_concentration_alerts(session, args):
+    import generate_structured
+    generate_structured.benchmark_concentration_alerts(session, iterations=args.iterations)
+
+
+# Benchmark name -> runner(session, args)
+BENCHMARKS = {
+    'sec_financials': _benchmark_sec_financials,
+    'pdf_cache': _benchmark_pdf_cache,
+    'pdf_render': _benchmark_pdf_render,
+    'hydration': _benchmark_hydration,
+    'semantic_views': _benchmark_semantic_views,
+    'holdings': _benchmark_holdings,
+    'concentration_alerts': _benchmark_concentration_alerts,
+}
+
+# Benchmarks that run locally without a Snowflake session
+OFFLINE_BENCHMARKS = {'pdf_render', 'hydration'}
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Run SAM demo build benchmarks'
+    )
+    
+    parser.add_argument(
+        '--connection-name',
+        type=str,
+        help='Snowflake connection name from ~/.snowflake/connections.toml (required except for offline benchmarks)'
+    )
+    
+    parser.add_argument(
+        'benchmark',
+        choices=sorted(BENCHMARKS),
+        help='Benchmark to run'
+    )
+    
+    parser.add_argument(
+        '--test-mode',
+        action='store_true',
+        help='Benchmark with test mode data volumes'
+    )
+    
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=5,
+        help='Iterations per sample for offline benchmarks (default: 5)'
+    )
+    
+    args = parser.parse_args()
+    if args.benchmark not in OFFLINE_BENCHMARKS and not args.connection_name:
+        parser.error(f"--connection-name is required for benchmark '{args.benchmark}'")
+    return args
+
+
+def main():
+    """Main execution function."""
+    args = parse_arguments()
+    set_verbosity(2)
+    
+    session = None
+    if args.benchmark not in OFFLINE_BENCHMARKS:
+        from main import create_snowpark_session
+        session = create_snowpark_session(args.connection_name)
+    
+    try:
+        log_phase(f"Benchmark: {args.benchmark}")
+        BENCHMARKS[args.benchmark](session, args)
+        log_phase_complete("Benchmark complete")
+    finally:
+        if session is not None:
+            session.close()
+
+
+if __name__ == "__main__":
+    main()
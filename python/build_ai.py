@@ -23,12 +23,13 @@ This module orchestrates the creation of AI components including:
 - Validation and testing of AI components
 """
 
+import os
 from snowflake.snowpark import Session
 from typing import List
 import config
 from create_semantic_views import create_semantic_views
 from create_cortex_search import create_search_services
-from logging_utils import log_error, log_warning
+from logging_utils import log_error, log_warning, log_info, log_substep
 
 def build_all(session: Session, scenarios: List[str], build_semantic: bool = True, build_search: bool = True, build_agents: bool = True):
     """
@@ -48,6 +49,12 @@ def build_all(session: Session, scenarios: List[str], build_semantic: bool = Tru
         except Exception as e:
             log_error(f"CRITICAL: Semantic view creation failed: {e}")
             raise
+        
+        # Optional fact table layout, profiled on the semantic-view queries just created
+        if config.TABLE_LAYOUT['mode'] != 'off':
+            import generate_structured
+            log_substep(f"Fact table layout ({config.TABLE_LAYOUT['mode']})")
+            generate_structured.optimize_table_layouts(session)
     
     if build_search:
         try:
@@ -96,20 +103,67 @@ def create_pdf_report_stage(session: Session):
         ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
         COMMENT = 'Stage for generated PDF reports'
     """).collect()
+    
+    # Content-addressed cache index for GENERATE_PDF_REPORT (one row per rendered PDF)
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {config.DATABASE['name']}.AI.PDF_REPORT_CACHE (
+            CACHE_KEY VARCHAR NOT NULL PRIMARY KEY,
+            PDF_FILENAME VARCHAR NOT NULL,
+            DOCUMENT_AUDIENCE VARCHAR,
+            REPORT_TITLE VARCHAR,
+            RENDER_MS NUMBER(38,0),
+            RENDER_COUNT NUMBER(38,0) DEFAULT 1,
+            HIT_COUNT NUMBER(38,0) DEFAULT 0,
+            CREATED_AT TIMESTAMP_NTZ,
+            LAST_USED_AT TIMESTAMP_NTZ
+        )
+        COMMENT = 'Cache index for GENERATE_PDF_REPORT keyed on SHA-256 of markdown, title and audience'
+    """).collect()
+
+def _pdf_report_procedure_source() -> str:
+    """
+    Shared Python source for the PDF report procedures.
+
+    The renderer lives in pdf_report_renderer.py so it can be imported and
+    benchmarked locally; the procedures inline it and bind it to the
+    PDF_REPORTS stage and PDF_REPORT_CACHE table.
+    """
+    renderer_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdf_report_renderer.py')
+    with open(renderer_path, 'r', encoding='utf-8') as f:
+        renderer_source = f.read()
+
+    return f"""{renderer_source}
+
+from snowflake.snowpark import Session
+
+STAGE_PATH = '@{config.DATABASE["name"]}.{config.DATABASE["schemas"]["ai"]}.PDF_REPORTS'
+CACHE_TABLE = '{config.DATABASE["name"]}.{config.DATABASE["schemas"]["ai"]}.PDF_REPORT_CACHE'
+"""
 
 def create_pdf_report_tool(session: Session):
     """
-    Create generic PDF report generation tool as a Python stored procedure.
-    
+    Create generic PDF report generation tools as Python stored procedures.
+
     This tool generates professional branded PDF reports with:
     - Embedded SVG logo for Simulated Asset Management
     - Audience-based headers/footers (internal, external_client, external_regulatory)
     - Demo disclaimer in all footers
     - Professional styling with SAM brand colors
-    
-    Used by: Multiple agents (Portfolio Copilot, Sales Advisor, Executive Copilot, 
+
+    Rendered PDFs are content-addressed: the file name carries a SHA-256 of the
+    markdown, title and audience, and AI.PDF_REPORT_CACHE records each render.
+    A repeat request returns a fresh presigned URL for the staged PDF without
+    invoking weasyprint (the footer keeps the timestamp of the first render).
+
+    GENERATE_PDF_REPORTS_BATCH renders many reports in one call (e.g. quarterly
+    client reviews for every portfolio in config.PORTFOLIOS), paying the
+    procedure cold start, weasyprint font loading and stage upload once.
+
+    Used by: Multiple agents (Portfolio Copilot, Sales Advisor, Executive Copilot,
              Research Copilot, Compliance Advisor, ESG Guardian, Middle Office Copilot)
     """
+    procedure_source = _pdf_report_procedure_source()
+
     pdf_generator_sql = f"""
 CREATE OR REPLACE PROCEDURE {config.DATABASE['name']}.AI.GENERATE_PDF_REPORT(
     markdown_content VARCHAR,
@@ -123,193 +177,104 @@ PACKAGES = ('snowflake-snowpark-python','markdown','weasyprint')
 HANDLER = 'generate_pdf'
 AS
 $$
-from snowflake.snowpark import Session
-from datetime import datetime
-import re
-import markdown
-import tempfile
-import os
-import base64
+{procedure_source}
 
 def generate_pdf(session: Session, markdown_content: str, report_title: str, document_audience: str):
     \"\"\"
     Generate professional branded PDF report from markdown content.
-    
+
     Args:
         session: Snowpark session
         markdown_content: Complete markdown document from agent (using retrieved templates)
         report_title: Title for the document header (e.g., "Q4 2024 Client Review")
         document_audience: One of "internal", "external_client", or "external_regulatory"
-        
+
     Returns:
         String with download link to generated PDF
     \"\"\"
-    # Validate audience
-    valid_audiences = ['internal', 'external_client', 'external_regulatory']
-    if document_audience not in valid_audiences:
-        document_audience = 'internal'  # Default to internal if invalid
-    
-    # Generate filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    safe_title = re.sub(r'[^a-zA-Z0-9_]', '_', report_title)[:30]
-    pdf_filename = f'{{document_audience}}_{{safe_title}}_{{timestamp}}.pdf'
-    
-    # Embedded SVG logo (mountain peak design with SAM brand colors)
-    svg_logo = '''
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 120 50" width="120" height="50">
-        <!-- Mountain peaks -->
-        <polygon points="30,45 45,15 60,45" fill="#1F4E79"/>
-        <polygon points="50,45 70,8 90,45" fill="#2E75B6"/>
-        <polygon points="15,45 25,30 35,45" fill="#3F7CAC" opacity="0.8"/>
-        <!-- Snow cap on main peak -->
-        <polygon points="70,8 65,18 75,18" fill="white"/>
-        <!-- Base line -->
-        <line x1="10" y1="45" x2="95" y2="45" stroke="#1F4E79" stroke-width="2"/>
-    </svg>
-    '''
-    
-    # Encode SVG for embedding
-    svg_base64 = base64.b64encode(svg_logo.encode('utf-8')).decode('utf-8')
-    logo_src = f'data:image/svg+xml;base64,{{svg_base64}}'
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Convert markdown to HTML
-        html_body = markdown.markdown(markdown_content, extensions=['tables', 'fenced_code'])
-        
-        # Professional CSS styling for investment reports
-        css_style = \"\"\"
-            @page {{ size: A4; margin: 2cm; }}
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #2C3E50; }}
-            h1 {{ color: #1F4E79; border-bottom: 3px solid #1F4E79; padding-bottom: 10px; }}
-            h2 {{ color: #2E75B6; border-left: 4px solid #2E75B6; padding-left: 15px; margin-top: 25px; }}
-            h3 {{ color: #3F7CAC; }}
-            table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-            th {{ background-color: #1F4E79; color: white; padding: 12px; font-weight: bold; text-align: left; }}
-            td {{ padding: 10px; border-bottom: 1px solid #ddd; }}
-            tr:nth-child(even) {{ background-color: #F8F9FA; }}
-            .header {{ display: flex; align-items: center; border-bottom: 3px solid #1F4E79; padding-bottom: 15px; margin-bottom: 25px; }}
-            .header-logo {{ margin-right: 20px; }}
-            .header-text {{ flex: 1; }}
-            .header-title {{ margin: 0; color: #1F4E79; font-size: 24px; }}
-            .header-subtitle {{ margin: 5px 0 0 0; color: #666; font-size: 14px; }}
-            .footer {{ margin-top: 30px; padding-top: 15px; border-top: 2px solid #1F4E79; font-size: 11px; color: #666; }}
-            .demo-disclaimer {{ background: #FFF3CD; border: 1px solid #FFE69C; padding: 12px; margin-top: 15px; font-size: 10px; color: #664D03; border-radius: 4px; }}
-            .internal-badge {{ background: #E7F3FF; color: #1F4E79; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }}
-            .regulatory-badge {{ background: #F8D7DA; color: #721C24; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }}
-        \"\"\"
-        
-        # Audience-specific header subtitle
-        if document_audience == 'internal':
-            header_subtitle = f'<span class="internal-badge">INTERNAL DOCUMENT</span> | {{report_title}}'
-        elif document_audience == 'external_regulatory':
-            header_subtitle = f'<span class="regulatory-badge">FCA REGULATED</span> | {{report_title}}'
-        else:  # external_client
-            header_subtitle = report_title
-        
-        # Build header with logo
-        sam_header = f\"\"\"
-        <div class="header">
-            <div class="header-logo">
-                <img src="{{logo_src}}" alt="Simulated Asset Management" style="height: 50px;"/>
-            </div>
-            <div class="header-text">
-                <h1 class="header-title" style="border: none; padding: 0;">SIMULATED ASSET MANAGEMENT</h1>
-                <p class="header-subtitle">{{header_subtitle}}</p>
-            </div>
-        </div>
-        \"\"\"
-        
-        # Audience-specific footer content
-        report_timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p UTC')
-        
-        if document_audience == 'internal':
-            footer_content = f\"\"\"
-            <p><strong>Classification:</strong> Internal Use Only - Not for Distribution</p>
-            <p><strong>Generated:</strong> {{report_timestamp}}</p>
-            <p><strong>Generated By:</strong> Snowflake Intelligence</p>
-            \"\"\"
-        elif document_audience == 'external_regulatory':
-            footer_content = f\"\"\"
-            <p><strong>Regulatory Status:</strong> Prepared in accordance with FCA reporting requirements</p>
-            <p><strong>Compliance Contact:</strong> compliance@sam-demo.example</p>
-            <p><strong>Generated:</strong> {{report_timestamp}}</p>
-            \"\"\"
-        else:  # external_client
-            footer_content = f\"\"\"
-            <p><strong>Important:</strong> Past performance does not guarantee future results. Investment involves risk including possible loss of principal.</p>
-            <p><strong>Contact:</strong> clientservices@sam-demo.example</p>
-            <p><strong>Generated:</strong> {{report_timestamp}}</p>
-            \"\"\"
-        
-        # Demo disclaimer (all audiences)
-        demo_disclaimer = \"\"\"
-        <div class="demo-disclaimer">
-            <strong>DEMONSTRATION ONLY:</strong> This document was generated by Snowflake Intelligence 
-            for demonstration purposes. It does not represent real investment advice, actual portfolio data, 
-            or genuine recommendations. Simulated Asset Management is a fictional entity created for this demo.
-        </div>
-        \"\"\"
-        
-        # Complete footer
-        footer = f\"\"\"
-        <div class="footer">
-            {{footer_content}}
-            {{demo_disclaimer}}
-        </div>
-        \"\"\"
-        
-        # Complete HTML document
-        html_content = f\"\"\"
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>Simulated Asset Management - {{report_title}}</title>
-            <style>{{css_style}}</style>
-        </head>
-        <body>
-            {{sam_header}}
-            {{html_body}}
-            {{footer}}
-        </body>
-        </html>
-        \"\"\"
-        
-        # Create HTML file
-        html_path = os.path.join(tmpdir, 'report.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Convert HTML to PDF
-        import weasyprint
-        pdf_path = os.path.join(tmpdir, pdf_filename)
-        weasyprint.HTML(filename=html_path).write_pdf(pdf_path)
-        
-        # Upload to stage
-        stage_path = '@{config.DATABASE["name"]}.{config.DATABASE["schemas"]["ai"]}.PDF_REPORTS'
-        session.file.put(pdf_path, stage_path, overwrite=True, auto_compress=False)
-        
-        # Generate presigned URL for download
-        presigned_url = session.sql(
-            f"SELECT GET_PRESIGNED_URL('{{stage_path}}', '{{pdf_filename}}') AS url"
-        ).collect()[0]['URL']
-        
-        # Format response based on audience
-        audience_labels = {{
-            'internal': 'Internal Report',
-            'external_client': 'Client Report', 
-            'external_regulatory': 'Regulatory Report'
-        }}
-        audience_label = audience_labels.get(document_audience, 'Report')
-        
-        return f"[{{audience_label}}: {{report_title}}]({{presigned_url}}) - Professional PDF generated successfully with Simulated branding."
+    store = stage_report_store(session, STAGE_PATH, CACHE_TABLE)
+    return generate_reports([(markdown_content, report_title, document_audience)], store)[0]
+$$;
+    """
+
+    pdf_batch_sql = f"""
+CREATE OR REPLACE PROCEDURE {config.DATABASE['name']}.AI.GENERATE_PDF_REPORTS_BATCH(
+    reports ARRAY
+)
+RETURNS ARRAY
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python','markdown','weasyprint')
+HANDLER = 'generate_pdf_batch'
+AS
+$$
+{procedure_source}
+
+def generate_pdf_batch(session: Session, reports: list):
+    \"\"\"
+    Generate many branded PDF reports in one call.
+
+    Args:
+        session: Snowpark session
+        reports: Array of records, each either an object with markdown_content,
+                 report_title and (optional) document_audience keys or a
+                 [markdown_content, report_title, document_audience] array
+
+    Returns:
+        Array of download links, in the same order as the input records
+    \"\"\"
+    records = parse_report_records(reports)
+    if not records:
+        return []
+    return generate_reports(records, stage_report_store(session, STAGE_PATH, CACHE_TABLE))
 $$;
     """
+
     try:
         session.sql(pdf_generator_sql).collect()
     except Exception as e:
         log_error(f" PDF generator creation failed: {e}")
 
+    try:
+        session.sql(pdf_batch_sql).collect()
+    except Exception as e:
+        log_error(f" Batch PDF generator creation failed: {e}")
+
+def report_pdf_cache_stats(session: Session) -> dict:
+    """
+    Report PDF report cache effectiveness from AI.PDF_REPORT_CACHE.
+    
+    Hit rate counts every call answered from the cache against every call
+    overall; render latency saved assumes each hit would have cost the
+    recorded render time of that report.
+    """
+    row = session.sql(f"""
+        SELECT
+            COUNT(*) AS CACHED_REPORTS,
+            COALESCE(SUM(RENDER_COUNT), 0) AS RENDERS,
+            COALESCE(SUM(HIT_COUNT), 0) AS HITS,
+            COALESCE(AVG(RENDER_MS), 0) AS AVG_RENDER_MS,
+            COALESCE(SUM(HIT_COUNT * RENDER_MS), 0) AS RENDER_MS_SAVED
+        FROM {config.DATABASE['name']}.AI.PDF_REPORT_CACHE
+    """).collect()[0]
+    
+    renders = int(row['RENDERS'])
+    hits = int(row['HITS'])
+    calls = renders + hits
+    stats = {
+        'cached_reports': int(row['CACHED_REPORTS']),
+        'renders': renders,
+        'hits': hits,
+        'hit_rate': (hits / calls) if calls else 0.0,
+        'avg_render_ms': float(row['AVG_RENDER_MS']),
+        'render_ms_saved': int(row['RENDER_MS_SAVED']),
+    }
+    log_info(f"PDF report cache: {stats['cached_reports']} reports, {calls} calls, "
+             f"hit rate {stats['hit_rate']:.1%}")
+    log_info(f"  Avg render {stats['avg_render_ms']:.0f} ms, "
+             f"render latency saved {stats['render_ms_saved'] / 1000:.1f} s")
+    return stats
+
 def create_ma_simulation_tool(session: Session):
     """
     Create M&A simulation tool for executive scenario.
@@ -320,19 +285,22 @@ def create_ma_simulation_tool(session: Session):
     Used by: Executive Copilot for strategic M&A analysis
     Inputs: Target AUM, target revenue, cost synergy percentage
     Outputs: EPS accretion, synergy value, timeline, risk factors
+    
+    MA_SIMULATION_GRID is the table-function variant for sensitivity analysis:
+    it takes (min, max, steps) ranges for each input and returns one row per
+    grid point from a single call, using the same model as MA_SIMULATION_TOOL:
+    
+        SELECT * FROM TABLE(SAM_DEMO.AI.MA_SIMULATION_GRID(
+            10e9, 50e9, 5,        -- target AUM
+            100e6, 500e6, 5,      -- target revenue
+            0.10, 0.30, 5         -- cost synergy pct
+        ))
+    
+    Agent function tools cannot call table functions, so MA_SIMULATION_GRID_TOOL
+    takes the same arguments and returns the grid as an ARRAY of per-point
+    summaries (capped at MAX_TOOL_GRID_POINTS) for the ma_simulation_grid tool.
     """
-    ma_simulation_sql = f"""
-CREATE OR REPLACE FUNCTION {config.DATABASE['name']}.AI.MA_SIMULATION_TOOL(
-    target_aum FLOAT,
-    target_revenue FLOAT,
-    cost_synergy_pct FLOAT DEFAULT 0.20
-)
-RETURNS OBJECT
-LANGUAGE PYTHON
-RUNTIME_VERSION = '3.11'
-HANDLER = 'simulate_acquisition'
-AS
-$$
+    simulation_source = f"""
 def simulate_acquisition(target_aum: float, target_revenue: float, cost_synergy_pct: float = 0.20) -> dict:
     \"\"\"
     Simulate the financial impact of an acquisition on Simulated Asset Management.
@@ -439,12 +407,174 @@ def simulate_acquisition(target_aum: float, target_revenue: float, cost_synergy_
         }},
         "recommendation": f"Based on {{round(eps_accretion_year1_pct, 1)}}% Year 1 EPS accretion, this acquisition appears financially attractive. Recommend detailed due diligence focusing on client retention and integration planning."
     }}
+"""
+
+    ma_simulation_sql = f"""
+CREATE OR REPLACE FUNCTION {config.DATABASE['name']}.AI.MA_SIMULATION_TOOL(
+    target_aum FLOAT,
+    target_revenue FLOAT,
+    cost_synergy_pct FLOAT DEFAULT 0.20
+)
+RETURNS OBJECT
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+HANDLER = 'simulate_acquisition'
+AS
+$$
+{simulation_source}
+$$;
+    """
+    
+    grid_source = """
+MAX_GRID_POINTS = 100_000
+
+def grid_values(minimum: float, maximum: float, steps: int) -> list:
+    \"\"\"Evenly spaced values from minimum to maximum inclusive (steps <= 1 gives [minimum]).\"\"\"
+    steps = int(steps or 1)
+    if steps <= 1 or maximum == minimum:
+        return [minimum]
+    increment = (maximum - minimum) / (steps - 1)
+    return [minimum + i * increment for i in range(steps)]
+
+def simulate_grid(target_aum_min, target_aum_max, target_aum_steps,
+                  target_revenue_min, target_revenue_max, target_revenue_steps,
+                  cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps,
+                  max_points: int = MAX_GRID_POINTS):
+    \"\"\"Yield (target_aum, target_revenue, cost_synergy_pct, simulation) for every grid point.\"\"\"
+    aum_values = grid_values(target_aum_min, target_aum_max, target_aum_steps)
+    revenue_values = grid_values(target_revenue_min, target_revenue_max, target_revenue_steps)
+    synergy_values = grid_values(cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps)
+    
+    grid_points = len(aum_values) * len(revenue_values) * len(synergy_values)
+    if grid_points > max_points:
+        raise ValueError(f"Grid of {grid_points} points exceeds the {max_points} point limit")
+    
+    for target_aum in aum_values:
+        for target_revenue in revenue_values:
+            for cost_synergy_pct in synergy_values:
+                yield target_aum, target_revenue, cost_synergy_pct, simulate_acquisition(target_aum, target_revenue, cost_synergy_pct)
+"""
+    
+    ma_simulation_grid_sql = f"""
+CREATE OR REPLACE FUNCTION {config.DATABASE['name']}.AI.MA_SIMULATION_GRID(
+    target_aum_min FLOAT,
+    target_aum_max FLOAT,
+    target_aum_steps INT,
+    target_revenue_min FLOAT,
+    target_revenue_max FLOAT,
+    target_revenue_steps INT,
+    cost_synergy_pct_min FLOAT DEFAULT 0.20,
+    cost_synergy_pct_max FLOAT DEFAULT 0.20,
+    cost_synergy_pct_steps INT DEFAULT 1
+)
+RETURNS TABLE (
+    TARGET_AUM FLOAT,
+    TARGET_REVENUE FLOAT,
+    COST_SYNERGY_PCT FLOAT,
+    YEAR1_EPS_ACCRETION_PCT FLOAT,
+    YEAR2_EPS_ACCRETION_PCT FLOAT,
+    YEAR1_NET_CONTRIBUTION_MILLIONS FLOAT,
+    YEAR2_NET_CONTRIBUTION_MILLIONS FLOAT,
+    COMBINED_AUM_BILLIONS FLOAT,
+    INTEGRATION_RISK_LEVEL VARCHAR,
+    TIMELINE_MONTHS INT,
+    SIMULATION OBJECT
+)
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+HANDLER = 'MaSimulationGrid'
+AS
+$$
+{simulation_source}
+{grid_source}
+class MaSimulationGrid:
+    def process(self, target_aum_min, target_aum_max, target_aum_steps,
+                target_revenue_min, target_revenue_max, target_revenue_steps,
+                cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps):
+        for target_aum, target_revenue, cost_synergy_pct, result in simulate_grid(
+                target_aum_min, target_aum_max, target_aum_steps,
+                target_revenue_min, target_revenue_max, target_revenue_steps,
+                cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps):
+            yield (
+                target_aum,
+                target_revenue,
+                cost_synergy_pct,
+                result["year1_projection"]["eps_accretion_pct"],
+                result["year2_projection"]["eps_accretion_pct"],
+                result["year1_projection"]["net_contribution_millions"],
+                result["year2_projection"]["net_contribution_millions"],
+                result["strategic_impact"]["combined_aum_billions"],
+                result["risk_assessment"]["integration_risk_level"],
+                result["risk_assessment"]["timeline_months"],
+                result
+            )
+$$;
+    """
+    
+    ma_simulation_grid_tool_sql = f"""
+CREATE OR REPLACE FUNCTION {config.DATABASE['name']}.AI.MA_SIMULATION_GRID_TOOL(
+    target_aum_min FLOAT,
+    target_aum_max FLOAT,
+    target_aum_steps INT,
+    target_revenue_min FLOAT,
+    target_revenue_max FLOAT,
+    target_revenue_steps INT,
+    cost_synergy_pct_min FLOAT DEFAULT 0.20,
+    cost_synergy_pct_max FLOAT DEFAULT 0.20,
+    cost_synergy_pct_steps INT DEFAULT 1
+)
+RETURNS ARRAY
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+HANDLER = 'simulate_acquisition_grid'
+AS
+$$
+{simulation_source}
+{grid_source}
+# The whole grid is returned to the agent in one response, so keep it small
+MAX_TOOL_GRID_POINTS = 500
+
+def simulate_acquisition_grid(target_aum_min, target_aum_max, target_aum_steps,
+                              target_revenue_min, target_revenue_max, target_revenue_steps,
+                              cost_synergy_pct_min=0.20, cost_synergy_pct_max=0.20,
+                              cost_synergy_pct_steps=1) -> list:
+    \"\"\"Run simulate_acquisition over the grid and return one summary dict per point.\"\"\"
+    return [
+        {{
+            "target_aum_billions": round(target_aum / 1_000_000_000, 1),
+            "target_revenue_millions": round(target_revenue / 1_000_000, 1),
+            "cost_synergy_assumption_pct": round(cost_synergy_pct * 100, 1),
+            "year1_eps_accretion_pct": result["year1_projection"]["eps_accretion_pct"],
+            "year2_eps_accretion_pct": result["year2_projection"]["eps_accretion_pct"],
+            "year1_net_contribution_millions": result["year1_projection"]["net_contribution_millions"],
+            "year2_net_contribution_millions": result["year2_projection"]["net_contribution_millions"],
+            "combined_aum_billions": result["strategic_impact"]["combined_aum_billions"],
+            "integration_risk_level": result["risk_assessment"]["integration_risk_level"],
+            "timeline_months": result["risk_assessment"]["timeline_months"]
+        }}
+        for target_aum, target_revenue, cost_synergy_pct, result in simulate_grid(
+            target_aum_min, target_aum_max, target_aum_steps,
+            target_revenue_min, target_revenue_max, target_revenue_steps,
+            cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps,
+            max_points=MAX_TOOL_GRID_POINTS
+        )
+    ]
 $$;
     """
     try:
         session.sql(ma_simulation_sql).collect()
     except Exception as e:
         log_error(f" M&A simulation tool creation failed: {e}")
+    
+    try:
+        session.sql(ma_simulation_grid_sql).collect()
+    except Exception as e:
+        log_error(f" M&A simulation grid creation failed: {e}")
+    
+    try:
+        session.sql(ma_simulation_grid_tool_sql).collect()
+    except Exception as e:
+        log_error(f" M&A simulation grid tool creation failed: {e}")
 
 def validate_components(session: Session, semantic_built: bool, search_built: bool):
     """Validate that AI components are working correctly."""
@@ -46,6 +46,9 @@ YEARS_OF_HISTORY = 5
 # Test mode multiplier - scales down data volumes for faster dev builds (e.g. 0.1 = 10%)
 TEST_MODE_MULTIPLIER = 0.1
 
+# Maximum semantic views created concurrently in the AI phase (1 = sequential)
+SEMANTIC_VIEW_BUILD_PARALLELISM = 4
+
 # =============================================================================
 # AI MODEL CONFIGURATION
 # =============================================================================
@@ -914,6 +917,41 @@ MARKET_DATA = {
         'estimates_forward_years': 2,
         'brokers_per_company': (3, 8),  # Min/max broker coverage
         'revision_frequency': 0.3  # 30% of estimates get revised
+    },
+    # Post-build statistics logged after each real-data table build:
+    #   'off'   - no statistics; a LIMIT 1 probe still checks the table is not empty
+    #   'cheap' - row count from INFORMATION_SCHEMA metadata (no table scan)
+    #   'full'  - row count plus COUNT(DISTINCT ...) breakdowns (full table scans)
+    # Override per run with main.py --stats-mode
+    'stats_mode': 'full'
+}
+
+# Enriched holdings (CURATED.V_HOLDINGS_WITH_ESG) materialization:
+#   'view'          - logical view; the returns/ESG join runs on every query
+#   'table'         - CURATED.HOLDINGS_WITH_ESG table rebuilt after the structured build
+#   'dynamic_table' - dynamic table refreshed after the structured build, then every target_lag
+# V_HOLDINGS_WITH_ESG keeps its name in all modes, so semantic views are unaffected.
+# Override per run with main.py --holdings-materialization
+HOLDINGS_ENRICHMENT = {
+    'materialization': 'view',
+    'target_lag': '1 day'
+}
+
+# Post-build physical layout of the large fact tables (for partition pruning):
+#   'off'     - leave tables in build order
+#   'sort'    - rewrite each table sorted by its keys (INSERT OVERWRITE ... ORDER BY)
+#   'cluster' - sort as above and set the keys as clustering key (Automatic Clustering consumes credits)
+# Keys are (date column, filter column, ...). The SAM_ANALYST_VIEW / SAM_IMPLEMENTATION_VIEW
+# benchmark queries are profiled before and after (partitions scanned), so the layout runs
+# once the semantic views exist (after create_semantic_views in build_ai / SETUP_AI_COMPONENTS).
+# Override per run with main.py --table-layout or CALL SETUP_AI_COMPONENTS('sort')
+TABLE_LAYOUT = {
+    'mode': 'off',
+    'tables': {
+        'CURATED.FACT_POSITION_DAILY_ABOR': ['HoldingDate', 'PortfolioID'],
+        'CURATED.FACT_TRANSACTION': ['TransactionDate', 'PortfolioID'],
+        'MARKET_DATA.FACT_STOCK_PRICES': ['PRICE_DATE', 'SECURITYID'],
+        'CURATED.FACT_BENCHMARK_HOLDINGS': ['HOLDING_DATE', 'BENCHMARKID']
     }
 }
 
@@ -1713,6 +1751,21 @@ PROJECT_ROOT = os.path.dirname(CONFIG_DIR)
 CONTENT_LIBRARY_PATH = os.path.join(PROJECT_ROOT, 'content_library')
 CONTENT_VERSION = '1.0'
 
+# Where hydrated documents are rendered:
+#   'client'    - prefetch rows, render locally, upload documents to the RAW tables
+#   'warehouse' - render inside Snowflake with the vectorized HYDRATE_DOCUMENTS UDTF and write
+#                 the RAW table with one CREATE TABLE AS SELECT (no per-document transfer)
+# Doc types whose contexts need per-entity queries (Tier 2 portfolio metrics, engagement breach
+# context) and --incremental runs always render on the client.
+# 'partitions' spreads entities over UDTF partitions so larger warehouses render in parallel.
+# Override per run with main.py --hydration-mode
+HYDRATION = {
+    'mode': 'client',
+    'stage': 'RAW.HYDRATION_CODE',
+    'udtf': 'RAW.HYDRATE_DOCUMENTS',
+    'partitions': 64
+}
+
 # =============================================================================
 # SECTOR MAPPING CONFIGURATION (for template selection)
 # =============================================================================
@@ -2701,7 +2701,7 @@ def create_executive_copilot(session: Session):
     This agent provides firm-wide KPIs, client flow analytics, competitor analysis,
     and M&A simulation capabilities for executive leadership.
     
-    Tools (7 total - 4 reused, 3 new):
+    Tools (8 total - 4 reused, 4 new):
     - executive_kpi_analyzer (NEW) - Cortex Analyst on SAM_EXECUTIVE_VIEW
     - quantitative_analyzer (REUSE) - Cortex Analyst on SAM_ANALYST_VIEW  
     - financial_analyzer (REUSE) - Cortex Analyst on SAM_SEC_FINANCIALS_VIEW
@@ -2709,6 +2709,7 @@ def create_executive_copilot(session: Session):
     - search_strategy_docs (NEW) - Cortex Search on SAM_STRATEGY_DOCUMENTS
     - search_press_releases (REUSE) - Cortex Search on SAM_PRESS_RELEASES
     - ma_simulation (NEW) - Python UDF for M&A financial modeling
+    - ma_simulation_grid (NEW) - Python UDF for M&A sensitivity grids in one call
     """
     database_name = config.DATABASE['name']
     ai_schema = config.DATABASE['schemas']['ai']
@@ -2992,6 +2993,14 @@ Tool Selection Strategy:
    ✅ "Model acquiring $50B AUM business"
    ✅ "What's the EPS impact of this acquisition?"
    ❌ Qualitative analysis (combine with search tools)
+   ❌ Several scenarios (use ma_simulation_grid)
+
+8. M&A Sensitivity Analysis:
+   Tool: ma_simulation_grid (MA_SIMULATION_GRID_TOOL)
+   Use for: Comparing scenarios across ranges of AUM, revenue and synergy assumptions in ONE call
+   ✅ "How does EPS accretion change with synergies from 10% to 30%?"
+   ✅ "Compare acquiring $10B, $25B and $50B AUM businesses"
+   ❌ A single scenario (use ma_simulation)
 
 Complete Workflow Examples:
 
@@ -3237,6 +3246,47 @@ CREATE OR REPLACE AGENT {database_name}.{ai_schema}.AM_executive_copilot
           required:
             - target_aum
             - target_revenue
+    - tool_spec:
+        type: "generic"
+        name: "ma_simulation_grid"
+        description: "Runs the ma_simulation model over a grid of scenarios in a single call for sensitivity analysis. Each input is a range (min, max, steps); steps values are evenly spaced from min to max inclusive (steps=1 uses min). Returns: one summary per scenario with Year 1/Year 2 EPS accretion, net contribution, combined AUM, integration risk and timeline (max 500 scenarios). When to Use: Comparing deal sizes, synergy assumptions or revenue ranges side by side. When NOT to Use: A single scenario with full detail (use ma_simulation)."
+        input_schema:
+          type: "object"
+          properties:
+            target_aum_min:
+              description: "Smallest target AUM in dollars (e.g., 10000000000 for $10B)"
+              type: "number"
+            target_aum_max:
+              description: "Largest target AUM in dollars"
+              type: "number"
+            target_aum_steps:
+              description: "Number of AUM values from min to max (1 for a single value)"
+              type: "integer"
+            target_revenue_min:
+              description: "Smallest target annual revenue in dollars"
+              type: "number"
+            target_revenue_max:
+              description: "Largest target annual revenue in dollars"
+              type: "number"
+            target_revenue_steps:
+              description: "Number of revenue values from min to max (1 for a single value)"
+              type: "integer"
+            cost_synergy_pct_min:
+              description: "Smallest cost synergy as decimal (default 0.20 for 20%)"
+              type: "number"
+            cost_synergy_pct_max:
+              description: "Largest cost synergy as decimal (default 0.20 for 20%)"
+              type: "number"
+            cost_synergy_pct_steps:
+              description: "Number of synergy values from min to max (default 1)"
+              type: "integer"
+          required:
+            - target_aum_min
+            - target_aum_max
+            - target_aum_steps
+            - target_revenue_min
+            - target_revenue_max
+            - target_revenue_steps
     - tool_spec:
         type: "generic"
         name: "pdf_generator"
@@ -3306,6 +3356,14 @@ CREATE OR REPLACE AGENT {database_name}.{ai_schema}.AM_executive_copilot
       identifier: "{database_name}.AI.MA_SIMULATION_TOOL"
       name: "MA_SIMULATION_TOOL(FLOAT, FLOAT, FLOAT)"
       type: "function"
+    ma_simulation_grid:
+      execution_environment:
+        query_timeout: 30
+        type: "warehouse"
+        warehouse: "{config.WAREHOUSES['execution']['name']}"
+      identifier: "{database_name}.AI.MA_SIMULATION_GRID_TOOL"
+      name: "MA_SIMULATION_GRID_TOOL(FLOAT, FLOAT, NUMBER, FLOAT, FLOAT, NUMBER, FLOAT, FLOAT, NUMBER)"
+      type: "function"
     pdf_generator:
       execution_environment:
         query_timeout: 60
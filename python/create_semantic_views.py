@@ -21,74 +21,106 @@ research, quantitative analysis, implementation planning, SEC filings, supply ch
 and middle office operations.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from snowflake.snowpark import Session
-from typing import List
+from typing import Callable, Dict, List, Tuple
 import config
-from logging_utils import log_detail, log_warning, log_error
+from db_helpers import run_profiled_query
+from logging_utils import log_detail, log_warning, log_error, log_step, log_info
 
-def create_semantic_views(session: Session, scenarios: List[str] = None):
-    """Create semantic views required for the specified scenarios."""
+def _semantic_view_tasks(scenarios: List[str] = None) -> List[Tuple[str, Callable, bool, str]]:
+    """(view name, builder, required, failure hint) for every view the scenarios need."""
+    scenarios = scenarios or []
     
-    # Always create the main analyst view
-    try:
-        create_analyst_semantic_view(session)
-    except Exception as e:
-        log_error(f" Failed to create SAM_ANALYST_VIEW: {e}")
-        raise
+    # Always create the main analyst view (required)
+    tasks = [('SAM_ANALYST_VIEW', create_analyst_semantic_view, True, None)]
     
-    # Create implementation semantic view for portfolio management
-    if scenarios and ('portfolio_copilot' in scenarios or 'sales_advisor' in scenarios):
-        try:
-            create_implementation_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create implementation semantic view: {e}")
+    # Implementation semantic view for portfolio management
+    if 'portfolio_copilot' in scenarios or 'sales_advisor' in scenarios:
+        tasks.append(('SAM_IMPLEMENTATION_VIEW', create_implementation_semantic_view, False, None))
     
-    # Create supply chain semantic view for risk verification
-    if scenarios and 'portfolio_copilot' in scenarios:
-        try:
-            create_supply_chain_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create supply chain semantic view: {e}")
+    # Supply chain semantic view for risk verification
+    if 'portfolio_copilot' in scenarios:
+        tasks.append(('SAM_SUPPLY_CHAIN_VIEW', create_supply_chain_semantic_view, False, None))
     
-    # Create middle office semantic view for operations monitoring
-    if scenarios and 'middle_office_copilot' in scenarios:
-        try:
-            create_middle_office_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create middle office semantic view: {e}")
+    # Middle office semantic view for operations monitoring
+    if 'middle_office_copilot' in scenarios:
+        tasks.append(('SAM_MIDDLE_OFFICE_VIEW', create_middle_office_semantic_view, False, None))
     
-    # Create compliance semantic view for breach tracking and monitoring
-    if scenarios and 'compliance_advisor' in scenarios:
-        try:
-            create_compliance_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create compliance semantic view: {e}")
+    # Compliance semantic view for breach tracking and monitoring
+    if 'compliance_advisor' in scenarios:
+        tasks.append(('SAM_COMPLIANCE_VIEW', create_compliance_semantic_view, False, None))
     
-    # Create executive semantic view for firm-wide KPIs and client analytics
-    if scenarios and 'executive_copilot' in scenarios:
-        try:
-            create_executive_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create executive semantic view: {e}")
+    # Executive semantic view for firm-wide KPIs and client analytics
+    if 'executive_copilot' in scenarios:
+        tasks.append(('SAM_EXECUTIVE_VIEW', create_executive_semantic_view, False, None))
     
-    # Create fundamentals semantic view for MARKET_DATA financial analysis
-    if scenarios and 'research_copilot' in scenarios:
-        try:
-            create_fundamentals_semantic_view(session)
-        except Exception as e:
-            log_warning(f"  Warning: Could not create fundamentals semantic view: {e}")
-            log_warning(f"Run with --scope structured first to generate MARKET_DATA tables")
+    # Fundamentals semantic view for MARKET_DATA financial analysis
+    if 'research_copilot' in scenarios:
+        tasks.append(('SAM_FUNDAMENTALS_VIEW', create_fundamentals_semantic_view, False,
+                      "Run with --scope structured first to generate MARKET_DATA tables"))
     
-    # Create real SEC data semantic views (required)
-    try:
-        create_real_stock_prices_semantic_view(session)
-    except Exception as e:
-        log_warning(f"  Warning: Could not create real stock prices semantic view: {e}")
+    # Real SEC data semantic views
+    tasks.append(('SAM_STOCK_PRICES_VIEW', create_real_stock_prices_semantic_view, False, None))
+    tasks.append(('SAM_SEC_FINANCIALS_VIEW', create_sec_financials_semantic_view, False, None))
     
-    try:
-        create_sec_financials_semantic_view(session)
-    except Exception as e:
-        log_warning(f"  Warning: Could not create SEC financials semantic view: {e}")
+    return tasks
+
+def create_semantic_views(session: Session, scenarios: List[str] = None):
+    """
+    Create semantic views required for the specified scenarios.
+    
+    Views are independent DDL, so they are created concurrently on the shared
+    Snowpark session (thread-safe for query submission) with at most
+    config.SEMANTIC_VIEW_BUILD_PARALLELISM in flight. A per-view timing and
+    status summary is logged once all views finish. SAM_ANALYST_VIEW remains
+    required: its failure is raised after the other views complete.
+    """
+    tasks = _semantic_view_tasks(scenarios)
+    max_workers = max(1, min(config.SEMANTIC_VIEW_BUILD_PARALLELISM, len(tasks)))
+    
+    def run_task(builder: Callable) -> float:
+        started = time.perf_counter()
+        builder(session)
+        return time.perf_counter() - started
+    
+    results = {}
+    build_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='semantic_view') as executor:
+        futures = {executor.submit(run_task, builder): view_name for view_name, builder, _, _ in tasks}
+        for future in as_completed(futures):
+            view_name = futures[future]
+            try:
+                results[view_name] = ('created', future.result(), None)
+            except Exception as e:
+                results[view_name] = ('failed', None, e)
+    total_elapsed = time.perf_counter() - build_started
+    
+    # Per-view timing/status summary in declaration order
+    created = sum(1 for status, _, _ in results.values() if status == 'created')
+    log_detail(f"  Semantic views: {created}/{len(tasks)} created in {total_elapsed:.1f}s (parallelism {max_workers})")
+    for view_name, _, _, _ in tasks:
+        status, elapsed, _ = results[view_name]
+        timing = f"{elapsed:.1f}s" if elapsed is not None else "-"
+        log_detail(f"    {view_name:<26} {status:<8} {timing}")
+    
+    required_failure = None
+    for view_name, _, required, hint in tasks:
+        status, _, error = results[view_name]
+        if status != 'failed':
+            continue
+        if required:
+            log_error(f" Failed to create {view_name}: {error}")
+            required_failure = required_failure or error
+        else:
+            log_warning(f"  Warning: Could not create {view_name}: {error}")
+            if hint:
+                log_warning(hint)
+    
+    if required_failure is not None:
+        raise required_failure
 
 def create_analyst_semantic_view(session: Session):
     """Create main portfolio analytics semantic view (SAM_ANALYST_VIEW).
@@ -1205,3 +1237,219 @@ CREATE OR REPLACE SEMANTIC VIEW {database_name}.AI.SAM_SEC_SEGMENTS_VIEW
     COMMENT='SEC revenue segment breakdowns by geography (Europe, Americas, Asia Pacific), business unit, customer, and legal entity. Use GEOGRAPHY dimension to analyze regional revenue (e.g., BlackRock European division revenue). Use CompanyName to filter by company.'
         """).collect()
         log_detail("  Created semantic view: SAM_SEC_SEGMENTS_VIEW (geographic/business segments)")
+
+
+# =============================================================================
+# SEMANTIC VIEW BENCHMARKS
+# =============================================================================
+
+# Representative Cortex Analyst query shapes per view: query name -> (metrics, dimensions)
+SEMANTIC_VIEW_BENCHMARK_QUERIES = {
+    'SAM_ANALYST_VIEW': {
+        'market_value_by_portfolio': (['HOLDINGS.TOTAL_MARKET_VALUE'], ['PORTFOLIOS.PORTFOLIONAME']),
+        'sector_weights': (['HOLDINGS.TOTAL_MARKET_VALUE', 'HOLDINGS.HOLDING_COUNT'],
+                           ['PORTFOLIOS.PORTFOLIONAME', 'ISSUERS.GICS_Sector']),
+    },
+    'SAM_IMPLEMENTATION_VIEW': {
+        'market_value_by_portfolio': (['HOLDINGS.TOTAL_MARKET_VALUE'], ['PORTFOLIOS.PORTFOLIONAME']),
+        'trading_costs_by_security': (['TRANSACTION_COSTS.AVG_BID_ASK_SPREAD', 'TRANSACTION_COSTS.AVG_MARKET_IMPACT'],
+                                      ['SECURITIES.TICKER']),
+    },
+    'SAM_SUPPLY_CHAIN_VIEW': {
+        'exposure_by_company': (['SUPPLY_CHAIN.UPSTREAM_EXPOSURE', 'SUPPLY_CHAIN.DOWNSTREAM_EXPOSURE'],
+                                ['COMPANY_ISSUERS.CompanyName']),
+        'dependency_by_sector': (['SUPPLY_CHAIN.MAX_DEPENDENCY'],
+                                 ['COMPANY_ISSUERS.CompanySector', 'COUNTERPARTY_ISSUERS.CounterpartySector']),
+    },
+    'SAM_MIDDLE_OFFICE_VIEW': {
+        'settlements_by_status': (['SETTLEMENTS.SETTLEMENT_VALUE', 'SETTLEMENTS.SETTLEMENT_COUNT'],
+                                  ['SETTLEMENTS.SettlementStatus']),
+        'breaks_by_portfolio': (['RECONCILIATIONS.BREAK_COUNT', 'RECONCILIATIONS.BREAK_VALUE'],
+                                ['PORTFOLIOS.PORTFOLIONAME']),
+    },
+    'SAM_COMPLIANCE_VIEW': {
+        'alerts_by_portfolio': (['ALERTS.TOTAL_ALERTS', 'ALERTS.ACTIVE_ALERTS'], ['PORTFOLIOS.PortfolioName']),
+        'alerts_by_month': (['ALERTS.BREACH_COUNT'], ['ALERTS.ALERT_MONTH', 'ALERTS.AlertType']),
+    },
+    'SAM_EXECUTIVE_VIEW': {
+        'aum_by_client_type': (['CLIENTS.TOTAL_CLIENT_AUM', 'CLIENTS.CLIENT_COUNT'], ['CLIENTS.ClientType']),
+        'flows_by_type': (['CLIENT_FLOWS.GROSS_INFLOWS', 'CLIENT_FLOWS.GROSS_OUTFLOWS'], ['CLIENT_FLOWS.FlowType']),
+    },
+    'SAM_FUNDAMENTALS_VIEW': {
+        'revenue_by_company': (['FINANCIALS.TOTAL_REVENUE'], ['ISSUERS.CompanyName']),
+        'earnings_by_year': (['FINANCIALS.TOTAL_NET_INCOME', 'FINANCIALS.DILUTED_EPS'],
+                             ['ISSUERS.Sector', 'FINANCIALS.FiscalYear']),
+    },
+    'SAM_STOCK_PRICES_VIEW': {
+        'prices_by_ticker': (['PRICES.CLOSE_PRICE', 'PRICES.TOTAL_VOLUME'], ['SECURITIES.Ticker']),
+        'volume_by_sector': (['PRICES.TOTAL_VOLUME', 'PRICES.TRADING_DAYS'], ['ISSUERS.GICS_Sector']),
+    },
+    'SAM_SEC_FINANCIALS_VIEW': {
+        'revenue_by_company': (['FINANCIALS.TOTAL_REVENUE'], ['ISSUERS.CompanyName']),
+        'earnings_by_year': (['FINANCIALS.NET_INCOME_TOTAL', 'FINANCIALS.DILUTED_EPS'],
+                             ['ISSUERS.GICS_Sector', 'FINANCIALS.FiscalYear']),
+    },
+    'SAM_SEC_SEGMENTS_VIEW': {
+        'revenue_by_geography': (['SEGMENTS.SEGMENT_REVENUE_TOTAL'], ['SEGMENTS.Geography']),
+        'revenue_by_company_year': (['SEGMENTS.SEGMENT_REVENUE_TOTAL'], ['ISSUERS.CompanyName', 'SEGMENTS.FiscalYear']),
+    },
+}
+
+SEMANTIC_VIEW_BENCHMARK_TABLE = 'SEMANTIC_VIEW_BENCHMARK_RESULTS'
+
+# A query regresses when it is this much slower (or scans this much more) than the previous run...
+SEMANTIC_VIEW_REGRESSION_RATIO = 1.25
+# ...and the elapsed-time increase exceeds this floor (filters out warehouse jitter on fast queries)
+SEMANTIC_VIEW_REGRESSION_MIN_MS = 500
+
+def _semantic_view_benchmark_sql(view_fqn: str, metrics: List[str], dimensions: List[str]) -> str:
+    return f"""
+        SELECT * FROM SEMANTIC_VIEW(
+            {view_fqn}
+            METRICS {', '.join(metrics)}
+            DIMENSIONS {', '.join(dimensions)}
+        )
+    """
+
+def get_existing_semantic_views(session: Session) -> set:
+    """Names of the semantic views currently in the AI schema."""
+    database_name = config.DATABASE['name']
+    return {row['name'] for row in session.sql(f"SHOW SEMANTIC VIEWS IN SCHEMA {database_name}.AI").collect()}
+
+def profile_semantic_view_queries(session: Session, view_names: List[str]) -> Dict[str, dict]:
+    """
+    Run the SEMANTIC_VIEW_BENCHMARK_QUERIES of view_names uncached and profile them.
+    
+    Views that don't exist yet are skipped and failed queries are logged and left out.
+    
+    Returns:
+        Dict of 'VIEW.query' -> run_profiled_query() statistics
+    """
+    database_name = config.DATABASE['name']
+    existing_views = get_existing_semantic_views(session)
+    
+    results = {}
+    for view_name in view_names:
+        if view_name not in existing_views:
+            log_detail(f"  Skipping {view_name} - view not found")
+            continue
+        for query_name, (metrics, dimensions) in SEMANTIC_VIEW_BENCHMARK_QUERIES[view_name].items():
+            try:
+                results[f"{view_name}.{query_name}"] = run_profiled_query(
+                    session, _semantic_view_benchmark_sql(f"{database_name}.AI.{view_name}", metrics, dimensions)
+                )
+            except Exception as e:
+                log_warning(f"  {view_name}.{query_name} failed: {e}")
+    return results
+
+def _previous_benchmark_results(session: Session, results_table: str, run_id: str) -> Dict[Tuple[str, str], dict]:
+    """Latest earlier result per (view, query) from the benchmark history table."""
+    rows = session.sql(f"""
+        SELECT VIEW_NAME, QUERY_NAME, RUN_ID, TOTAL_ELAPSED_MS, BYTES_SCANNED
+        FROM {results_table}
+        WHERE RUN_ID <> '{run_id}' AND STATUS = 'SUCCESS'
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY VIEW_NAME, QUERY_NAME ORDER BY RUN_AT DESC) = 1
+    """).collect()
+    return {(row['VIEW_NAME'], row['QUERY_NAME']): row for row in rows}
+
+def benchmark_semantic_views(session: Session) -> List[dict]:
+    """
+    Benchmark representative metric/dimension queries on every semantic view.
+    
+    Each query runs with the result cache disabled and is profiled from query
+    history (compile time, execution time, bytes scanned). Results are appended
+    to AI.SEMANTIC_VIEW_BENCHMARK_RESULTS under a new RUN_ID, and queries that
+    are slower or scan more than the previous run are flagged as regressions.
+    
+    Returns:
+        List of per-query result dicts (including a 'regression' reason or None)
+    """
+    database_name = config.DATABASE['name']
+    results_table = f"{database_name}.AI.{SEMANTIC_VIEW_BENCHMARK_TABLE}"
+    run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {results_table} (
+            RUN_ID VARCHAR,
+            RUN_AT TIMESTAMP_NTZ,
+            VIEW_NAME VARCHAR,
+            QUERY_NAME VARCHAR,
+            STATUS VARCHAR,
+            QUERY_ID VARCHAR,
+            TOTAL_ELAPSED_MS NUMBER(38,0),
+            COMPILATION_MS NUMBER(38,0),
+            EXECUTION_MS NUMBER(38,0),
+            BYTES_SCANNED NUMBER(38,0),
+            ROWS_PRODUCED NUMBER(38,0),
+            WAREHOUSE_SIZE VARCHAR,
+            ERROR_MESSAGE VARCHAR
+        )
+        COMMENT = 'Semantic view benchmark history (see create_semantic_views.benchmark_semantic_views)'
+    """).collect()
+    
+    existing_views = {
+        row['name'] for row in session.sql(f"SHOW SEMANTIC VIEWS IN SCHEMA {database_name}.AI").collect()
+    }
+    previous = _previous_benchmark_results(session, results_table, run_id)
+    
+    log_step(f"Benchmarking semantic views (run {run_id})")
+    results = []
+    for view_name, queries in SEMANTIC_VIEW_BENCHMARK_QUERIES.items():
+        if view_name not in existing_views:
+            log_detail(f"  Skipping {view_name} - view not found")
+            continue
+        
+        for query_name, (metrics, dimensions) in queries.items():
+            result = {'view_name': view_name, 'query_name': query_name, 'regression': None}
+            try:
+                stats = run_profiled_query(
+                    session, _semantic_view_benchmark_sql(f"{database_name}.AI.{view_name}", metrics, dimensions)
+                )
+                result.update(stats, status='SUCCESS', error_message=None)
+            except Exception as e:
+                result.update(status='FAILED', error_message=str(e)[:1000])
+                log_warning(f"  {view_name}.{query_name} failed: {e}")
+                results.append(result)
+                continue
+            
+            # Compare against the previous successful run of the same query
+            prior = previous.get((view_name, query_name))
+            elapsed = result.get('total_elapsed_ms') or 0
+            scanned = result.get('bytes_scanned') or 0
+            if prior is not None:
+                prior_elapsed = prior['TOTAL_ELAPSED_MS'] or 0
+                prior_scanned = prior['BYTES_SCANNED'] or 0
+                if (elapsed > prior_elapsed * SEMANTIC_VIEW_REGRESSION_RATIO
+                        and elapsed - prior_elapsed > SEMANTIC_VIEW_REGRESSION_MIN_MS):
+                    result['regression'] = f"elapsed {prior_elapsed:,} -> {elapsed:,} ms (run {prior['RUN_ID']})"
+                elif prior_scanned and scanned > prior_scanned * SEMANTIC_VIEW_REGRESSION_RATIO:
+                    result['regression'] = f"bytes scanned {prior_scanned:,} -> {scanned:,} (run {prior['RUN_ID']})"
+            
+            log_detail(
+                f"  {view_name}.{query_name}: {elapsed:,} ms "
+                f"(compile {result.get('compilation_ms') or 0:,} ms, exec {result.get('execution_ms') or 0:,} ms), "
+                f"{scanned / 1024**2:.1f} MB scanned"
+            )
+            if result['regression']:
+                log_warning(f"  REGRESSION {view_name}.{query_name}: {result['regression']}")
+            results.append(result)
+    
+    # Persist this run for comparison by the next build
+    if results:
+        columns = ['view_name', 'query_name', 'status', 'query_id', 'total_elapsed_ms', 'compilation_ms',
+                   'execution_ms', 'bytes_scanned', 'rows_produced', 'warehouse_size', 'error_message']
+        values = ', '.join(
+            [f"('{run_id}', CURRENT_TIMESTAMP()::TIMESTAMP_NTZ, {', '.join(['?'] * len(columns))})"] * len(results)
+        )
+        session.sql(
+            f"""INSERT INTO {results_table}
+                (RUN_ID, RUN_AT, VIEW_NAME, QUERY_NAME, STATUS, QUERY_ID, TOTAL_ELAPSED_MS, COMPILATION_MS,
+                 EXECUTION_MS, BYTES_SCANNED, ROWS_PRODUCED, WAREHOUSE_SIZE, ERROR_MESSAGE)
+                VALUES {values}""",
+            params=[result.get(column) for result in results for column in columns]
+        ).collect()
+    
+    failed = sum(1 for r in results if r['status'] == 'FAILED')
+    regressions = sum(1 for r in results if r['regression'])
+    log_info(f"Semantic view benchmark {run_id}: {len(results)} queries, {failed} failed, {regressions} regressions")
+    return results
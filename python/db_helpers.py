@@ -86,3 +86,84 @@ def verify_table_access(session, database: str, schema: str, table: str) -> tupl
         error_msg = f"Cannot access {database}.{schema}.{table}: {e}"
         log_warning(error_msg)
         return (False, error_msg)
+
+
+def table_exists(session, database: str, schema: str, table: str) -> bool:
+    """
+    Check whether a table exists without querying it (metadata lookup only).
+    
+    Unlike verify_table_access(), a missing table is an expected outcome here
+    (e.g. first run of an incremental build) and is not logged as a warning.
+    """
+    result = session.sql(f"""
+        SELECT COUNT(*) as cnt
+        FROM {database}.INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table}'
+    """).collect()
+    return result[0]['CNT'] > 0
+
+
+# =============================================================================
+# QUERY PROFILING (benchmarks)
+# =============================================================================
+
+def run_profiled_query(session, sql: str, use_cached_result: bool = False) -> dict:
+    """
+    Execute a statement and return its runtime statistics from query history.
+    
+    Used by the build benchmarks to compare alternative query shapes on the
+    same warehouse. Statistics come from INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION.
+    
+    Args:
+        session: Active Snowpark session
+        sql: Statement to execute (result rows are discarded)
+        use_cached_result: Allow the result cache (disabled by default so repeated
+            SELECT benchmarks measure real execution)
+    
+    Returns:
+        Dict with query_id, total_elapsed_ms, compilation_ms, execution_ms,
+        bytes_scanned, partitions_scanned, partitions_total, rows_produced, warehouse_size
+    """
+    if not use_cached_result:
+        session.sql("ALTER SESSION SET USE_CACHED_RESULT = FALSE").collect()
+    
+    try:
+        job = session.sql(sql).collect_nowait()
+        job.result()
+        query_id = job.query_id
+    finally:
+        # Restore the result cache even when the statement fails, so callers that
+        # catch per-query errors don't leave it disabled for the rest of the run
+        if not use_cached_result:
+            session.sql("ALTER SESSION UNSET USE_CACHED_RESULT").collect()
+    
+    rows = session.sql(f"""
+        SELECT 
+            TOTAL_ELAPSED_TIME,
+            COMPILATION_TIME,
+            EXECUTION_TIME,
+            BYTES_SCANNED,
+            PARTITIONS_SCANNED,
+            PARTITIONS_TOTAL,
+            ROWS_PRODUCED,
+            WAREHOUSE_SIZE
+        FROM TABLE({config.DATABASE['name']}.INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 1000))
+        WHERE QUERY_ID = '{query_id}'
+    """).collect()
+    
+    stats = {'query_id': query_id}
+    if rows:
+        row = rows[0]
+        stats.update({
+            'total_elapsed_ms': row['TOTAL_ELAPSED_TIME'],
+            'compilation_ms': row['COMPILATION_TIME'],
+            'execution_ms': row['EXECUTION_TIME'],
+            'bytes_scanned': row['BYTES_SCANNED'],
+            'partitions_scanned': row['PARTITIONS_SCANNED'],
+            'partitions_total': row['PARTITIONS_TOTAL'],
+            'rows_produced': row['ROWS_PRODUCED'],
+            'warehouse_size': row['WAREHOUSE_SIZE']
+        })
+    else:
+        log_warning(f"Query {query_id} not found in session query history")
+    return stats
@@ -34,12 +34,13 @@ Usage:
 from snowflake.snowpark import Session
 from snowflake.snowpark.functions import col, lit, when, concat, uniform, dateadd, current_timestamp
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 import random
+import time
 
 import config
-from logging_utils import log_step, log_substep, log_detail, log_warning, log_error, log_success, log_phase, log_phase_complete
-from db_helpers import get_max_price_date, reset_max_price_date, verify_table_access
+from logging_utils import log_step, log_substep, log_detail, log_info, log_warning, log_error, log_success, log_phase, log_phase_complete
+from db_helpers import get_max_price_date, reset_max_price_date, verify_table_access, table_exists, run_profiled_query
 
 
 def build_price_anchor(session: Session, test_mode: bool = False):
@@ -80,7 +81,7 @@ def build_price_anchor(session: Session, test_mode: bool = False):
     return max_price_date
 
 
-def build_all(session: Session, test_mode: bool = False):
+def build_all(session: Session, test_mode: bool = False, incremental: bool = False):
     """Build all MARKET_DATA schema tables using real SEC data.
     
     IMPORTANT: This function requires access to SNOWFLAKE_PUBLIC_DATA_FREE.
@@ -88,6 +89,9 @@ def build_all(session: Session, test_mode: bool = False):
     
     Note: build_price_anchor() should be called separately BEFORE this
     if you need to anchor other tables to the max_price_date.
+    
+    With incremental=True the SEC filing tables (filing text, financials, segments)
+    only load filings (ADSH) not yet recorded for them in SEC_LOADED_FILINGS.
     """
     
     if not config.MARKET_DATA['enabled']:
@@ -118,13 +122,13 @@ def build_all(session: Session, test_mode: bool = False):
         log_detail(f"  FACT_STOCK_PRICES already exists (anchor: {max_price_date})")
     
     log_substep("Real SEC filing text")
-    build_real_sec_filing_text(session, test_mode)
+    build_real_sec_filing_text(session, test_mode, incremental=incremental)
     
     log_substep("Real SEC financials (comprehensive with TAM/NRR)")
-    build_real_sec_financials(session, test_mode)
+    build_real_sec_financials(session, test_mode, incremental=incremental)
     
     log_substep("Real SEC segments (geographic and business)")
-    build_sec_segments(session, test_mode)
+    build_sec_segments(session, test_mode, incremental=incremental)
     
     log_substep("Broker analyst data")
     build_broker_analyst_data(session, test_mode)
@@ -132,6 +136,7 @@ def build_all(session: Session, test_mode: bool = False):
     log_substep("Estimate data (from real SEC actuals)")
     build_estimate_data(session, test_mode)
     
+    log_stats_timing_summary(session)
     log_phase_complete("Market data complete")
 
 
@@ -165,6 +170,197 @@ def verify_real_data_access(session: Session) -> None:
         )
 
 
+# =============================================================================
+# POST-BUILD STATISTICS
+# =============================================================================
+
+STATS_MODES = ('off', 'cheap', 'full')
+
+# Per-table timings recorded by _collect_table_stats / _log_build_timing:
+# table name -> {'build_s': float, 'stats_s': float, 'stats_queries': int}
+_STEP_TIMINGS = {}
+
+# Statistics time of the last stats_mode=full run per table, so off/cheap runs can
+# report the time they avoid (recorded by log_stats_timing_summary in full mode)
+STATS_TIMING_BASELINE_TABLE = 'STATS_TIMING_BASELINE'
+
+# table name -> stats seconds; None until loaded by _load_full_stats_baseline
+_FULL_STATS_BASELINE = None
+
+
+def get_stats_mode() -> str:
+    """Return the configured post-build statistics mode (off, cheap or full)."""
+    mode = config.MARKET_DATA.get('stats_mode', 'full')
+    if mode not in STATS_MODES:
+        raise ValueError(f"Invalid MARKET_DATA stats_mode '{mode}' (expected one of {STATS_MODES})")
+    return mode
+
+
+def _collect_table_stats(session: Session, table_name: str, distinct_counts: Dict[str, str] = None) -> dict:
+    """
+    Collect logging statistics for a freshly built MARKET_DATA table.
+    
+    Behaviour depends on get_stats_mode():
+    - off: a LIMIT 1 emptiness probe only; returns {'count': 0} for an empty
+      table and {'count': None} otherwise
+    - cheap: ROW_COUNT from INFORMATION_SCHEMA.TABLES (metadata only, no scan)
+    - full: COUNT(*) plus every distinct_counts expression in a single scan
+    
+    Args:
+        session: Active Snowpark session
+        table_name: Table in the MARKET_DATA schema
+        distinct_counts: Ordered label -> SQL aggregate expression (full mode only),
+            e.g. {'issuers': 'COUNT(DISTINCT IssuerID)'}
+    
+    Returns:
+        Dict with 'count' (int or None) and one entry per distinct_counts label
+    """
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    mode = get_stats_mode()
+    stats = {'count': None}
+    queries = 0
+    if mode != 'full':
+        _load_full_stats_baseline(session)
+    started = time.perf_counter()
+    
+    if mode == 'off':
+        # Keep the empty-table guards of the build functions without counting rows
+        result = session.sql(f"""
+            SELECT 1 as PROBE FROM {database_name}.{schema_name}.{table_name} LIMIT 1
+        """).collect()
+        queries = 1
+        if not result:
+            stats['count'] = 0
+    elif mode == 'cheap':
+        result = session.sql(f"""
+            SELECT ROW_COUNT as cnt
+            FROM {database_name}.INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = '{schema_name}' AND TABLE_NAME = '{table_name}'
+        """).collect()
+        queries = 1
+        stats['count'] = result[0]['CNT'] if result else 0
+    elif mode == 'full':
+        select_list = ['COUNT(*) as CNT']
+        aliases = {}
+        for i, (label, expression) in enumerate((distinct_counts or {}).items()):
+            aliases[label] = f"STAT_{i}"
+            select_list.append(f"{expression} as STAT_{i}")
+        row = session.sql(f"""
+            SELECT {', '.join(select_list)} FROM {database_name}.{schema_name}.{table_name}
+        """).collect()[0]
+        queries = 1
+        stats['count'] = row['CNT']
+        for label, alias in aliases.items():
+            stats[label] = row[alias]
+    
+    timing = _STEP_TIMINGS.setdefault(table_name, {'build_s': 0.0, 'stats_s': 0.0, 'stats_queries': 0})
+    timing['stats_s'] = time.perf_counter() - started
+    timing['stats_queries'] = queries
+    return stats
+
+
+def _format_table_stats(stats: dict) -> str:
+    """Format _collect_table_stats output for log_detail."""
+    if stats['count'] is None:
+        return "statistics skipped (stats_mode=off, table not empty)"
+    parts = [f"{stats['count']:,} records"]
+    parts.extend(f"{value:,} {label}" for label, value in stats.items() if label != 'count')
+    return ", ".join(parts)
+
+
+def _load_full_stats_baseline(session: Session) -> Dict[str, float]:
+    """Load (once per run) the per-table statistics time of the last stats_mode=full run."""
+    global _FULL_STATS_BASELINE
+    if _FULL_STATS_BASELINE is None:
+        database_name = config.DATABASE['name']
+        schema_name = config.DATABASE['schemas']['market_data']
+        _FULL_STATS_BASELINE = {}
+        if table_exists(session, database_name, schema_name, STATS_TIMING_BASELINE_TABLE):
+            rows = session.sql(f"""
+                SELECT TABLE_NAME, STATS_S
+                FROM {database_name}.{schema_name}.{STATS_TIMING_BASELINE_TABLE}
+            """).collect()
+            _FULL_STATS_BASELINE = {row['TABLE_NAME']: row['STATS_S'] for row in rows}
+    return _FULL_STATS_BASELINE
+
+
+def _record_full_stats_baseline(session: Session) -> None:
+    """Store this stats_mode=full run's per-table statistics time as the baseline."""
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    baseline_table = f"{database_name}.{schema_name}.{STATS_TIMING_BASELINE_TABLE}"
+    values_sql = ",\n                ".join(
+        f"('{table_name}', {timing['stats_s']:.3f})" for table_name, timing in _STEP_TIMINGS.items()
+    )
+    
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {baseline_table} (
+            TABLE_NAME VARCHAR,
+            STATS_S FLOAT,
+            RECORDED_AT TIMESTAMP_LTZ
+        )
+    """).collect()
+    
+    session.sql(f"""
+        MERGE INTO {baseline_table} b
+        USING (
+            SELECT column1 as TABLE_NAME, column2 as STATS_S
+            FROM VALUES
+                {values_sql}
+        ) s
+        ON b.TABLE_NAME = s.TABLE_NAME
+        WHEN MATCHED THEN UPDATE SET b.STATS_S = s.STATS_S, b.RECORDED_AT = CURRENT_TIMESTAMP()
+        WHEN NOT MATCHED THEN INSERT (TABLE_NAME, STATS_S, RECORDED_AT)
+            VALUES (s.TABLE_NAME, s.STATS_S, CURRENT_TIMESTAMP())
+    """).collect()
+
+
+def _format_stats_saved(table_names: List[str]) -> str:
+    """Statistics time avoided versus the last stats_mode=full run ('' if none recorded)."""
+    if get_stats_mode() == 'full' or not _FULL_STATS_BASELINE:
+        return ""
+    baseline_tables = [name for name in table_names if name in _FULL_STATS_BASELINE]
+    if not baseline_tables:
+        return ""
+    saved_s = sum(_FULL_STATS_BASELINE[name] - _STEP_TIMINGS[name]['stats_s'] for name in baseline_tables)
+    return f", {saved_s:.1f}s saved vs stats_mode=full"
+
+
+def _log_build_timing(table_name: str, started: float) -> None:
+    """Log build wall-clock for a table, split into DDL and statistics time (and time saved vs full)."""
+    timing = _STEP_TIMINGS.setdefault(table_name, {'build_s': 0.0, 'stats_s': 0.0, 'stats_queries': 0})
+    timing['build_s'] = time.perf_counter() - started
+    log_detail(
+        f"  {table_name}: {timing['build_s']:.1f}s total, "
+        f"{timing['stats_s']:.1f}s in {timing['stats_queries']} stats queries (stats_mode={get_stats_mode()})"
+        f"{_format_stats_saved([table_name])}"
+    )
+
+
+def log_stats_timing_summary(session: Session) -> None:
+    """
+    Log the statistics share of MARKET_DATA build time.
+    
+    A stats_mode=full run records its statistics time per table as the baseline;
+    off and cheap runs report the time saved against that baseline.
+    """
+    if not _STEP_TIMINGS:
+        return
+    build_s = sum(t['build_s'] for t in _STEP_TIMINGS.values())
+    stats_s = sum(t['stats_s'] for t in _STEP_TIMINGS.values())
+    queries = sum(t['stats_queries'] for t in _STEP_TIMINGS.values())
+    log_info(
+        f"Statistics ({get_stats_mode()}): {stats_s:.1f}s of {build_s:.1f}s build time "
+        f"across {queries} queries for {len(_STEP_TIMINGS)} tables{_format_stats_saved(list(_STEP_TIMINGS))}"
+    )
+    
+    if get_stats_mode() == 'full':
+        _record_full_stats_baseline(session)
+    elif not _FULL_STATS_BASELINE:
+        log_detail("  No stats_mode=full baseline recorded yet - run once with --stats-mode full to measure savings")
+
+
 def build_real_stock_prices(session: Session, test_mode: bool = False) -> None:
     """
     Build FACT_STOCK_PRICES from real STOCK_PRICE_TIMESERIES data.
@@ -183,6 +379,7 @@ def build_real_stock_prices(session: Session, test_mode: bool = False) -> None:
     stock_prices_table = config.REAL_DATA_SOURCES['tables']['stock_prices']['table']
     
     log_detail("Building FACT_STOCK_PRICES from real Nasdaq data...")
+    started = time.perf_counter()
     
     # Limit records in test mode
     limit_clause = "LIMIT 500000" if test_mode else ""
@@ -253,17 +450,13 @@ def build_real_stock_prices(session: Session, test_mode: bool = False) -> None:
             {limit_clause}
         """).collect()
         
-        count = session.sql(f"""
-            SELECT COUNT(*) as cnt FROM {database_name}.{schema_name}.FACT_STOCK_PRICES
-        """).collect()[0]['CNT']
-        
-        security_count = session.sql(f"""
-            SELECT COUNT(DISTINCT SecurityID) as cnt FROM {database_name}.{schema_name}.FACT_STOCK_PRICES
-        """).collect()[0]['CNT']
-        
-        log_detail(f" FACT_STOCK_PRICES: {count:,} records for {security_count} securities (REAL DATA)")
+        stats = _collect_table_stats(session, 'FACT_STOCK_PRICES', {
+            'securities': 'COUNT(DISTINCT SecurityID)'
+        })
+        log_detail(f" FACT_STOCK_PRICES: {_format_table_stats(stats)} (REAL DATA)")
+        _log_build_timing('FACT_STOCK_PRICES', started)
         
-        if count == 0:
+        if stats['count'] == 0:
             raise RuntimeError(
                 "FACT_STOCK_PRICES has no records - no matching securities found in real data source. "
                 "Check that DIM_SECURITY tickers match STOCK_PRICE_TIMESERIES."
@@ -275,40 +468,140 @@ def build_real_stock_prices(session: Session, test_mode: bool = False) -> None:
         raise RuntimeError(f"Error building FACT_STOCK_PRICES: {e}")
 
 
-def build_real_sec_filing_text(session: Session, test_mode: bool = False) -> None:
+# =============================================================================
+# INCREMENTAL SEC REFRESH (loaded-filings ledger + MERGE)
+# =============================================================================
+# In incremental mode each SEC table only loads filings (ADSH accession numbers)
+# not yet recorded for it in SEC_LOADED_FILINGS, and MERGEs them into the table.
+# Keying on ADSH rather than period end also picks up late and amended filings
+# (10-K/A etc.) for periods that are already loaded. The ledger is keyed by
+# IssuerID like the target tables, so run a full build after DEMO_COMPANIES
+# changes renumber DIM_ISSUER.
+
+SEC_LOADED_FILINGS_TABLE = 'SEC_LOADED_FILINGS'
+
+
+def _new_filing_predicate_sql(table_name: str, issuer_expr: str, adsh_expr: str) -> str:
+    """Predicate true for filings not yet recorded as loaded into table_name."""
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    return f"""NOT EXISTS (
+                SELECT 1 FROM {database_name}.{schema_name}.{SEC_LOADED_FILINGS_TABLE} lf
+                WHERE lf.TABLE_NAME = '{table_name}' AND lf.IssuerID = {issuer_expr} AND lf.ADSH = {adsh_expr}
+              )"""
+
+
+def _record_loaded_filings(session: Session, table_name: str, loaded_table: str) -> None:
     """
-    Build FACT_SEC_FILING_TEXT from real SEC_REPORT_TEXT_ATTRIBUTES data.
+    Record the (IssuerID, ADSH) filings present in loaded_table as loaded into table_name.
     
-    This provides real SEC filing text content (MD&A, Risk Factors, etc.) for companies
-    that have CIK linkage in our DIM_ISSUER. Includes enhanced metadata for searchability:
-    - COMPANY_NAME, TICKER for filtering by company
-    - FILING_TYPE (10-K, 10-Q, 8-K) derived from VARIABLE_NAME patterns
-    - FISCAL_YEAR, FISCAL_QUARTER for time-based filtering
-    - DOCUMENT_TITLE for human-readable search results
-    
-    Raises RuntimeError if real data source is not accessible.
+    loaded_table is the target table (after a full build, or before an incremental
+    load to create and seed the ledger for deployments built without it), or the
+    staging table of newly loaded rows after an incremental MERGE.
     """
-    verify_real_data_access(session)  # Raises on failure
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    ledger_table = f"{database_name}.{schema_name}.{SEC_LOADED_FILINGS_TABLE}"
+    
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {ledger_table} (
+            TABLE_NAME VARCHAR,
+            IssuerID NUMBER,
+            ADSH VARCHAR,
+            LOADED_AT TIMESTAMP_LTZ
+        )
+    """).collect()
     
+    session.sql(f"""
+        MERGE INTO {ledger_table} lf
+        USING (
+            SELECT DISTINCT IssuerID, ADSH
+            FROM {loaded_table}
+            WHERE ADSH IS NOT NULL
+        ) s
+        ON lf.TABLE_NAME = '{table_name}' AND lf.IssuerID = s.IssuerID AND lf.ADSH = s.ADSH
+        WHEN NOT MATCHED THEN INSERT (TABLE_NAME, IssuerID, ADSH, LOADED_AT)
+            VALUES ('{table_name}', s.IssuerID, s.ADSH, CURRENT_TIMESTAMP())
+    """).collect()
+
+
+def _merge_incremental_sec_table(session: Session, table_name: str, select_sql_for_offset,
+                                 key_columns: List[str], id_column: str, retention_predicate: str,
+                                 after_merge=None) -> int:
+    """
+    Stage filings not yet loaded into table_name and MERGE them into it.
+    
+    Args:
+        session: Active Snowpark session
+        table_name: Existing MARKET_DATA table to refresh
+        select_sql_for_offset: Callable(id_offset) -> SELECT producing new rows, with
+            surrogate IDs numbered from id_offset + 1
+        key_columns: Natural key used to skip rows already present (NULL-safe match)
+        id_column: Surrogate ID column (new IDs continue after the current maximum)
+        retention_predicate: Rows matching this are deleted so the table keeps the same
+            history window as a full rebuild
+        after_merge: Optional callable(session, target_table, stage_table) run after the
+            MERGE and retention delete, while the staged rows are still available
+    
+    Returns:
+        Number of rows inserted
+    """
     database_name = config.DATABASE['name']
     schema_name = config.DATABASE['schemas']['market_data']
+    target_table = f"{database_name}.{schema_name}.{table_name}"
+    stage_table = f"{database_name}.{schema_name}.{table_name}_INCREMENT"
+    
+    # Create and seed the ledger from the existing table before selecting new filings
+    _record_loaded_filings(session, table_name, target_table)
+    
+    id_offset = session.sql(f"SELECT COALESCE(MAX({id_column}), 0) as max_id FROM {target_table}").collect()[0]['MAX_ID']
+    
+    session.sql(f"""
+        CREATE OR REPLACE TEMPORARY TABLE {stage_table} AS
+        {select_sql_for_offset(id_offset)}
+    """).collect()
+    
+    try:
+        columns = session.table(stage_table).columns
+        on_clause = " AND ".join(f"EQUAL_NULL(t.{c}, s.{c})" for c in key_columns)
+        result = session.sql(f"""
+            MERGE INTO {target_table} t
+            USING {stage_table} s
+            ON {on_clause}
+            WHEN NOT MATCHED THEN INSERT ({', '.join(columns)})
+                VALUES ({', '.join(f's.{c}' for c in columns)})
+        """).collect()
+        inserted = result[0][0] if result else 0
+        
+        session.sql(f"DELETE FROM {target_table} WHERE {retention_predicate}").collect()
+        if after_merge:
+            after_merge(session, target_table, stage_table)
+        _record_loaded_filings(session, table_name, stage_table)
+    finally:
+        session.sql(f"DROP TABLE IF EXISTS {stage_table}").collect()
+    
+    log_detail(f"  {table_name}: merged {inserted:,} new rows (incremental)")
+    return inserted
+
+
+def _sec_filing_text_select_sql(limit_clause: str = "", incremental: bool = False, id_offset: int = 0) -> str:
+    """
+    Build the SELECT that produces FACT_SEC_FILING_TEXT rows.
+    
+    With incremental=True only filings not yet loaded into FACT_SEC_FILING_TEXT
+    are returned, with FILING_TEXT_ID numbered from id_offset + 1.
+    """
+    database_name = config.DATABASE['name']
     curated_schema = config.DATABASE['schemas']['curated']
     real_db = config.REAL_DATA_SOURCES['database']
     real_schema = config.REAL_DATA_SOURCES['schema']
     sec_filing_text_table = config.REAL_DATA_SOURCES['tables']['sec_filing_text']['table']
     
-    log_detail("Building FACT_SEC_FILING_TEXT from real SEC filing data...")
+    new_filing_filter = (
+        f"WHERE {_new_filing_predicate_sql('FACT_SEC_FILING_TEXT', 'oc.IssuerID', 'ft.ADSH')}" if incremental else ""
+    )
     
-    # Limit records in test mode
-    limit_clause = "LIMIT 50000" if test_mode else ""
-    
-    try:
-        # Create table with real SEC filing text linked to our companies via CIK
-        # Enhanced with FILING_TYPE, FISCAL_YEAR, FISCAL_QUARTER, DOCUMENT_TITLE
-        # Note: COMPANY_NAME, TICKER available via IssuerID -> DIM_ISSUER join
-        # Uses DIM_ISSUER directly (DIM_COMPANY has been eliminated)
-        session.sql(f"""
-            CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_FILING_TEXT AS
+    return f"""
             WITH our_companies AS (
                 -- Get companies from DIM_ISSUER with CIK
                 -- Note: COMPANY_NAME, TICKER available via IssuerID -> DIM_ISSUER join
@@ -354,7 +647,7 @@ def build_real_sec_filing_text(session: Session, test_mode: bool = False) -> Non
                   AND srta.PERIOD_END_DATE >= DATEADD(year, -3, CURRENT_DATE())
             )
             SELECT 
-                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, ft.PERIOD_END_DATE, ft.VARIABLE) as FILING_TEXT_ID,
+                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, ft.PERIOD_END_DATE, ft.VARIABLE) + {id_offset} as FILING_TEXT_ID,
                 oc.IssuerID,
                 ft.FILING_TYPE,
                 ft.FISCAL_YEAR,
@@ -379,20 +672,65 @@ def build_real_sec_filing_text(session: Session, test_mode: bool = False) -> Non
                 CURRENT_TIMESTAMP() as LOADED_AT
             FROM our_companies oc
             INNER JOIN filing_text ft ON oc.CIK = ft.CIK
+            {new_filing_filter}
             {limit_clause}
-        """).collect()
-        
-        count = session.sql(f"""
-            SELECT COUNT(*) as cnt FROM {database_name}.{schema_name}.FACT_SEC_FILING_TEXT
-        """).collect()[0]['CNT']
-        
-        issuer_count = session.sql(f"""
-            SELECT COUNT(DISTINCT IssuerID) as cnt FROM {database_name}.{schema_name}.FACT_SEC_FILING_TEXT
-        """).collect()[0]['CNT']
+        """
+
+
+def build_real_sec_filing_text(session: Session, test_mode: bool = False, incremental: bool = False) -> None:
+    """
+    Build FACT_SEC_FILING_TEXT from real SEC_REPORT_TEXT_ATTRIBUTES data.
+    
+    This provides real SEC filing text content (MD&A, Risk Factors, etc.) for companies
+    that have CIK linkage in our DIM_ISSUER. Includes enhanced metadata for searchability:
+    - COMPANY_NAME, TICKER for filtering by company
+    - FILING_TYPE (10-K, 10-Q, 8-K) derived from VARIABLE_NAME patterns
+    - FISCAL_YEAR, FISCAL_QUARTER for time-based filtering
+    - DOCUMENT_TITLE for human-readable search results
+    
+    With incremental=True and an existing table, only filings not loaded yet
+    are loaded and MERGEd (see _merge_incremental_sec_table).
+    
+    Raises RuntimeError if real data source is not accessible.
+    """
+    verify_real_data_access(session)  # Raises on failure
+    
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    
+    incremental = incremental and table_exists(session, database_name, schema_name, 'FACT_SEC_FILING_TEXT')
+    log_detail(f"Building FACT_SEC_FILING_TEXT from real SEC filing data ({'incremental' if incremental else 'full'})...")
+    started = time.perf_counter()
+    
+    # Limit records in test mode
+    limit_clause = "LIMIT 50000" if test_mode else ""
+    
+    try:
+        if incremental:
+            _merge_incremental_sec_table(
+                session, 'FACT_SEC_FILING_TEXT',
+                lambda id_offset: _sec_filing_text_select_sql(limit_clause, incremental=True, id_offset=id_offset),
+                key_columns=['IssuerID', 'SEC_DOCUMENT_ID', 'VARIABLE'],
+                id_column='FILING_TEXT_ID',
+                retention_predicate="PERIOD_END_DATE < DATEADD(year, -3, CURRENT_DATE())"
+            )
+        else:
+            # Create table with real SEC filing text linked to our companies via CIK
+            # Enhanced with FILING_TYPE, FISCAL_YEAR, FISCAL_QUARTER, DOCUMENT_TITLE
+            # Uses DIM_ISSUER directly (DIM_COMPANY has been eliminated)
+            session.sql(f"""
+                CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_FILING_TEXT AS
+                {_sec_filing_text_select_sql(limit_clause)}
+            """).collect()
+            _record_loaded_filings(session, 'FACT_SEC_FILING_TEXT', f"{database_name}.{schema_name}.FACT_SEC_FILING_TEXT")
         
-        log_detail(f" FACT_SEC_FILING_TEXT: {count:,} records for {issuer_count} issuers (REAL DATA)")
+        stats = _collect_table_stats(session, 'FACT_SEC_FILING_TEXT', {
+            'issuers': 'COUNT(DISTINCT IssuerID)'
+        })
+        log_detail(f" FACT_SEC_FILING_TEXT: {_format_table_stats(stats)} (REAL DATA)")
+        _log_build_timing('FACT_SEC_FILING_TEXT', started)
         
-        if count == 0:
+        if stats['count'] == 0:
             raise RuntimeError(
                 "FACT_SEC_FILING_TEXT has no records - no matching issuers with CIK found in real data source. "
                 "Check that DIM_ISSUER CIK values match SEC filing data."
@@ -404,20 +742,61 @@ def build_real_sec_filing_text(session: Session, test_mode: bool = False) -> Non
         raise RuntimeError(f"Error building FACT_SEC_FILING_TEXT: {e}")
 
 
-def build_real_sec_financials(session: Session, test_mode: bool = False) -> None:
+# XBRL tag pivot for FACT_SEC_FINANCIALS: (output column, source TAGs).
+# Many companies report STATEMENT=None, so metrics are identified by TAG name only.
+SEC_FINANCIALS_TAG_PIVOT = [
+    # Income Statement
+    ('REVENUE', ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'Revenue', 'SalesRevenueNet']),
+    ('NET_INCOME', ['NetIncomeLoss', 'ProfitLoss']),
+    ('GROSS_PROFIT', ['GrossProfit']),
+    ('OPERATING_INCOME', ['OperatingIncomeLoss', 'OperatingIncome']),
+    ('EPS_BASIC', ['EarningsPerShareBasic']),
+    ('EPS_DILUTED', ['EarningsPerShareDiluted']),
+    ('RD_EXPENSE', ['ResearchAndDevelopmentExpense']),
+    ('INTEREST_EXPENSE', ['InterestExpense']),
+    ('INCOME_TAX_EXPENSE', ['IncomeTaxExpenseBenefit']),
+    # Balance Sheet
+    ('TOTAL_ASSETS', ['Assets']),
+    ('TOTAL_LIABILITIES', ['Liabilities']),
+    ('TOTAL_EQUITY', ['StockholdersEquity', 'StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest', 'Equity']),
+    ('CASH_AND_EQUIVALENTS', ['CashAndCashEquivalentsAtCarryingValue']),
+    ('LONG_TERM_DEBT', ['LongTermDebt', 'LongTermDebtNoncurrent']),
+    ('GOODWILL', ['Goodwill']),
+    ('PP_AND_E', ['PropertyPlantAndEquipmentNet', 'PropertyPlantAndEquipment']),
+    ('CURRENT_ASSETS', ['AssetsCurrent']),
+    ('CURRENT_LIABILITIES', ['LiabilitiesCurrent']),
+    ('RETAINED_EARNINGS', ['RetainedEarningsAccumulatedDeficit']),
+    # Cash Flow
+    ('OPERATING_CASH_FLOW', ['NetCashProvidedByUsedInOperatingActivities']),
+    ('INVESTING_CASH_FLOW', ['NetCashProvidedByUsedInInvestingActivities']),
+    ('FINANCING_CASH_FLOW', ['NetCashProvidedByUsedInFinancingActivities']),
+    ('CAPEX', ['PaymentsToAcquirePropertyPlantAndEquipment']),
+    ('DEPRECIATION_AMORTIZATION', ['DepreciationDepletionAndAmortization', 'DepreciationAndAmortization']),
+    ('STOCK_BASED_COMP', ['ShareBasedCompensation'])
+]
+
+SEC_FINANCIALS_STRATEGIES = ('single_pass', 'legacy')
+
+
+def _sec_financials_select_sql(strategy: str, limit_clause: str = "", incremental: bool = False, id_offset: int = 0) -> str:
     """
-    Build FACT_SEC_FINANCIALS from real SEC_CORPORATE_REPORT_ATTRIBUTES data.
-    
-    This provides comprehensive financial statement data (Income Statement, Balance Sheet,
-    Cash Flow) with standardized metrics pivoted from XBRL tags.
-    
-    Source: SNOWFLAKE_PUBLIC_DATA_FREE.PUBLIC_DATA_FREE.SEC_CORPORATE_REPORT_ATTRIBUTES
-    - 569M records across 17,258 companies
-    - Full financial statements with XBRL tags
-    
-    Raises RuntimeError if real data source is not accessible.
+    Build the SELECT that produces FACT_SEC_FINANCIALS rows.
+    
+    Strategies (identical output columns and rows):
+    - single_pass: restricts SEC_CORPORATE_REPORT_ATTRIBUTES to demo CIKs and the
+      pivoted tags before aggregating, pivots once, and evaluates LAG once per row
+    - legacy: original query shape (filters all CIKs, joins demo issuers after the
+      pivot, evaluates LAG three times per row); kept for benchmarking
+    
+    With incremental=True (single_pass only) only filings not yet loaded into
+    FACT_SEC_FINANCIALS are returned, with FINANCIAL_ID numbered from id_offset + 1.
+    Prior revenue for the growth LAG is read from the existing table; existing rows
+    of the same CIKs are re-graded afterwards by _refresh_sec_financials_growth.
     """
-    verify_real_data_access(session)  # Raises on failure
+    if strategy not in SEC_FINANCIALS_STRATEGIES:
+        raise ValueError(f"Unknown SEC financials strategy '{strategy}' (expected one of {SEC_FINANCIALS_STRATEGIES})")
+    if incremental and strategy != 'single_pass':
+        raise ValueError("Incremental FACT_SEC_FINANCIALS refresh requires the single_pass strategy")
     
     database_name = config.DATABASE['name']
     schema_name = config.DATABASE['schemas']['market_data']
@@ -426,17 +805,94 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
     real_schema = config.REAL_DATA_SOURCES['schema']
     sec_financials_table = config.REAL_DATA_SOURCES['tables']['sec_corporate_financials']['table']
     
-    log_detail("Building FACT_SEC_FINANCIALS from real SEC XBRL data...")
-    
-    # Limit records in test mode
-    limit_clause = "LIMIT 500000" if test_mode else ""
+    all_tags = [tag for _, tags in SEC_FINANCIALS_TAG_PIVOT for tag in tags]
+    tag_list = ", ".join(f"'{tag}'" for tag in all_tags)
+    pivot_columns = ",\n".join(
+        f"                    MAX(CASE WHEN sd.TAG IN ({', '.join(repr(t) for t in tags)}) THEN sd.VALUE_NUM END) as {column}"
+        for column, tags in SEC_FINANCIALS_TAG_PIVOT
+    )
+    metric_columns = ",\n".join(f"                wg.{column}" for column, _ in SEC_FINANCIALS_TAG_PIVOT)
+    
+    new_filing_filter = (
+        f"AND {_new_filing_predicate_sql('FACT_SEC_FINANCIALS', 'oc.IssuerID', 'wg.ADSH')}" if incremental else ""
+    )
+    
+    if incremental:
+        cik_filter = "AND scra.CIK IN (SELECT CIK FROM our_companies)"
+        # LAG over new filings plus already-loaded periods, so each new filing
+        # still sees the previous period's revenue
+        growth_ctes = f"""revenue_history AS (
+                SELECT CIK, ADSH, PERIOD_END_DATE, PERIOD_START_DATE, COVERED_QTRS, FISCAL_YEAR, FISCAL_PERIOD, REVENUE, TRUE as IS_NEW
+                FROM pivoted_data
+                UNION ALL
+                SELECT CIK, ADSH, PERIOD_END_DATE, PERIOD_START_DATE, COVERED_QTRS, FISCAL_YEAR, FISCAL_PERIOD, REVENUE, FALSE as IS_NEW
+                FROM {database_name}.{schema_name}.FACT_SEC_FINANCIALS
+            ),
+            revenue_lag AS (
+                SELECT 
+                    rh.*,
+                    LAG(rh.REVENUE) OVER (PARTITION BY rh.CIK ORDER BY rh.FISCAL_YEAR, rh.FISCAL_PERIOD) as PREV_REVENUE
+                FROM revenue_history rh
+            ),
+            with_lag AS (
+                SELECT 
+                    pd.*,
+                    rl.PREV_REVENUE
+                FROM pivoted_data pd
+                INNER JOIN revenue_lag rl 
+                    ON rl.IS_NEW
+                   AND rl.CIK = pd.CIK
+                   AND rl.ADSH = pd.ADSH
+                   AND rl.PERIOD_END_DATE = pd.PERIOD_END_DATE
+                   AND EQUAL_NULL(rl.PERIOD_START_DATE, pd.PERIOD_START_DATE)
+                   AND EQUAL_NULL(rl.COVERED_QTRS, pd.COVERED_QTRS)
+            ),
+            with_growth AS (
+                SELECT 
+                    wl.*,
+                    CASE 
+                        WHEN wl.PREV_REVENUE > 0 
+                        THEN (wl.REVENUE - wl.PREV_REVENUE) / wl.PREV_REVENUE * 100
+                        ELSE NULL 
+                    END as REVENUE_GROWTH_PCT
+                FROM with_lag wl
+            )"""
+    elif strategy == 'single_pass':
+        # Semi-join to demo CIKs so only their rows reach the aggregate
+        cik_filter = "AND scra.CIK IN (SELECT CIK FROM our_companies)"
+        # Evaluate LAG once; every growth metric derives from PREV_REVENUE
+        growth_ctes = """with_lag AS (
+                SELECT 
+                    pd.*,
+                    LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) as PREV_REVENUE
+                FROM pivoted_data pd
+            ),
+            with_growth AS (
+                SELECT 
+                    wl.*,
+                    CASE 
+                        WHEN wl.PREV_REVENUE > 0 
+                        THEN (wl.REVENUE - wl.PREV_REVENUE) / wl.PREV_REVENUE * 100
+                        ELSE NULL 
+                    END as REVENUE_GROWTH_PCT
+                FROM with_lag wl
+            )"""
+    else:
+        cik_filter = ""
+        growth_ctes = """with_growth AS (
+                SELECT 
+                    pd.*,
+                    LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) as PREV_REVENUE,
+                    CASE 
+                        WHEN LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) > 0 
+                        THEN (pd.REVENUE - LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD)) 
+                             / LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) * 100
+                        ELSE NULL 
+                    END as REVENUE_GROWTH_PCT
+                FROM pivoted_data pd
+            )"""
     
-    try:
-        # Create table with real comprehensive financial data
-        # Pivot key XBRL tags into standardized columns
-        # Uses DIM_ISSUER directly (DIM_COMPANY has been eliminated)
-        session.sql(f"""
-            CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_FINANCIALS AS
+    return f"""
             WITH our_companies AS (
                 -- Get companies from DIM_ISSUER that have CIK
                 -- Note: SIC_DESCRIPTION used for TAM/customer count calculations, not persisted
@@ -448,7 +904,6 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
                 WHERE di.CIK IS NOT NULL
             ),
             -- Filter to relevant tags and recent data
-            -- Note: Many companies have STATEMENT=None, so we filter by TAG names instead
             sec_data AS (
                 SELECT 
                     scra.CIK,
@@ -463,41 +918,13 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
                     scra.UNIT
                 FROM {real_db}.{real_schema}.{sec_financials_table} scra
                 WHERE scra.CIK IS NOT NULL
+                  {cik_filter}
                   AND scra.PERIOD_END_DATE >= DATEADD(year, -5, CURRENT_DATE())
                   AND scra.VALUE IS NOT NULL
                   AND TRY_CAST(scra.VALUE AS FLOAT) IS NOT NULL
-                  -- Filter to key financial tags we're interested in
-                  AND scra.TAG IN (
-                      -- Income Statement tags
-                      'Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'Revenue', 'SalesRevenueNet',
-                      'NetIncomeLoss', 'ProfitLoss',
-                      'GrossProfit',
-                      'OperatingIncomeLoss', 'OperatingIncome',
-                      'EarningsPerShareBasic', 'EarningsPerShareDiluted',
-                      'ResearchAndDevelopmentExpense',
-                      'InterestExpense',
-                      'IncomeTaxExpenseBenefit',
-                      -- Balance Sheet tags
-                      'Assets',
-                      'Liabilities',
-                      'StockholdersEquity', 'StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest', 'Equity',
-                      'CashAndCashEquivalentsAtCarryingValue',
-                      'LongTermDebt', 'LongTermDebtNoncurrent',
-                      'Goodwill',
-                      'PropertyPlantAndEquipmentNet', 'PropertyPlantAndEquipment',
-                      'AssetsCurrent',
-                      'LiabilitiesCurrent',
-                      'RetainedEarningsAccumulatedDeficit',
-                      -- Cash Flow tags
-                      'NetCashProvidedByUsedInOperatingActivities',
-                      'NetCashProvidedByUsedInInvestingActivities',
-                      'NetCashProvidedByUsedInFinancingActivities',
-                      'PaymentsToAcquirePropertyPlantAndEquipment',
-                      'DepreciationDepletionAndAmortization', 'DepreciationAndAmortization',
-                      'ShareBasedCompensation'
-                  )
+                  AND scra.TAG IN ({tag_list})
             ),
-            -- Aggregate by company/period/statement to get one row per filing period
+            -- Aggregate by company/period to get one row per filing period
             pivoted_data AS (
                 SELECT 
                     sd.CIK,
@@ -514,81 +941,14 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
                     YEAR(sd.PERIOD_END_DATE) as FISCAL_YEAR,
                     -- Currency - use most common UNIT for this filing (normalized to uppercase)
                     MODE(UPPER(sd.UNIT)) as CURRENCY,
-                    
-                    -- Income Statement metrics (TAG-based, works with STATEMENT=None)
-                    MAX(CASE WHEN sd.TAG IN ('Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax', 'Revenue', 'SalesRevenueNet') 
-                             THEN sd.VALUE_NUM END) as REVENUE,
-                    MAX(CASE WHEN sd.TAG IN ('NetIncomeLoss', 'ProfitLoss') 
-                             THEN sd.VALUE_NUM END) as NET_INCOME,
-                    MAX(CASE WHEN sd.TAG = 'GrossProfit' 
-                             THEN sd.VALUE_NUM END) as GROSS_PROFIT,
-                    MAX(CASE WHEN sd.TAG IN ('OperatingIncomeLoss', 'OperatingIncome') 
-                             THEN sd.VALUE_NUM END) as OPERATING_INCOME,
-                    MAX(CASE WHEN sd.TAG = 'EarningsPerShareBasic' 
-                             THEN sd.VALUE_NUM END) as EPS_BASIC,
-                    MAX(CASE WHEN sd.TAG = 'EarningsPerShareDiluted' 
-                             THEN sd.VALUE_NUM END) as EPS_DILUTED,
-                    MAX(CASE WHEN sd.TAG = 'ResearchAndDevelopmentExpense' 
-                             THEN sd.VALUE_NUM END) as RD_EXPENSE,
-                    MAX(CASE WHEN sd.TAG = 'InterestExpense' 
-                             THEN sd.VALUE_NUM END) as INTEREST_EXPENSE,
-                    MAX(CASE WHEN sd.TAG = 'IncomeTaxExpenseBenefit' 
-                             THEN sd.VALUE_NUM END) as INCOME_TAX_EXPENSE,
-                    
-                    -- Balance Sheet metrics
-                    MAX(CASE WHEN sd.TAG = 'Assets' 
-                             THEN sd.VALUE_NUM END) as TOTAL_ASSETS,
-                    MAX(CASE WHEN sd.TAG = 'Liabilities' 
-                             THEN sd.VALUE_NUM END) as TOTAL_LIABILITIES,
-                    MAX(CASE WHEN sd.TAG IN ('StockholdersEquity', 'StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest', 'Equity') 
-                             THEN sd.VALUE_NUM END) as TOTAL_EQUITY,
-                    MAX(CASE WHEN sd.TAG = 'CashAndCashEquivalentsAtCarryingValue' 
-                             THEN sd.VALUE_NUM END) as CASH_AND_EQUIVALENTS,
-                    MAX(CASE WHEN sd.TAG IN ('LongTermDebt', 'LongTermDebtNoncurrent') 
-                             THEN sd.VALUE_NUM END) as LONG_TERM_DEBT,
-                    MAX(CASE WHEN sd.TAG = 'Goodwill' 
-                             THEN sd.VALUE_NUM END) as GOODWILL,
-                    MAX(CASE WHEN sd.TAG IN ('PropertyPlantAndEquipmentNet', 'PropertyPlantAndEquipment') 
-                             THEN sd.VALUE_NUM END) as PP_AND_E,
-                    MAX(CASE WHEN sd.TAG = 'AssetsCurrent' 
-                             THEN sd.VALUE_NUM END) as CURRENT_ASSETS,
-                    MAX(CASE WHEN sd.TAG = 'LiabilitiesCurrent' 
-                             THEN sd.VALUE_NUM END) as CURRENT_LIABILITIES,
-                    MAX(CASE WHEN sd.TAG = 'RetainedEarningsAccumulatedDeficit' 
-                             THEN sd.VALUE_NUM END) as RETAINED_EARNINGS,
-                    
-                    -- Cash Flow metrics
-                    MAX(CASE WHEN sd.TAG = 'NetCashProvidedByUsedInOperatingActivities' 
-                             THEN sd.VALUE_NUM END) as OPERATING_CASH_FLOW,
-                    MAX(CASE WHEN sd.TAG = 'NetCashProvidedByUsedInInvestingActivities' 
-                             THEN sd.VALUE_NUM END) as INVESTING_CASH_FLOW,
-                    MAX(CASE WHEN sd.TAG = 'NetCashProvidedByUsedInFinancingActivities' 
-                             THEN sd.VALUE_NUM END) as FINANCING_CASH_FLOW,
-                    MAX(CASE WHEN sd.TAG = 'PaymentsToAcquirePropertyPlantAndEquipment' 
-                             THEN sd.VALUE_NUM END) as CAPEX,
-                    MAX(CASE WHEN sd.TAG IN ('DepreciationDepletionAndAmortization', 'DepreciationAndAmortization') 
-                             THEN sd.VALUE_NUM END) as DEPRECIATION_AMORTIZATION,
-                    MAX(CASE WHEN sd.TAG = 'ShareBasedCompensation' 
-                             THEN sd.VALUE_NUM END) as STOCK_BASED_COMP
-                    
+{pivot_columns}
                 FROM sec_data sd
                 GROUP BY sd.CIK, sd.ADSH, sd.PERIOD_END_DATE, sd.PERIOD_START_DATE, sd.COVERED_QTRS
             ),
             -- Calculate YoY revenue growth for NRR estimation
-            with_growth AS (
-                SELECT 
-                    pd.*,
-                    LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) as PREV_REVENUE,
-                    CASE 
-                        WHEN LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) > 0 
-                        THEN (pd.REVENUE - LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD)) 
-                             / LAG(pd.REVENUE) OVER (PARTITION BY pd.CIK ORDER BY pd.FISCAL_YEAR, pd.FISCAL_PERIOD) * 100
-                        ELSE NULL 
-                    END as REVENUE_GROWTH_PCT
-                FROM pivoted_data pd
-            )
+            {growth_ctes}
             SELECT 
-                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, wg.FISCAL_YEAR DESC, wg.FISCAL_PERIOD) as FINANCIAL_ID,
+                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, wg.FISCAL_YEAR DESC, wg.FISCAL_PERIOD) + {id_offset} as FINANCIAL_ID,
                 oc.IssuerID,
                 wg.CIK,
                 wg.ADSH,
@@ -599,36 +959,8 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
                 wg.COVERED_QTRS,
                 wg.CURRENCY,
                 
-                -- Income Statement
-                wg.REVENUE,
-                wg.NET_INCOME,
-                wg.GROSS_PROFIT,
-                wg.OPERATING_INCOME,
-                wg.EPS_BASIC,
-                wg.EPS_DILUTED,
-                wg.RD_EXPENSE,
-                wg.INTEREST_EXPENSE,
-                wg.INCOME_TAX_EXPENSE,
-                
-                -- Balance Sheet
-                wg.TOTAL_ASSETS,
-                wg.TOTAL_LIABILITIES,
-                wg.TOTAL_EQUITY,
-                wg.CASH_AND_EQUIVALENTS,
-                wg.LONG_TERM_DEBT,
-                wg.GOODWILL,
-                wg.PP_AND_E,
-                wg.CURRENT_ASSETS,
-                wg.CURRENT_LIABILITIES,
-                wg.RETAINED_EARNINGS,
-                
-                -- Cash Flow
-                wg.OPERATING_CASH_FLOW,
-                wg.INVESTING_CASH_FLOW,
-                wg.FINANCING_CASH_FLOW,
-                wg.CAPEX,
-                wg.DEPRECIATION_AMORTIZATION,
-                wg.STOCK_BASED_COMP,
+                -- Income Statement, Balance Sheet, Cash Flow (SEC_FINANCIALS_TAG_PIVOT order)
+{metric_columns},
                 
                 -- Calculated metrics (existing)
                 COALESCE(wg.OPERATING_CASH_FLOW, 0) - ABS(COALESCE(wg.CAPEX, 0)) as FREE_CASH_FLOW,
@@ -675,26 +1007,110 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
                 CURRENT_TIMESTAMP() as LOADED_AT
             FROM our_companies oc
             INNER JOIN with_growth wg ON oc.CIK = wg.CIK
-            WHERE wg.REVENUE IS NOT NULL OR wg.TOTAL_ASSETS IS NOT NULL OR wg.OPERATING_CASH_FLOW IS NOT NULL
+            WHERE (wg.REVENUE IS NOT NULL OR wg.TOTAL_ASSETS IS NOT NULL OR wg.OPERATING_CASH_FLOW IS NOT NULL)
+            {new_filing_filter}
             {limit_clause}
-        """).collect()
-        
-        count = session.sql(f"""
-            SELECT COUNT(*) as cnt FROM {database_name}.{schema_name}.FACT_SEC_FINANCIALS
-        """).collect()[0]['CNT']
-        
-        issuer_count = session.sql(f"""
-            SELECT COUNT(DISTINCT IssuerID) as cnt FROM {database_name}.{schema_name}.FACT_SEC_FINANCIALS
-        """).collect()[0]['CNT']
-        
-        period_count = session.sql(f"""
-            SELECT COUNT(DISTINCT CONCAT(CIK, '-', FISCAL_YEAR, '-', FISCAL_PERIOD)) as cnt 
-            FROM {database_name}.{schema_name}.FACT_SEC_FINANCIALS
-        """).collect()[0]['CNT']
+        """
+
+
+def _refresh_sec_financials_growth(session: Session, target_table: str, stage_table: str) -> None:
+    """
+    Recompute revenue growth for every row of the CIKs that received new filings.
+    
+    Late and amended filings can land in any period, so rows loaded earlier for the
+    same CIK may have a different previous-period revenue once they are merged.
+    ESTIMATED_NRR_PCT is derived from the growth, so it is refreshed with it.
+    """
+    result = session.sql(f"""
+        UPDATE {target_table} t
+        SET REVENUE_GROWTH_PCT = g.REVENUE_GROWTH_PCT,
+            ESTIMATED_NRR_PCT = LEAST(140, GREATEST(90, 100 + COALESCE(g.REVENUE_GROWTH_PCT, 10)))
+        FROM (
+            SELECT 
+                wl.FINANCIAL_ID,
+                CASE 
+                    WHEN wl.PREV_REVENUE > 0 
+                    THEN (wl.REVENUE - wl.PREV_REVENUE) / wl.PREV_REVENUE * 100
+                    ELSE NULL 
+                END as REVENUE_GROWTH_PCT
+            FROM (
+                SELECT 
+                    f.FINANCIAL_ID,
+                    f.REVENUE,
+                    LAG(f.REVENUE) OVER (PARTITION BY f.CIK ORDER BY f.FISCAL_YEAR, f.FISCAL_PERIOD) as PREV_REVENUE
+                FROM {target_table} f
+                WHERE f.CIK IN (SELECT DISTINCT CIK FROM {stage_table})
+            ) wl
+        ) g
+        WHERE t.FINANCIAL_ID = g.FINANCIAL_ID
+          AND NOT EQUAL_NULL(t.REVENUE_GROWTH_PCT, g.REVENUE_GROWTH_PCT)
+    """).collect()
+    updated = result[0][0] if result else 0
+    if updated:
+        log_detail(f"  FACT_SEC_FINANCIALS: recomputed revenue growth for {updated:,} existing rows")
+
+
+def build_real_sec_financials(session: Session, test_mode: bool = False, strategy: str = 'single_pass',
+                              incremental: bool = False) -> None:
+    """
+    Build FACT_SEC_FINANCIALS from real SEC_CORPORATE_REPORT_ATTRIBUTES data.
+    
+    This provides comprehensive financial statement data (Income Statement, Balance Sheet,
+    Cash Flow) with standardized metrics pivoted from XBRL tags.
+    
+    Source: SNOWFLAKE_PUBLIC_DATA_FREE.PUBLIC_DATA_FREE.SEC_CORPORATE_REPORT_ATTRIBUTES
+    - 569M records across 17,258 companies
+    - Full financial statements with XBRL tags
+    
+    Args:
+        session: Active Snowpark session
+        test_mode: Limit output rows for faster builds
+        strategy: Query shape from SEC_FINANCIALS_STRATEGIES (see _sec_financials_select_sql)
+        incremental: If the table exists, MERGE only filings not loaded yet
+    
+    Raises RuntimeError if real data source is not accessible.
+    """
+    verify_real_data_access(session)  # Raises on failure
+    
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    
+    incremental = incremental and table_exists(session, database_name, schema_name, 'FACT_SEC_FINANCIALS')
+    mode = 'incremental' if incremental else strategy
+    log_detail(f"Building FACT_SEC_FINANCIALS from real SEC XBRL data ({mode})...")
+    started = time.perf_counter()
+    
+    # Limit records in test mode
+    limit_clause = "LIMIT 500000" if test_mode else ""
+    
+    try:
+        if incremental:
+            _merge_incremental_sec_table(
+                session, 'FACT_SEC_FINANCIALS',
+                lambda id_offset: _sec_financials_select_sql('single_pass', limit_clause, incremental=True, id_offset=id_offset),
+                key_columns=['IssuerID', 'ADSH', 'PERIOD_END_DATE', 'PERIOD_START_DATE', 'COVERED_QTRS'],
+                id_column='FINANCIAL_ID',
+                retention_predicate="PERIOD_END_DATE < DATEADD(year, -5, CURRENT_DATE())",
+                after_merge=_refresh_sec_financials_growth
+            )
+        else:
+            # Create table with real comprehensive financial data
+            # Pivot key XBRL tags into standardized columns
+            # Uses DIM_ISSUER directly (DIM_COMPANY has been eliminated)
+            session.sql(f"""
+                CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_FINANCIALS AS
+                {_sec_financials_select_sql(strategy, limit_clause)}
+            """).collect()
+            _record_loaded_filings(session, 'FACT_SEC_FINANCIALS', f"{database_name}.{schema_name}.FACT_SEC_FINANCIALS")
         
-        log_detail(f" FACT_SEC_FINANCIALS: {count:,} records for {issuer_count} issuers, {period_count} fiscal periods (REAL DATA)")
+        stats = _collect_table_stats(session, 'FACT_SEC_FINANCIALS', {
+            'issuers': 'COUNT(DISTINCT IssuerID)',
+            'fiscal periods': "COUNT(DISTINCT CONCAT(CIK, '-', FISCAL_YEAR, '-', FISCAL_PERIOD))"
+        })
+        log_detail(f" FACT_SEC_FINANCIALS: {_format_table_stats(stats)} (REAL DATA)")
+        _log_build_timing('FACT_SEC_FINANCIALS', started)
         
-        if count == 0:
+        if stats['count'] == 0:
             raise RuntimeError(
                 "FACT_SEC_FINANCIALS has no records - no matching issuers with CIK found in real data source. "
                 "Check that DIM_ISSUER CIK values match SEC financial data."
@@ -706,40 +1122,72 @@ def build_real_sec_financials(session: Session, test_mode: bool = False) -> None
         raise RuntimeError(f"Error building FACT_SEC_FINANCIALS: {e}")
 
 
-def build_sec_segments(session: Session, test_mode: bool = False) -> None:
+def benchmark_sec_financials_build(session: Session, test_mode: bool = False) -> dict:
     """
-    Build FACT_SEC_SEGMENTS from SEC_METRICS_TIMESERIES.
+    Benchmark the FACT_SEC_FINANCIALS query strategies on the current warehouse.
     
-    This provides revenue segment breakdowns by:
-    - Geography (GEO_NAME): Europe, Americas, Asia Pacific, etc.
-    - Business Segment (BUSINESS_SEGMENT): Products, services, brands
-    - Business Subsegment (BUSINESS_SUBSEGMENT): Hierarchical sub-segments
-    - Customer (CUSTOMER): Major customer breakdowns
-    - Legal Entity (LEGAL_ENTITY): Subsidiary breakdowns
+    Each strategy is materialized into a scratch transient table and profiled via
+    query history (bytes scanned, partitions, elapsed time), then dropped.
     
-    Source: SNOWFLAKE_PUBLIC_DATA_FREE.PUBLIC_DATA_FREE.SEC_METRICS_TIMESERIES
-    - Pre-parsed revenue segments with standardized columns
-    - Focuses on revenue data only (not full financial statements)
-    
-    Join key: COMPANY_ID matches DIM_ISSUER.ProviderCompanyID
-    
-    Raises RuntimeError if real data source is not accessible.
+    Returns:
+        Dict of strategy -> run_profiled_query() statistics
     """
     verify_real_data_access(session)
     
     database_name = config.DATABASE['name']
     schema_name = config.DATABASE['schemas']['market_data']
+    limit_clause = "LIMIT 500000" if test_mode else ""
+    
+    log_step("Benchmarking FACT_SEC_FINANCIALS build strategies")
+    results = {}
+    for strategy in SEC_FINANCIALS_STRATEGIES:
+        scratch_table = f"{database_name}.{schema_name}.FACT_SEC_FINANCIALS_BENCH_{strategy.upper()}"
+        try:
+            results[strategy] = run_profiled_query(session, f"""
+                CREATE OR REPLACE TRANSIENT TABLE {scratch_table} AS
+                {_sec_financials_select_sql(strategy, limit_clause)}
+            """)
+        finally:
+            session.sql(f"DROP TABLE IF EXISTS {scratch_table}").collect()
+        
+        stats = results[strategy]
+        log_info(
+            f"{strategy}: {stats.get('total_elapsed_ms', 0) / 1000:.1f}s elapsed, "
+            f"{stats.get('bytes_scanned', 0) / 1024**3:.2f} GB scanned, "
+            f"{stats.get('partitions_scanned', 0):,}/{stats.get('partitions_total', 0):,} partitions "
+            f"(warehouse {stats.get('warehouse_size')})"
+        )
+    
+    single, legacy = results.get('single_pass', {}), results.get('legacy', {})
+    if single.get('total_elapsed_ms') and legacy.get('total_elapsed_ms'):
+        log_info(
+            f"single_pass vs legacy: {legacy['total_elapsed_ms'] / single['total_elapsed_ms']:.2f}x faster, "
+            f"{(legacy['bytes_scanned'] - single['bytes_scanned']) / 1024**3:.2f} GB less scanned"
+        )
+    # Both strategies must produce the same rows
+    if single.get('rows_produced') is not None and single.get('rows_produced') != legacy.get('rows_produced'):
+        log_warning(f"Strategies produced different row counts: {single.get('rows_produced')} vs {legacy.get('rows_produced')}")
+    
+    return results
+
+
+def _sec_segments_select_sql(limit_clause: str = "", incremental: bool = False, id_offset: int = 0) -> str:
+    """
+    Build the SELECT that produces FACT_SEC_SEGMENTS rows.
+    
+    With incremental=True only filings not yet loaded into FACT_SEC_SEGMENTS
+    are returned, with SEGMENT_ID numbered from id_offset + 1.
+    """
+    database_name = config.DATABASE['name']
     curated_schema = config.DATABASE['schemas']['curated']
     real_db = config.REAL_DATA_SOURCES['database']
     real_schema = config.REAL_DATA_SOURCES['schema']
     
-    log_detail("Building FACT_SEC_SEGMENTS from SEC_METRICS_TIMESERIES...")
-    
-    limit_clause = "LIMIT 100000" if test_mode else ""
+    new_filing_filter = (
+        f"AND {_new_filing_predicate_sql('FACT_SEC_SEGMENTS', 'oc.IssuerID', 'smt.ADSH')}" if incremental else ""
+    )
     
-    try:
-        session.sql(f"""
-            CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_SEGMENTS AS
+    return f"""
             WITH our_companies AS (
                 -- Get all demo companies via ProviderCompanyID
                 -- Note: COMPANY_NAME available via IssuerID -> DIM_ISSUER join
@@ -750,7 +1198,7 @@ def build_sec_segments(session: Session, test_mode: bool = False) -> None:
                 WHERE di.ProviderCompanyID IS NOT NULL
             )
             SELECT 
-                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, smt.FISCAL_YEAR DESC, smt.PERIOD_END_DATE DESC) as SEGMENT_ID,
+                ROW_NUMBER() OVER (ORDER BY oc.IssuerID, smt.FISCAL_YEAR DESC, smt.PERIOD_END_DATE DESC) + {id_offset} as SEGMENT_ID,
                 oc.IssuerID,
                 smt.ADSH,
                 
@@ -785,18 +1233,70 @@ def build_sec_segments(session: Session, test_mode: bool = False) -> None:
             INNER JOIN our_companies oc ON smt.COMPANY_ID = oc.ProviderCompanyID
             WHERE smt.VALUE IS NOT NULL
               AND smt.FISCAL_YEAR >= YEAR(CURRENT_DATE()) - 5
+              {new_filing_filter}
             {limit_clause}
-        """).collect()
-        
-        # Get stats
-        count = session.sql(f"SELECT COUNT(*) as cnt FROM {database_name}.{schema_name}.FACT_SEC_SEGMENTS").collect()[0]['CNT']
-        issuer_count = session.sql(f"SELECT COUNT(DISTINCT IssuerID) as cnt FROM {database_name}.{schema_name}.FACT_SEC_SEGMENTS").collect()[0]['CNT']
-        geo_count = session.sql(f"SELECT COUNT(DISTINCT GEOGRAPHY) as cnt FROM {database_name}.{schema_name}.FACT_SEC_SEGMENTS WHERE GEOGRAPHY IS NOT NULL").collect()[0]['CNT']
-        segment_count = session.sql(f"SELECT COUNT(DISTINCT BUSINESS_SEGMENT) as cnt FROM {database_name}.{schema_name}.FACT_SEC_SEGMENTS WHERE BUSINESS_SEGMENT IS NOT NULL").collect()[0]['CNT']
+        """
+
+
+def build_sec_segments(session: Session, test_mode: bool = False, incremental: bool = False) -> None:
+    """
+    Build FACT_SEC_SEGMENTS from SEC_METRICS_TIMESERIES.
+    
+    This provides revenue segment breakdowns by:
+    - Geography (GEO_NAME): Europe, Americas, Asia Pacific, etc.
+    - Business Segment (BUSINESS_SEGMENT): Products, services, brands
+    - Business Subsegment (BUSINESS_SUBSEGMENT): Hierarchical sub-segments
+    - Customer (CUSTOMER): Major customer breakdowns
+    - Legal Entity (LEGAL_ENTITY): Subsidiary breakdowns
+    
+    Source: SNOWFLAKE_PUBLIC_DATA_FREE.PUBLIC_DATA_FREE.SEC_METRICS_TIMESERIES
+    - Pre-parsed revenue segments with standardized columns
+    - Focuses on revenue data only (not full financial statements)
+    
+    Join key: COMPANY_ID matches DIM_ISSUER.ProviderCompanyID
+    
+    With incremental=True and an existing table, only filings not loaded yet
+    are loaded and MERGEd (see _merge_incremental_sec_table).
+    
+    Raises RuntimeError if real data source is not accessible.
+    """
+    verify_real_data_access(session)
+    
+    database_name = config.DATABASE['name']
+    schema_name = config.DATABASE['schemas']['market_data']
+    
+    incremental = incremental and table_exists(session, database_name, schema_name, 'FACT_SEC_SEGMENTS')
+    log_detail(f"Building FACT_SEC_SEGMENTS from SEC_METRICS_TIMESERIES ({'incremental' if incremental else 'full'})...")
+    started = time.perf_counter()
+    
+    limit_clause = "LIMIT 100000" if test_mode else ""
+    
+    try:
+        if incremental:
+            _merge_incremental_sec_table(
+                session, 'FACT_SEC_SEGMENTS',
+                lambda id_offset: _sec_segments_select_sql(limit_clause, incremental=True, id_offset=id_offset),
+                key_columns=['IssuerID', 'ADSH', 'VARIABLE_NAME', 'PERIOD_START_DATE', 'PERIOD_END_DATE'],
+                id_column='SEGMENT_ID',
+                retention_predicate="FISCAL_YEAR < YEAR(CURRENT_DATE()) - 5"
+            )
+        else:
+            session.sql(f"""
+                CREATE OR REPLACE TABLE {database_name}.{schema_name}.FACT_SEC_SEGMENTS AS
+                {_sec_segments_select_sql(limit_clause)}
+            """).collect()
+            _record_loaded_filings(session, 'FACT_SEC_SEGMENTS', f"{database_name}.{schema_name}.FACT_SEC_SEGMENTS")
         
-        log_detail(f"  FACT_SEC_SEGMENTS: {count:,} records, {issuer_count} issuers, {geo_count} geographies, {segment_count} business segments (REAL DATA)")
+        # Get stats (COUNT(DISTINCT) ignores NULL geographies/segments)
+        stats = _collect_table_stats(session, 'FACT_SEC_SEGMENTS', {
+            'issuers': 'COUNT(DISTINCT IssuerID)',
+            'geographies': 'COUNT(DISTINCT GEOGRAPHY)',
+            'business segments': 'COUNT(DISTINCT BUSINESS_SEGMENT)'
+        })
+        log_detail(f"  FACT_SEC_SEGMENTS: {_format_table_stats(stats)} (REAL DATA)")
+        _log_build_timing('FACT_SEC_SEGMENTS', started)
         
-        if count == 0:
+        if stats['count'] == 0:
             log_warning("  FACT_SEC_SEGMENTS has no records - check if demo companies have segment data in SEC_METRICS_TIMESERIES")
         
     except RuntimeError:
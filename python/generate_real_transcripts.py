@@ -35,7 +35,7 @@ from logging_utils import log_step, log_substep, log_detail, log_warning, log_er
 from db_helpers import verify_table_access
 
 
-def build_all(session: Session, test_mode: bool = False):
+def build_all(session: Session, test_mode: bool = False, incremental: bool = False):
     """
     Main entry point for real transcript processing.
     
@@ -47,19 +47,20 @@ def build_all(session: Session, test_mode: bool = False):
     Args:
         session: Active Snowpark session
         test_mode: If True, limit processing for faster testing
+        incremental: If True, only process transcripts not yet in the corpus
     """
     log_substep("Real company event transcripts")
     
     # Step 1: Build speaker mapping (expensive, cached)
-    build_speaker_mapping(session, test_mode)
+    build_speaker_mapping(session, test_mode, incremental)
     
     # Step 2: Build chunked transcripts corpus
-    build_company_events_corpus(session, test_mode)
+    build_company_events_corpus(session, test_mode, incremental)
     
     log_phase_complete("Real transcripts processed")
 
 
-def build_speaker_mapping(session: Session, test_mode: bool = False):
+def build_speaker_mapping(session: Session, test_mode: bool = False, incremental: bool = False):
     """
     Create speaker mapping table using AI_COMPLETE to identify speakers.
     
@@ -75,7 +76,11 @@ def build_speaker_mapping(session: Session, test_mode: bool = False):
     - For Earnings Calls, prefers SPEAKERS_ANNOTATED over RAW to avoid duplicates
     
     This is an expensive operation that uses LLM calls, so results are cached.
-    The table is only rebuilt if it doesn't exist or is empty.
+    The table is only rebuilt if it doesn't exist or is empty. With incremental=True
+    an existing mapping is extended with transcripts not processed yet, and speakers
+    of transcripts that aged out of YEARS_OF_HISTORY are removed. Processed transcripts
+    are recorded in COMP_EVENT_SPEAKER_MAPPING_PROCESSED (including those for which
+    AI_COMPLETE found no speakers), so no transcript is sent to AI_COMPLETE twice.
     
     NOTE: This is stored in RAW schema as it's an intermediate working table,
     not a final output used in agent responses.
@@ -88,31 +93,49 @@ def build_speaker_mapping(session: Session, test_mode: bool = False):
     source_table = config.REAL_DATA_SOURCES['tables']['company_event_transcripts']['table']
     
     table_path = f"{database_name}.{raw_schema}.COMP_EVENT_SPEAKER_MAPPING"
+    processed_table = f"{database_name}.{raw_schema}.COMP_EVENT_SPEAKER_MAPPING_PROCESSED"
+    candidates_table = f"{database_name}.{raw_schema}.COMP_EVENT_SPEAKER_CANDIDATES"
     dim_issuer_table = f"{database_name}.{curated_schema}.DIM_ISSUER"
     years_of_history = config.YEARS_OF_HISTORY
     
     # Check if speaker mapping already exists with data (caching)
+    extend_existing = False
     try:
         count_result = session.sql(f"SELECT COUNT(*) as cnt FROM {table_path}").collect()
         existing_count = count_result[0]['CNT']
         if existing_count > 0:
-            log_detail(f"Speaker mapping exists ({existing_count:,} records), skipping AI_COMPLETE extraction...")
-            return
+            if not incremental:
+                log_detail(f"Speaker mapping exists ({existing_count:,} records), skipping AI_COMPLETE extraction...")
+                return
+            extend_existing = True
     except Exception:
         # Table doesn't exist, proceed with creation
         pass
     
-    log_detail("Building speaker mapping with AI_COMPLETE (this may take several minutes)...")
-    
-    # Limit for test mode
-    limit_clause = "LIMIT 50" if test_mode else ""
-    
-    # Create speaker mapping using AI_COMPLETE
+    if extend_existing:
+        log_detail("Extending speaker mapping with AI_COMPLETE for unmapped transcripts...")
+    else:
+        log_detail("Building speaker mapping with AI_COMPLETE (this may take several minutes)...")
+    
+    # Limit for test mode (transcripts sent to AI_COMPLETE)
+    limit_clause = "LIMIT 10" if test_mode else ""
+    
+    # Incremental: skip transcripts already sent to AI_COMPLETE
+    unprocessed_filter = f"""
+      AND NOT EXISTS (
+          SELECT 1 FROM {processed_table} p
+          WHERE p.company_id = t.company_id
+            AND p.event_type = t.event_type
+            AND p.EVENT_TIMESTAMP = t.EVENT_TIMESTAMP
+            AND COALESCE(p.transcript_type, '') = COALESCE(IFF(t.transcript_type = 'None', NULL, t.transcript_type), '')
+      )""" if extend_existing else ""
+    
+    # Stage the transcripts to process, so exactly these are recorded as processed
     # Join directly to DIM_ISSUER on PROVIDER_COMPANY_ID for company matching
     # Filter by date and transcript type to reduce volume and avoid duplicates
-    speaker_mapping_sql = f"""
-    CREATE OR REPLACE TABLE {table_path} AS
-    -- Sanitize 'None' strings to NULL for fiscal fields (prevents numeric conversion errors)
+    # Sanitize 'None' strings to NULL for fiscal fields (prevents numeric conversion errors)
+    candidates_sql = f"""
+    CREATE OR REPLACE TEMPORARY TABLE {candidates_table} AS
     SELECT 
         t.company_id,
         t.cik,
@@ -123,12 +146,36 @@ def build_speaker_mapping(session: Session, test_mode: bool = False):
         IFF(t.fiscal_period = 'None', NULL, t.fiscal_period) AS fiscal_period,
         IFF(t.fiscal_year = 'None', NULL, t.fiscal_year) AS fiscal_year,
         IFF(t.transcript_type = 'None', NULL, t.transcript_type) AS transcript_type,
+        t.transcript
+    FROM {source_db}.{source_schema}.{source_table} AS t
+    INNER JOIN {dim_issuer_table} i ON t.COMPANY_ID = i.PROVIDERCOMPANYID
+    WHERE t.EVENT_TIMESTAMP >= DATEADD('year', -{years_of_history}, CURRENT_DATE())
+      AND ((t.EVENT_TYPE = 'Earnings Call' AND t.TRANSCRIPT_TYPE = 'SPEAKERS_ANNOTATED') 
+           OR t.EVENT_TYPE != 'Earnings Call')
+      AND (LENGTH(ARRAY_TO_STRING(t.transcript:paragraphs, '\\n')) / 4)::INTEGER <= 199990
+      {unprocessed_filter}
+    {limit_clause}
+    """
+    
+    # Create speaker mapping using AI_COMPLETE
+    target_clause = f"INSERT INTO {table_path}" if extend_existing else f"CREATE OR REPLACE TABLE {table_path} AS"
+    speaker_mapping_sql = f"""
+    {target_clause}
+    SELECT 
+        t.company_id,
+        t.cik,
+        t.company_name,
+        t.primary_ticker,
+        t.event_type,
+        t.EVENT_TIMESTAMP,
+        t.fiscal_period,
+        t.fiscal_year,
+        t.transcript_type,
         f.value:speaker_id::STRING AS SPEAKER_ID,
         f.value:speaker_name::STRING AS SPEAKER_NAME,
         f.value:speaker_role::STRING AS SPEAKER_ROLE,
         f.value:speaker_company::STRING AS SPEAKER_COMPANY
-    FROM {source_db}.{source_schema}.{source_table} AS t
-    INNER JOIN {dim_issuer_table} i ON t.COMPANY_ID = i.PROVIDERCOMPANYID,
+    FROM {candidates_table} AS t,
     LATERAL FLATTEN(
         input => AI_COMPLETE(
             model => '{config.AI_SPEAKER_IDENTIFICATION_MODEL}',
@@ -170,16 +217,38 @@ def build_speaker_mapping(session: Session, test_mode: bool = False):
                 }}
         ):speakers
     ) f
-    WHERE t.EVENT_TIMESTAMP >= DATEADD('year', -{years_of_history}, CURRENT_DATE())
-      AND ((t.EVENT_TYPE = 'Earnings Call' AND t.TRANSCRIPT_TYPE = 'SPEAKERS_ANNOTATED') 
-           OR t.EVENT_TYPE != 'Earnings Call')
-      AND (LENGTH(ARRAY_TO_STRING(t.transcript:paragraphs, '\\n')) / 4)::INTEGER <= 199990
-    {limit_clause}
+    """
+    
+    # Processed-transcript keys (one row per transcript, whether or not speakers were found)
+    processed_keys_sql = f"""
+    SELECT DISTINCT company_id, event_type, EVENT_TIMESTAMP, transcript_type, CURRENT_TIMESTAMP() AS PROCESSED_AT
+    FROM {candidates_table}
     """
     
     try:
+        if extend_existing:
+            # Mappings built before the processed table existed: seed it from mapped transcripts
+            session.sql(f"""
+                CREATE TABLE IF NOT EXISTS {processed_table} AS
+                SELECT DISTINCT company_id, event_type, EVENT_TIMESTAMP, transcript_type, CURRENT_TIMESTAMP() AS PROCESSED_AT
+                FROM {table_path}
+            """).collect()
+            
+            # Same history window as a full rebuild
+            for table in (table_path, processed_table):
+                session.sql(f"""
+                    DELETE FROM {table}
+                    WHERE EVENT_TIMESTAMP < DATEADD('year', -{years_of_history}, CURRENT_DATE())
+                """).collect()
+        
+        session.sql(candidates_sql).collect()
         session.sql(speaker_mapping_sql).collect()
         
+        if extend_existing:
+            session.sql(f"INSERT INTO {processed_table} {processed_keys_sql}").collect()
+        else:
+            session.sql(f"CREATE OR REPLACE TABLE {processed_table} AS {processed_keys_sql}").collect()
+        
         # Get count for logging
         count_result = session.sql(f"SELECT COUNT(*) as cnt FROM {table_path}").collect()
         speaker_count = count_result[0]['CNT']
@@ -188,9 +257,164 @@ def build_speaker_mapping(session: Session, test_mode: bool = False):
     except Exception as e:
         log_error(f"Failed to create speaker mapping: {e}")
         raise
+    finally:
+        session.sql(f"DROP TABLE IF EXISTS {candidates_table}").collect()
+
+
+# Token limit for segments (490 tokens, leaving ~22 tokens for metadata header)
+SEGMENT_TOKEN_LIMIT = 490
+
+
+def _segment_key_sql(text_expression: str, token_limit: int = SEGMENT_TOKEN_LIMIT) -> str:
+    """SQL for the segment cache key: MD5 of embedding model, token limit and segment text."""
+    return f"MD5(CONCAT('{config.AI_EMBEDDING_MODEL}', '|', '{token_limit}', '|', {text_expression}))"
+
+
+def _transcript_id_sql(cik: str, event_timestamp: str, transcript_type: str) -> str:
+    """SQL for the stable TRANSCRIPT_ID of a transcript (groups all of its chunks)."""
+    return f"MD5(CONCAT({cik}, {event_timestamp}::VARCHAR, COALESCE({transcript_type}, '')))"
+
+
+def _stage_transcript_segments(session: Session, stage_table: str, test_mode: bool = False,
+                               exclude_corpus_table: str = None):
+    """
+    Flatten transcript speaker segments for demo issuers into a temporary stage table.
+    
+    - Joins to DIM_ISSUER on PROVIDER_COMPANY_ID for company matching
+    - Filters by YEARS_OF_HISTORY and transcript_type (prefer SPEAKERS_ANNOTATED for Earnings Calls)
+    - Adds SEGMENT_KEY (see _segment_key_sql) for the token/chunk cache
+    - If exclude_corpus_table is given, skips transcripts whose TRANSCRIPT_ID is already in it
+    
+    Staging once lets the cache refresh and the corpus build see identical segments.
+    """
+    database_name = config.DATABASE['name']
+    curated_schema = config.DATABASE['schemas']['curated']
+    source_db = config.REAL_DATA_SOURCES['database']
+    source_schema = config.REAL_DATA_SOURCES['schema']
+    source_table = config.REAL_DATA_SOURCES['tables']['company_event_transcripts']['table']
+    
+    dim_security_table = f"{database_name}.{curated_schema}.DIM_SECURITY"
+    dim_issuer_table = f"{database_name}.{curated_schema}.DIM_ISSUER"
+    years_of_history = config.YEARS_OF_HISTORY
+    
+    # Limit for test mode  
+    limit_clause = "LIMIT 100" if test_mode else ""
+    
+    # Same expression as the corpus TRANSCRIPT_ID
+    existing_filter = f"""
+      AND NOT EXISTS (
+          SELECT 1 FROM {exclude_corpus_table} c
+          WHERE c.TRANSCRIPT_ID = {_transcript_id_sql('t.cik', 't.EVENT_TIMESTAMP', "IFF(t.transcript_type = 'None', NULL, t.transcript_type)")}
+      )""" if exclude_corpus_table else ""
+    
+    session.sql(f"""
+    CREATE OR REPLACE TEMPORARY TABLE {stage_table} AS
+    SELECT 
+        t.company_id,
+        t.cik,
+        t.company_name,
+        t.primary_ticker,
+        t.event_type,
+        t.EVENT_TIMESTAMP,
+        IFF(t.fiscal_period = 'None', NULL, t.fiscal_period) AS fiscal_period,
+        IFF(t.fiscal_year = 'None', NULL, t.fiscal_year) AS fiscal_year,
+        IFF(t.transcript_type = 'None', NULL, t.transcript_type) AS transcript_type,
+        a.index AS speaker_order,
+        CONCAT('SPEAKER_', a.value:speaker::text) AS speaker_id,
+        a.value:text::text AS segment_text,
+        {_segment_key_sql('a.value:text::text')} AS segment_key,
+        i.IssuerID,
+        s.SecurityID,
+        s.Ticker AS matched_ticker
+    FROM {source_db}.{source_schema}.{source_table} AS t
+    INNER JOIN {dim_issuer_table} i ON t.COMPANY_ID = i.PROVIDERCOMPANYID
+    INNER JOIN {dim_security_table} s ON i.IssuerID = s.IssuerID AND s.AssetClass = 'Equity',
+    LATERAL FLATTEN(input => t.TRANSCRIPT:paragraphs) a
+    WHERE t.EVENT_TIMESTAMP >= DATEADD('year', -{years_of_history}, CURRENT_DATE())
+      AND ((t.EVENT_TYPE = 'Earnings Call' AND t.TRANSCRIPT_TYPE = 'SPEAKERS_ANNOTATED') 
+           OR t.EVENT_TYPE != 'Earnings Call')
+      {existing_filter}
+    {limit_clause}
+    """).collect()
 
 
-def build_company_events_corpus(session: Session, test_mode: bool = False):
+def refresh_segment_chunk_cache(session: Session, segments_table: str, token_limit: int = SEGMENT_TOKEN_LIMIT) -> dict:
+    """
+    Add token counts and chunk boundaries for segments not yet in the cache.
+    
+    Creates/extends SAM_DEMO.RAW.COMP_EVENT_SEGMENT_CHUNK_CACHE keyed by SEGMENT_KEY
+    (MD5 of embedding model, token limit and segment text):
+    - TOKEN_COUNT: AI_COUNT_TOKENS result for the segment
+    - CHUNKS: SPLIT_TEXT_RECURSIVE_CHARACTER output for segments over token_limit (NULL otherwise)
+    
+    Only new or edited segments pay for AI_COUNT_TOKENS and re-chunking; token counts
+    for unchanged text never change.
+    
+    NOTE: Stored in RAW schema as an intermediate working table (like the speaker mapping).
+    
+    Returns:
+        Dict with 'segments' (distinct keys in segments_table) and 'computed' (cache misses)
+    """
+    database_name = config.DATABASE['name']
+    raw_schema = config.DATABASE['schemas']['raw']
+    cache_table = f"{database_name}.{raw_schema}.COMP_EVENT_SEGMENT_CHUNK_CACHE"
+    
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {cache_table} (
+            SEGMENT_KEY VARCHAR,
+            EMBEDDING_MODEL VARCHAR,
+            TOKEN_LIMIT NUMBER,
+            TOKEN_COUNT NUMBER,
+            CHUNKS ARRAY,
+            CREATED_AT TIMESTAMP_LTZ
+        )
+    """).collect()
+    
+    result = session.sql(f"""
+        INSERT INTO {cache_table} (SEGMENT_KEY, EMBEDDING_MODEL, TOKEN_LIMIT, TOKEN_COUNT, CHUNKS, CREATED_AT)
+        WITH new_segments AS (
+            SELECT segment_key, ANY_VALUE(segment_text) AS segment_text
+            FROM {segments_table} s
+            WHERE segment_key IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM {cache_table} c WHERE c.SEGMENT_KEY = s.segment_key)
+            GROUP BY segment_key
+        ),
+        counted AS (
+            SELECT 
+                segment_key,
+                segment_text,
+                AI_COUNT_TOKENS('ai_embed', '{config.AI_EMBEDDING_MODEL}', segment_text) AS token_count
+            FROM new_segments
+        )
+        SELECT 
+            segment_key,
+            '{config.AI_EMBEDDING_MODEL}',
+            {token_limit},
+            token_count,
+            IFF(token_count > {token_limit},
+                SNOWFLAKE.CORTEX.SPLIT_TEXT_RECURSIVE_CHARACTER(segment_text, 'markdown', {token_limit}),
+                NULL),
+            CURRENT_TIMESTAMP()
+        FROM counted
+    """).collect()
+    computed = result[0][0] if result else 0
+    
+    segment_count = session.sql(
+        f"SELECT COUNT(DISTINCT segment_key) as cnt FROM {segments_table}"
+    ).collect()[0]['CNT']
+    log_detail(f"Segment token cache: {segment_count - computed:,} reused, {computed:,} counted/chunked")
+    
+    return {'segments': segment_count, 'computed': computed}
+
+
+# COMPANY_EVENT_TRANSCRIPTS_CORPUS columns (MERGE insert list for incremental builds)
+CORPUS_COLUMNS = [
+    'DOCUMENT_ID', 'TRANSCRIPT_ID', 'DOCUMENT_TITLE', 'DOCUMENT_TYPE', 'SecurityID', 'IssuerID',
+    'PUBLISH_DATE', 'LANGUAGE', 'EVENT_TYPE', 'SEGMENT_INDEX', 'CHUNK_INDEX', 'DOCUMENT_TEXT'
+]
+
+
+def build_company_events_corpus(session: Session, test_mode: bool = False, incremental: bool = False):
     """
     Create the company event transcripts corpus with chunked, metadata-enriched content.
     
@@ -199,80 +423,60 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
     2. Filter by YEARS_OF_HISTORY and transcript_type (prefer SPEAKERS_ANNOTATED for Earnings Calls)
     3. Flatten transcript segments from JSON
     4. Enrich segments with speaker info from mapping table
-    5. For segments ≤490 tokens: use directly with metadata header
-    6. For segments >490 tokens: chunk and add metadata header to each chunk
-    7. Link to DIM_SECURITY for SecurityID
+    5. Look up token counts and chunks in the segment cache (refresh_segment_chunk_cache)
+    6. For segments ≤490 tokens: use directly with metadata header
+    7. For segments >490 tokens: use cached chunks and add metadata header to each chunk
+    8. Link to DIM_SECURITY for SecurityID
     
     Creates SAM_DEMO.CURATED.COMPANY_EVENT_TRANSCRIPTS_CORPUS with columns:
     - DOCUMENT_ID: Unique per chunk/segment
     - TRANSCRIPT_ID: Groups all chunks from same event
     - CHUNK_INDEX: 0-based position within segment (0 for short segments)
     - DOCUMENT_TEXT: Chunk content with metadata header including speakers
+    
+    With incremental=True and an existing corpus, only transcripts whose TRANSCRIPT_ID
+    is not yet present are processed and their chunks are MERGEd on the stable MD5
+    DOCUMENT_ID; chunks of transcripts older than YEARS_OF_HISTORY are deleted. The
+    table is modified in place rather than replaced, so the SAM_COMPANY_EVENTS
+    Cortex Search service only refreshes the changed rows.
     """
     database_name = config.DATABASE['name']
     curated_schema = config.DATABASE['schemas']['curated']
     raw_schema = config.DATABASE['schemas']['raw']
-    source_db = config.REAL_DATA_SOURCES['database']
-    source_schema = config.REAL_DATA_SOURCES['schema']
-    source_table = config.REAL_DATA_SOURCES['tables']['company_event_transcripts']['table']
     
     corpus_table = f"{database_name}.{curated_schema}.COMPANY_EVENT_TRANSCRIPTS_CORPUS"
     speaker_mapping_table = f"{database_name}.{raw_schema}.COMP_EVENT_SPEAKER_MAPPING"
-    dim_security_table = f"{database_name}.{curated_schema}.DIM_SECURITY"
-    dim_issuer_table = f"{database_name}.{curated_schema}.DIM_ISSUER"
-    years_of_history = config.YEARS_OF_HISTORY
+    segments_table = f"{database_name}.{raw_schema}.COMP_EVENT_SEGMENTS_STAGE"
+    cache_table = f"{database_name}.{raw_schema}.COMP_EVENT_SEGMENT_CHUNK_CACHE"
     
-    # Token limit for segments (490 tokens, leaving ~22 tokens for metadata header)
-    token_limit = 490
+    token_limit = SEGMENT_TOKEN_LIMIT
     
-    log_detail("Building company event transcripts corpus...")
+    if incremental:
+        try:
+            session.sql(f"SELECT 1 FROM {corpus_table} LIMIT 1").collect()
+        except Exception:
+            incremental = False  # No corpus yet - full build
     
-    # Limit for test mode  
-    limit_clause = "LIMIT 100" if test_mode else ""
+    log_detail(f"Building company event transcripts corpus ({'incremental' if incremental else 'full'})...")
     
     # Simplified corpus creation SQL - work at segment level, only chunk long segments
-    # Pipeline: segments -> enrich with speakers -> split short/long -> union -> final output
-    corpus_sql = f"""
-    CREATE OR REPLACE TABLE {corpus_table} AS
+    # Pipeline: segments -> enrich with speakers + cached tokens -> split short/long -> union -> final output
+    corpus_select_sql = f"""
     WITH 
-    -- Step 1: Flatten transcript segments from JSON
-    -- Join to DIM_ISSUER on PROVIDER_COMPANY_ID for company matching
-    -- Filter by date and transcript_type (prefer SPEAKERS_ANNOTATED for Earnings Calls)
+    -- Step 1: Transcript segments staged by _stage_transcript_segments
     segments AS (
-        SELECT 
-            t.company_id,
-            t.cik,
-            t.company_name,
-            t.primary_ticker,
-            t.event_type,
-            t.EVENT_TIMESTAMP,
-            IFF(t.fiscal_period = 'None', NULL, t.fiscal_period) AS fiscal_period,
-            IFF(t.fiscal_year = 'None', NULL, t.fiscal_year) AS fiscal_year,
-            IFF(t.transcript_type = 'None', NULL, t.transcript_type) AS transcript_type,
-            a.index AS speaker_order,
-            CONCAT('SPEAKER_', a.value:speaker::text) AS speaker_id,
-            a.value:text::text AS segment_text,
-            i.IssuerID,
-            s.SecurityID,
-            s.Ticker AS matched_ticker
-        FROM {source_db}.{source_schema}.{source_table} AS t
-        INNER JOIN {dim_issuer_table} i ON t.COMPANY_ID = i.PROVIDERCOMPANYID
-        INNER JOIN {dim_security_table} s ON i.IssuerID = s.IssuerID AND s.AssetClass = 'Equity',
-        LATERAL FLATTEN(input => t.TRANSCRIPT:paragraphs) a
-        WHERE t.EVENT_TIMESTAMP >= DATEADD('year', -{years_of_history}, CURRENT_DATE())
-          AND ((t.EVENT_TYPE = 'Earnings Call' AND t.TRANSCRIPT_TYPE = 'SPEAKERS_ANNOTATED') 
-               OR t.EVENT_TYPE != 'Earnings Call')
-        {limit_clause}
+        SELECT * FROM {segments_table}
     ),
     
-    -- Step 2: Enrich with speaker info from mapping table
+    -- Step 2: Enrich with speaker info from mapping table and cached token counts
     enriched_segments AS (
         SELECT 
             s.*,
             COALESCE(m.speaker_name, s.speaker_id) AS speaker_name,
             COALESCE(m.speaker_role, 'Unknown') AS speaker_role,
             COALESCE(m.speaker_company, s.company_name) AS speaker_company,
-            AI_COUNT_TOKENS('ai_embed', '{config.AI_EMBEDDING_MODEL}', s.segment_text) AS token_count
+            tc.TOKEN_COUNT AS token_count,
+            tc.CHUNKS AS cached_chunks
         FROM segments s
         LEFT JOIN {speaker_mapping_table} m
             ON s.company_id = m.company_id
@@ -283,12 +487,14 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
             AND COALESCE(s.fiscal_year, '') = COALESCE(m.fiscal_year, '')
             AND COALESCE(s.transcript_type, '') = COALESCE(m.transcript_type, '')
             AND s.speaker_id = m.speaker_id
+        LEFT JOIN {cache_table} tc
+            ON s.segment_key = tc.SEGMENT_KEY
     ),
     
     -- Step 3a: Short segments that fit within token limit - use directly
     short_segments AS (
         SELECT 
-            *,
+            * EXCLUDE (segment_key, cached_chunks),
             segment_text AS chunk_text,
             0 AS chunk_index
         FROM enriched_segments
@@ -302,7 +508,7 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
         WHERE token_count > {token_limit}
     ),
     
-    -- Step 3c: Chunk the long segments
+    -- Step 3c: Chunk the long segments (chunks cached by refresh_segment_chunk_cache)
     chunked_long_segments AS (
         SELECT 
             ls.company_id,
@@ -327,9 +533,7 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
             c.value::STRING AS chunk_text,
             c.index AS chunk_index
         FROM long_segments ls,
-        LATERAL FLATTEN(
-            input => SNOWFLAKE.CORTEX.SPLIT_TEXT_RECURSIVE_CHARACTER(ls.segment_text, 'markdown', {token_limit})
-        ) c
+        LATERAL FLATTEN(input => ls.cached_chunks) c
     ),
     
     -- Step 4: Union short segments and chunked long segments
@@ -351,7 +555,7 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
         )) AS DOCUMENT_ID,
         
         -- TRANSCRIPT_ID: Groups all chunks from same event for ordered retrieval
-        MD5(CONCAT(cik, EVENT_TIMESTAMP::VARCHAR, COALESCE(transcript_type, ''))) AS TRANSCRIPT_ID,
+        {_transcript_id_sql('cik', 'EVENT_TIMESTAMP', 'transcript_type')} AS TRANSCRIPT_ID,
         
         -- Title with speaker and chunk indicator
         CONCAT(
@@ -388,11 +592,36 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
         ) AS DOCUMENT_TEXT
         
     FROM all_chunks
-    ORDER BY company_name, EVENT_TIMESTAMP, transcript_type, speaker_order, chunk_index
     """
     
     try:
-        session.sql(corpus_sql).collect()
+        _stage_transcript_segments(session, segments_table, test_mode,
+                                   exclude_corpus_table=corpus_table if incremental else None)
+        refresh_segment_chunk_cache(session, segments_table, token_limit)
+        
+        if incremental:
+            result = session.sql(f"""
+                MERGE INTO {corpus_table} t
+                USING ({corpus_select_sql}) s
+                ON t.DOCUMENT_ID = s.DOCUMENT_ID
+                WHEN NOT MATCHED THEN INSERT ({', '.join(CORPUS_COLUMNS)})
+                    VALUES ({', '.join(f's.{c}' for c in CORPUS_COLUMNS)})
+            """).collect()
+            merged_count = result[0][0] if result else 0
+            
+            # Same history window as a full rebuild (PUBLISH_DATE = DATE(EVENT_TIMESTAMP))
+            result = session.sql(f"""
+                DELETE FROM {corpus_table}
+                WHERE PUBLISH_DATE < DATEADD('year', -{config.YEARS_OF_HISTORY}, CURRENT_DATE())
+            """).collect()
+            expired_count = result[0][0] if result else 0
+            log_detail(f"Merged {merged_count:,} new chunks into corpus, removed {expired_count:,} expired chunks")
+        else:
+            session.sql(f"""
+                CREATE OR REPLACE TABLE {corpus_table} AS
+                {corpus_select_sql}
+                ORDER BY company_name, EVENT_TIMESTAMP, transcript_type, speaker_order, chunk_index
+            """).collect()
         
         # Get count for logging
         count_result = session.sql(f"SELECT COUNT(*) as cnt FROM {corpus_table}").collect()
@@ -410,6 +639,8 @@ def build_company_events_corpus(session: Session, test_mode: bool = False):
     except Exception as e:
         log_error(f"Failed to create company events corpus: {e}")
         raise
+    finally:
+        session.sql(f"DROP TABLE IF EXISTS {segments_table}").collect()
 
 
 def verify_transcripts_available(session: Session) -> bool:
@@ -26,11 +26,14 @@ This module generates:
 
 from snowflake.snowpark import Session
 from typing import List
+import json
 import random
+import time
 from datetime import datetime, timedelta, date
 import config
 from logging_utils import log_detail, log_info, log_warning, log_error, log_success
-from db_helpers import get_max_price_date
+from db_helpers import get_max_price_date, run_profiled_query, table_exists
+from create_semantic_views import get_existing_semantic_views, profile_semantic_view_queries
 from sql_utils import safe_sql_tuple
 from demo_helpers import build_demo_portfolios_sql_mapping, get_demo_portfolio_names, get_demo_clients_sorted, get_demo_company_tickers, get_all_demo_clients_sorted, get_at_risk_client_ids, get_new_client_ids, get_new_demo_clients
 from sql_case_builders import (
@@ -42,7 +45,8 @@ from sql_case_builders import (
     build_global_uniform_sql,
     build_factor_case_sql,
     get_factor_r_squared,
-    build_country_settlement_case_sql
+    build_country_settlement_case_sql,
+    build_sic_to_gics_case_sql
 )
 
 def build_all(session: Session, scenarios: List[str], test_mode: bool = False, recreate_database: bool = True):
@@ -134,6 +138,7 @@ def build_dimension_tables(session: Session, test_mode: bool = False):
     # Build dimension tables from DEMO_COMPANIES config
     # DIM_ISSUER is the driver table - all other data flows from it
     _run_build_step(build_dim_issuer, session, test_mode)
+    _run_build_step(build_sic_gics_hydration_cache, session)
     _run_build_step(build_dim_security, session, test_mode)
     _run_build_step(build_dim_portfolio, session)
     _run_build_step(build_dim_benchmark, session)
@@ -337,6 +342,25 @@ def build_dim_issuer(session: Session, test_mode: bool = False):
     log_info(f"    With CIK: {quality_stats['ISSUERS_WITH_CIK']}, With Provider ID: {quality_stats['ISSUERS_WITH_PROVIDER_ID']}")
 
 
+def build_sic_gics_hydration_cache(session: Session):
+    """
+    Precompute hydration_engine.map_sic_to_gics for every DIM_ISSUER SIC description.
+    
+    A cache for document hydration only (preloaded by preload_sic_to_gics), built
+    with the same config.SIC_TO_GICS_MAPPING keyword rules. Structured tables keep
+    their own GICS_SECTOR from DEMO_COMPANIES and do not read it.
+    """
+    database_name = config.DATABASE['name']
+    raw_schema = config.DATABASE['schemas']['raw']
+    session.sql(f"""
+        CREATE OR REPLACE TABLE {database_name}.{raw_schema}.SIC_GICS_HYDRATION_CACHE AS
+        SELECT 
+            SIC_DESCRIPTION,
+            {build_sic_to_gics_case_sql('SIC_DESCRIPTION')} as GICS_SECTOR
+        FROM (SELECT DISTINCT SIC_DESCRIPTION FROM {database_name}.CURATED.DIM_ISSUER WHERE SIC_DESCRIPTION IS NOT NULL)
+        ORDER BY SIC_DESCRIPTION
+    """).collect()
+
 
 def build_dim_security(session: Session, test_mode: bool = False):
     """
@@ -436,6 +460,16 @@ def build_dim_benchmark(session: Session):
     benchmarks_df.write.mode("overwrite").save_as_table(f"{config.DATABASE['name']}.CURATED.DIM_BENCHMARK")
     
 
+# GICS sector -> config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS profile for industry relationships
+SUPPLY_CHAIN_SECTOR_PROFILES = {
+    'Information Technology': 'semiconductors',
+    'Consumer Discretionary': 'automotive',
+    'Industrials': 'default',
+}
+
+# Probability that two adjacent sampled issuers in a sector are linked
+SUPPLY_CHAIN_LINK_PROBABILITY = 0.3
+
 def build_dim_supply_chain_relationships(session: Session, test_mode: bool = False):
     """
     Build supply chain relationships dimension table.
@@ -445,11 +479,15 @@ def build_dim_supply_chain_relationships(session: Session, test_mode: bool = Fal
     - Core demo relationships: Taiwan semiconductor → US tech → automotive
     - Industry-specific relationship densities
     - Symmetric relationship handling (supplier/customer pairs)
+    
+    Set-based: demo relationships (config.SUPPLY_CHAIN_DEMO_RELATIONSHIPS) and
+    all sector relationships (SUPPLY_CHAIN_SECTOR_PROFILES) are derived in a
+    single INSERT ... SELECT, so the query count does not grow with sectors.
+    Sampling uses HASH seeded with config.RNG_SEED, so reruns are reproducible.
     """
     
     database_name = config.DATABASE['name']
-    random.seed(config.RNG_SEED)
-    
+    seed = config.RNG_SEED
     
     # Step 1: Create the table structure (without foreign key constraints for simplicity)
     # Foreign key constraints removed to avoid data type mismatches with ROW_NUMBER-generated IssuerIDs
@@ -469,114 +507,125 @@ def build_dim_supply_chain_relationships(session: Session, test_mode: bool = Fal
         )
     """).collect()
     
-    # Step 2: Get issuer IDs for supply chain companies - derive tickers from config
-    # Batched lookup - single query instead of loop (Snowflake I/O best practice)
-    supply_chain_tickers = set()
-    for rel in config.SUPPLY_CHAIN_DEMO_RELATIONSHIPS:
-        supply_chain_tickers.add(rel[0])  # company_ticker
-        supply_chain_tickers.add(rel[1])  # counterparty_ticker
-    
-    tickers_sql = ', '.join(f"'{t}'" for t in supply_chain_tickers)
-    issuer_map_rows = session.sql(f"""
-        SELECT i.PrimaryTicker, i.IssuerID
-        FROM {database_name}.CURATED.DIM_ISSUER i
-        WHERE i.PrimaryTicker IN ({tickers_sql})
+    # Step 2: Inline config as VALUES lists
+    # Only 'Customer' demo rows produce relationships (company supplies counterparty)
+    demo_values = ',\n                '.join(
+        f"({i}, '{company}', '{counterparty}', {share}, '{criticality}')"
+        for i, (company, counterparty, rel_type, share, criticality)
+        in enumerate(config.SUPPLY_CHAIN_DEMO_RELATIONSHIPS)
+        if rel_type == 'Customer'
+    ) or "(NULL, NULL, NULL, NULL, NULL)"
+    profile_values = ',\n                '.join(
+        f"({i + 1}, '{sector}', {config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS[profile]['critical_suppliers_share'][0]}, "
+        f"{config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS[profile]['critical_suppliers_share'][1]})"
+        for i, (sector, profile) in enumerate(SUPPLY_CHAIN_SECTOR_PROFILES.items())
+    )
+    demo_tickers = sorted({t for rel in config.SUPPLY_CHAIN_DEMO_RELATIONSHIPS for t in rel[:2]})
+    tickers_sql = ', '.join(f"'{t}'" for t in demo_tickers)
+    ticker_values = ', '.join(f"('{t}')" for t in demo_tickers)
+    issuers_per_sector = 5 if test_mode else 15
+    
+    # Step 3: Demo pairs (supplier + symmetric customer row) and sector chains in one statement
+    session.sql(f"""
+        INSERT INTO {database_name}.CURATED.DIM_SUPPLY_CHAIN_RELATIONSHIPS (
+            RelationshipID, Company_IssuerID, Counterparty_IssuerID, RelationshipType,
+            CostShare, RevenueShare, CriticalityTier, SourceConfidence, StartDate, EndDate, Notes
+        )
+        WITH demo_relationships (rel_order, company_ticker, counterparty_ticker, share, criticality) AS (
+            SELECT * FROM VALUES
+                {demo_values}
+        ),
+        sector_profiles (sector_order, sector, min_share, max_share) AS (
+            SELECT * FROM VALUES
+                {profile_values}
+        ),
+        demo_issuers AS (
+            SELECT PrimaryTicker, IssuerID
+            FROM {database_name}.CURATED.DIM_ISSUER
+            WHERE PrimaryTicker IN ({tickers_sql})
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY PrimaryTicker ORDER BY IssuerID DESC) = 1
+        ),
+        demo_rows AS (
+            SELECT 
+                0 as source_order, d.rel_order, 0 as pair_order,
+                c.IssuerID as Company_IssuerID, cp.IssuerID as Counterparty_IssuerID,
+                'Supplier' as RelationshipType,                  -- Company supplies to counterparty
+                NULL as CostShare, d.share as RevenueShare,      -- Share of company's revenue from this customer
+                d.criticality as CriticalityTier, 85.0 as SourceConfidence,
+                'Demo relationship: ' || d.company_ticker || ' supplies to ' || d.counterparty_ticker as Notes
+            FROM demo_relationships d
+            JOIN demo_issuers c ON c.PrimaryTicker = d.company_ticker
+            JOIN demo_issuers cp ON cp.PrimaryTicker = d.counterparty_ticker
+            UNION ALL
+            SELECT 
+                0, d.rel_order, 1,
+                cp.IssuerID, c.IssuerID,
+                'Customer',                                      -- Counterparty is customer of company
+                d.share, NULL,                                   -- Share of counterparty's costs from this supplier
+                d.criticality, 85.0,
+                'Demo relationship: ' || d.counterparty_ticker || ' sources from ' || d.company_ticker
+            FROM demo_relationships d
+            JOIN demo_issuers c ON c.PrimaryTicker = d.company_ticker
+            JOIN demo_issuers cp ON cp.PrimaryTicker = d.counterparty_ticker
+        ),
+        sector_issuers AS (
+            -- Sample issuers per sector (excluding demo companies) in a seeded pseudo-random order
+            SELECT 
+                sp.sector_order, sp.sector, sp.min_share, sp.max_share, i.IssuerID,
+                ROW_NUMBER() OVER (PARTITION BY sp.sector ORDER BY HASH({seed}, sp.sector, i.IssuerID)) as pick_order
+            FROM (SELECT DISTINCT IssuerID, SIC_DESCRIPTION FROM {database_name}.CURATED.DIM_ISSUER) i
+            JOIN sector_profiles sp ON i.SIC_DESCRIPTION = sp.sector
+            WHERE i.IssuerID NOT IN (SELECT IssuerID FROM demo_issuers)
+            QUALIFY pick_order <= {issuers_per_sector}
+        ),
+        sector_links AS (
+            -- Link each sampled issuer to the next one in its sector
+            SELECT 
+                sector_order, sector, min_share, max_share, pick_order, IssuerID as Company_IssuerID,
+                LEAD(IssuerID) OVER (PARTITION BY sector ORDER BY pick_order) as Counterparty_IssuerID
+            FROM sector_issuers
+        ),
+        sector_rows AS (
+            SELECT 
+                sector_order as source_order, pick_order as rel_order, 0 as pair_order,
+                Company_IssuerID, Counterparty_IssuerID,
+                'Supplier' as RelationshipType,
+                NULL as CostShare,
+                ROUND(UNIFORM(min_share::FLOAT, max_share::FLOAT, HASH({seed}, Company_IssuerID, 'share')), 4) as RevenueShare,
+                CASE WHEN RevenueShare > 0.15 THEN 'High' WHEN RevenueShare > 0.08 THEN 'Medium' ELSE 'Low' END as CriticalityTier,
+                ROUND(UNIFORM(70::FLOAT, 90::FLOAT, HASH({seed}, Company_IssuerID, 'confidence')), 2) as SourceConfidence,
+                'Industry relationship within ' || sector as Notes
+            FROM sector_links
+            WHERE Counterparty_IssuerID IS NOT NULL
+              AND UNIFORM(0::FLOAT, 1::FLOAT, HASH({seed}, Company_IssuerID, 'link')) < {SUPPLY_CHAIN_LINK_PROBABILITY}
+        )
+        SELECT 
+            ROW_NUMBER() OVER (ORDER BY source_order, rel_order, pair_order) as RelationshipID,
+            Company_IssuerID,
+            Counterparty_IssuerID,
+            RelationshipType,
+            CostShare,
+            RevenueShare,
+            CriticalityTier,
+            SourceConfidence,
+            '2020-01-01'::DATE as StartDate,
+            NULL as EndDate,
+            Notes
+        FROM (SELECT * FROM demo_rows UNION ALL SELECT * FROM sector_rows)
     """).collect()
-    issuer_map = {row['PRIMARYTICKER']: row['ISSUERID'] for row in issuer_map_rows}
     
-    # Log any missing tickers
-    missing_tickers = supply_chain_tickers - set(issuer_map.keys())
-    for ticker in missing_tickers:
+    # Step 4: Report demo tickers without an issuer and the resulting relationship count
+    summary = session.sql(f"""
+        SELECT 
+            (SELECT COUNT(*) FROM {database_name}.CURATED.DIM_SUPPLY_CHAIN_RELATIONSHIPS) as RELATIONSHIPS,
+            (SELECT ARRAY_AGG(t.ticker) WITHIN GROUP (ORDER BY t.ticker)
+             FROM (SELECT column1 as ticker FROM VALUES {ticker_values}) t
+             WHERE t.ticker NOT IN (SELECT PrimaryTicker FROM {database_name}.CURATED.DIM_ISSUER WHERE PrimaryTicker IS NOT NULL)
+            ) as MISSING_TICKERS
+    """).collect()[0]
+    for ticker in json.loads(summary['MISSING_TICKERS'] or '[]'):
         log_warning(f"  Could not find issuer for supply chain ticker: {ticker}")
-    
-    # Step 3: Create demo relationships from config
-    relationships = []
-    relationship_id = 1
-    
-    for company_ticker, counterparty_ticker, rel_type, share, criticality in config.SUPPLY_CHAIN_DEMO_RELATIONSHIPS:
-        if company_ticker in issuer_map and counterparty_ticker in issuer_map:
-            # Create supplier relationship
-            if rel_type == 'Customer':
-                # Company is supplier, counterparty is customer
-                relationships.append({
-                    'RelationshipID': relationship_id,
-                    'Company_IssuerID': issuer_map[company_ticker],
-                    'Counterparty_IssuerID': issuer_map[counterparty_ticker],
-                    'RelationshipType': 'Supplier',  # Company supplies to counterparty
-                    'CostShare': None,
-                    'RevenueShare': share,  # Share of company's revenue from this customer
-                    'CriticalityTier': criticality,
-                    'SourceConfidence': 85.0,
-                    'StartDate': date(2020, 1, 1),
-                    'EndDate': None,
-                    'Notes': f'Demo relationship: {company_ticker} supplies to {counterparty_ticker}'
-                })
-                relationship_id += 1
-                
-                # Create symmetric customer relationship
-                relationships.append({
-                    'RelationshipID': relationship_id,
-                    'Company_IssuerID': issuer_map[counterparty_ticker],
-                    'Counterparty_IssuerID': issuer_map[company_ticker],
-                    'RelationshipType': 'Customer',  # Counterparty is customer of company
-                    'CostShare': share,  # Share of counterparty's costs from this supplier
-                    'RevenueShare': None,
-                    'CriticalityTier': criticality,
-                    'SourceConfidence': 85.0,
-                    'StartDate': date(2020, 1, 1),
-                    'EndDate': None,
-                    'Notes': f'Demo relationship: {counterparty_ticker} sources from {company_ticker}'
-                })
-                relationship_id += 1
-    
-    # Step 4: Add industry-based relationships for realism
-    # Get additional issuers by sector
-    sectors_with_density = {
-        'Information Technology': config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS['semiconductors'],
-        'Consumer Discretionary': config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS['automotive'],
-        'Industrials': config.SUPPLY_CHAIN_RELATIONSHIP_STRENGTHS['default']
-    }
-    
-    for sector, density in sectors_with_density.items():
-        # Get random issuers from this sector (excluding demo companies)
-        sector_issuers = session.sql(f"""
-            SELECT DISTINCT i.IssuerID, i.LegalName
-            FROM {database_name}.CURATED.DIM_ISSUER i
-            WHERE i.SIC_DESCRIPTION = '{sector}'
-            AND i.IssuerID NOT IN ({','.join(str(id) for id in issuer_map.values())})
-            ORDER BY RANDOM()
-            LIMIT {5 if test_mode else 15}
-        """).collect()
-        
-        # Create relationships between sector companies
-        for i in range(len(sector_issuers) - 1):
-            if random.random() < 0.3:  # 30% chance of relationship
-                min_share, max_share = density['critical_suppliers_share']
-                share = round(random.uniform(min_share, max_share), 4)
-                criticality = 'High' if share > 0.15 else 'Medium' if share > 0.08 else 'Low'
-                
-                relationships.append({
-                    'RelationshipID': relationship_id,
-                    'Company_IssuerID': sector_issuers[i]['ISSUERID'],
-                    'Counterparty_IssuerID': sector_issuers[i+1]['ISSUERID'],
-                    'RelationshipType': 'Supplier',
-                    'CostShare': None,
-                    'RevenueShare': share,
-                    'CriticalityTier': criticality,
-                    'SourceConfidence': round(random.uniform(70, 90), 2),
-                    'StartDate': date(2020, 1, 1),
-                    'EndDate': None,
-                    'Notes': f'Industry relationship within {sector}'
-                })
-                relationship_id += 1
-    
-    # Step 5: Insert relationships
-    if relationships:
-        relationships_df = session.create_dataframe(relationships)
-        relationships_df.write.mode("overwrite").save_as_table(
-            f"{database_name}.CURATED.DIM_SUPPLY_CHAIN_RELATIONSHIPS"
-        )
-    else:
+    if not summary['RELATIONSHIPS']:
         log_warning("  No supply chain relationships created")
 
 def build_fact_transaction(session: Session, test_mode: bool = False):
@@ -1048,6 +1097,9 @@ def build_esg_latest_view(session: Session):
     
     This view provides the latest Overall ESG score for each security. It can be used
     for ESG analysis in agents via direct queries or through Cortex Analyst.
+    
+    Once returns are available, V_HOLDINGS_WITH_ESG is backed according to
+    config.HOLDINGS_ENRICHMENT['materialization'] (see _publish_holdings_with_esg).
     """
     database_name = config.DATABASE['name']
     
@@ -1080,8 +1132,7 @@ def build_esg_latest_view(session: Session):
     # Create enriched holdings view with ESG data and date-matched returns
     # Join holdings with returns from the closest prior trading date (handles weekends/holidays)
     if has_returns_view:
-        session.sql(f"""
-            CREATE OR REPLACE VIEW {database_name}.CURATED.V_HOLDINGS_WITH_ESG AS
+        _publish_holdings_with_esg(session, f"""
             WITH holdings_with_returns AS (
                 SELECT 
                     h.PortfolioID,
@@ -1133,8 +1184,10 @@ def build_esg_latest_view(session: Session):
             FROM holdings_with_returns h
             LEFT JOIN {database_name}.CURATED.V_ESG_LATEST e ON h.SecurityID = e.SecurityID
             WHERE h.rn = 1 OR h.rn IS NULL  -- Get closest match or keep rows with no match
-        """).collect()
+        """)
     else:
+        # Without returns the join is cheap, so it always stays a logical view
+        _drop_holdings_materialization(session, keep='view')
         session.sql(f"""
             CREATE OR REPLACE VIEW {database_name}.CURATED.V_HOLDINGS_WITH_ESG AS
             SELECT 
@@ -1151,9 +1204,227 @@ def build_esg_latest_view(session: Session):
             LEFT JOIN {database_name}.CURATED.V_ESG_LATEST e ON h.SecurityID = e.SecurityID
         """).collect()
     
-    log_detail(f"  Created V_HOLDINGS_WITH_ESG enriched view")
+        log_detail(f"  Created V_HOLDINGS_WITH_ESG enriched view")
     
 
+HOLDINGS_MATERIALIZATION_MODES = ('view', 'table', 'dynamic_table')
+
+def _drop_holdings_materialization(session: Session, keep: str):
+    """Drop CURATED.HOLDINGS_WITH_ESG / its source view when switching to a different mode."""
+    curated = f"{config.DATABASE['name']}.CURATED"
+    is_dynamic = bool(session.sql(f"SHOW DYNAMIC TABLES LIKE 'HOLDINGS_WITH_ESG' IN SCHEMA {curated}").collect())
+    if is_dynamic and keep != 'dynamic_table':
+        session.sql(f"DROP DYNAMIC TABLE IF EXISTS {curated}.HOLDINGS_WITH_ESG").collect()
+    elif not is_dynamic and keep != 'table':
+        session.sql(f"DROP TABLE IF EXISTS {curated}.HOLDINGS_WITH_ESG").collect()
+    if keep == 'view':
+        session.sql(f"DROP VIEW IF EXISTS {curated}.V_HOLDINGS_WITH_ESG_SOURCE").collect()
+
+def _publish_holdings_with_esg(session: Session, holdings_select_sql: str):
+    """
+    Publish V_HOLDINGS_WITH_ESG according to config.HOLDINGS_ENRICHMENT['materialization'].
+    
+    - view: V_HOLDINGS_WITH_ESG is the logical view (join runs per query)
+    - table: the logical query becomes V_HOLDINGS_WITH_ESG_SOURCE and is materialized
+      into HOLDINGS_WITH_ESG (sorted by date/portfolio for pruning) on every build
+    - dynamic_table: HOLDINGS_WITH_ESG is a dynamic table over the source view,
+      initialized at creation (i.e. after the structured build) and then kept
+      within target_lag
+    
+    In the materialized modes V_HOLDINGS_WITH_ESG is a pass-through view over
+    HOLDINGS_WITH_ESG, so semantic views and downstream builders are unchanged.
+    """
+    curated = f"{config.DATABASE['name']}.CURATED"
+    mode = config.HOLDINGS_ENRICHMENT.get('materialization', 'view')
+    if mode not in HOLDINGS_MATERIALIZATION_MODES:
+        raise ValueError(f"Unknown holdings materialization '{mode}' (expected one of {HOLDINGS_MATERIALIZATION_MODES})")
+    
+    _drop_holdings_materialization(session, keep=mode)
+    
+    if mode == 'view':
+        session.sql(f"CREATE OR REPLACE VIEW {curated}.V_HOLDINGS_WITH_ESG AS {holdings_select_sql}").collect()
+        log_detail(f"  Created V_HOLDINGS_WITH_ESG enriched view")
+        return
+    
+    session.sql(f"CREATE OR REPLACE VIEW {curated}.V_HOLDINGS_WITH_ESG_SOURCE AS {holdings_select_sql}").collect()
+    
+    started = time.perf_counter()
+    if mode == 'table':
+        session.sql(f"""
+            CREATE OR REPLACE TABLE {curated}.HOLDINGS_WITH_ESG AS
+            SELECT * FROM {curated}.V_HOLDINGS_WITH_ESG_SOURCE
+            ORDER BY HoldingDate, PortfolioID, SecurityID
+        """).collect()
+    else:
+        session.sql(f"""
+            CREATE OR REPLACE DYNAMIC TABLE {curated}.HOLDINGS_WITH_ESG
+            TARGET_LAG = '{config.HOLDINGS_ENRICHMENT['target_lag']}'
+            WAREHOUSE = {config.WAREHOUSES['execution']['name']}
+            REFRESH_MODE = AUTO
+            INITIALIZE = ON_CREATE
+            AS SELECT * FROM {curated}.V_HOLDINGS_WITH_ESG_SOURCE
+        """).collect()
+    elapsed = time.perf_counter() - started
+    
+    session.sql(f"""
+        CREATE OR REPLACE VIEW {curated}.V_HOLDINGS_WITH_ESG AS
+        SELECT * FROM {curated}.HOLDINGS_WITH_ESG
+    """).collect()
+    
+    count = session.sql(f"SELECT COUNT(*) as cnt FROM {curated}.HOLDINGS_WITH_ESG").collect()[0]['CNT']
+    log_detail(f"  Materialized V_HOLDINGS_WITH_ESG as {mode} HOLDINGS_WITH_ESG: {count:,} rows in {elapsed:.1f}s")
+
+
+# Latest-snapshot query shapes used by SAM_ANALYST_VIEW over enriched holdings
+HOLDINGS_BENCHMARK_QUERIES = {
+    'latest_value_by_portfolio': """
+        SELECT PortfolioID, SUM(MarketValue_Base) AS MV, AVG(ESG_SCORE) AS AVG_ESG
+        FROM {source}
+        WHERE HoldingDate = (SELECT MAX(HoldingDate) FROM {source})
+        GROUP BY PortfolioID
+    """,
+    'latest_esg_grade_mix': """
+        SELECT PortfolioID, ESG_GRADE, SUM(PortfolioWeight) AS WEIGHT
+        FROM {source}
+        WHERE HoldingDate = (SELECT MAX(HoldingDate) FROM {source})
+        GROUP BY PortfolioID, ESG_GRADE
+    """,
+    'quarter_returns_by_portfolio': """
+        SELECT PortfolioID, HoldingDate, SUM(PortfolioWeight * YTD_RETURN_PCT) AS WEIGHTED_YTD
+        FROM {source}
+        WHERE HoldingDate >= DATEADD(day, -90, (SELECT MAX(HoldingDate) FROM {source}))
+        GROUP BY PortfolioID, HoldingDate
+    """,
+}
+
+def benchmark_holdings_materialization(session: Session) -> dict:
+    """
+    Compare query latency on logical vs materialized enriched holdings.
+    
+    Materializes the logical V_HOLDINGS_WITH_ESG query into a scratch transient
+    table (timing the build), runs the latest-snapshot query shapes against both
+    with the result cache disabled, then drops the scratch table.
+    
+    Returns:
+        Dict with 'build' stats and per-query {'logical': stats, 'materialized': stats}
+    """
+    database_name = config.DATABASE['name']
+    curated = f"{database_name}.CURATED"
+    logical = (f"{curated}.V_HOLDINGS_WITH_ESG_SOURCE"
+               if table_exists(session, database_name, 'CURATED', 'V_HOLDINGS_WITH_ESG_SOURCE')
+               else f"{curated}.V_HOLDINGS_WITH_ESG")
+    scratch_table = f"{curated}.HOLDINGS_WITH_ESG_BENCH"
+    
+    log_info(f"Benchmarking enriched holdings: {logical} vs materialized table")
+    results = {}
+    try:
+        results['build'] = run_profiled_query(session, f"""
+            CREATE OR REPLACE TRANSIENT TABLE {scratch_table} AS
+            SELECT * FROM {logical}
+            ORDER BY HoldingDate, PortfolioID, SecurityID
+        """)
+        log_info(f"  Materialization: {results['build'].get('total_elapsed_ms', 0) / 1000:.1f}s")
+        
+        for query_name, query_template in HOLDINGS_BENCHMARK_QUERIES.items():
+            logical_stats = run_profiled_query(session, query_template.format(source=logical))
+            materialized_stats = run_profiled_query(session, query_template.format(source=scratch_table))
+            results[query_name] = {'logical': logical_stats, 'materialized': materialized_stats}
+            
+            logical_ms = logical_stats.get('total_elapsed_ms') or 0
+            materialized_ms = materialized_stats.get('total_elapsed_ms') or 0
+            speedup = f"{logical_ms / materialized_ms:.1f}x" if materialized_ms else "n/a"
+            log_info(
+                f"  {query_name}: logical {logical_ms:,} ms / {(logical_stats.get('bytes_scanned') or 0) / 1024**2:.1f} MB, "
+                f"materialized {materialized_ms:,} ms / {(materialized_stats.get('bytes_scanned') or 0) / 1024**2:.1f} MB ({speedup})"
+            )
+    finally:
+        session.sql(f"DROP TABLE IF EXISTS {scratch_table}").collect()
+    
+    return results
+
+
+# =============================================================================
+# POST-BUILD TABLE LAYOUT
+# =============================================================================
+
+TABLE_LAYOUT_MODES = ('off', 'sort', 'cluster')
+
+# Semantic views whose standard queries (SEMANTIC_VIEW_BENCHMARK_QUERIES) are profiled
+# before and after the rewrite - the access patterns the layout is meant to prune for
+TABLE_LAYOUT_PROFILE_VIEWS = ['SAM_ANALYST_VIEW', 'SAM_IMPLEMENTATION_VIEW']
+
+def optimize_table_layouts(session: Session) -> dict:
+    """
+    Rewrite large fact tables sorted by their date/portfolio/security keys.
+    
+    Driven by config.TABLE_LAYOUT: 'sort' rewrites each table in key order via
+    INSERT OVERWRITE (keeping grants and dependent views intact); 'cluster'
+    also sets the keys as clustering key so Automatic Clustering maintains the
+    layout. The standard semantic-view queries of TABLE_LAYOUT_PROFILE_VIEWS are
+    profiled before and after all rewrites. Partitions scanned is the primary
+    metric: the 'after' run sees a warehouse cache warmed by the 'before' run
+    and the rewrites, so its latency is biased low.
+    
+    Runs after the semantic views are created (build_ai.build_all); raises if
+    none of TABLE_LAYOUT_PROFILE_VIEWS exist, since the report would be empty.
+    
+    Returns:
+        Dict with 'tables' (table -> rewrite seconds) and 'queries'
+        ('VIEW.query' -> {'before': stats, 'after': stats})
+    """
+    mode = config.TABLE_LAYOUT.get('mode', 'off')
+    if mode not in TABLE_LAYOUT_MODES:
+        raise ValueError(f"Unknown table layout mode '{mode}' (expected one of {TABLE_LAYOUT_MODES})")
+    if mode == 'off':
+        return {}
+    
+    database_name = config.DATABASE['name']
+    if not set(TABLE_LAYOUT_PROFILE_VIEWS) & get_existing_semantic_views(session):
+        raise RuntimeError(
+            f"Table layout '{mode}' needs the semantic views {TABLE_LAYOUT_PROFILE_VIEWS} to profile "
+            "partition pruning, but none exist. Build them first (--scope all or --scope ai)."
+        )
+    before = profile_semantic_view_queries(session, TABLE_LAYOUT_PROFILE_VIEWS)
+    
+    tables = {}
+    for table, keys in config.TABLE_LAYOUT['tables'].items():
+        schema_name, table_name = table.split('.')
+        table_fqn = f"{database_name}.{table}"
+        if not table_exists(session, database_name, schema_name, table_name):
+            log_detail(f"  Skipping {table} - table not found")
+            continue
+        
+        key_list = ', '.join(keys)
+        try:
+            started = time.perf_counter()
+            session.sql(f"INSERT OVERWRITE INTO {table_fqn} SELECT * FROM {table_fqn} ORDER BY {key_list}").collect()
+            if mode == 'cluster':
+                session.sql(f"ALTER TABLE {table_fqn} CLUSTER BY ({key_list})").collect()
+            tables[table] = time.perf_counter() - started
+        except Exception as e:
+            raise RuntimeError(f"Error optimizing layout of {table}: {e}")
+        log_detail(f"  {table}: {mode} by {key_list} ({tables[table]:.1f}s)")
+    
+    after = profile_semantic_view_queries(session, TABLE_LAYOUT_PROFILE_VIEWS)
+    
+    queries = {}
+    for query, before_stats in before.items():
+        after_stats = after.get(query)
+        if after_stats is None:
+            continue
+        queries[query] = {'before': before_stats, 'after': after_stats}
+        log_detail(
+            f"  {query}: partitions scanned "
+            f"{before_stats.get('partitions_scanned', 0):,}/{before_stats.get('partitions_total', 0):,} -> "
+            f"{after_stats.get('partitions_scanned', 0):,}/{after_stats.get('partitions_total', 0):,} "
+            f"({before_stats.get('total_elapsed_ms', 0):,} -> {after_stats.get('total_elapsed_ms', 0):,} ms, warm cache after)"
+        )
+    if not queries:
+        log_warning("  No semantic view queries profiled - see the query failures above")
+    
+    return {'tables': tables, 'queries': queries}
+
+
 def build_factor_exposures(session: Session):
     """Build factor exposures with SecurityID linkage using config-driven SQL generation.
     
@@ -2529,16 +2800,157 @@ def generate_demo_compliance_alert(session: Session):
     """).collect()
     
 
-def generate_concentration_breach_alerts(session: Session):
+# PM names for resolved concentration alerts (demo data)
+CONCENTRATION_ALERT_PM_NAMES = ['Anna Chen', 'David Martinez', 'Sarah Thompson', 'Michael Roberts']
+
+CONCENTRATION_ALERT_STRATEGIES = ('sql', 'python')
+
+def _concentration_alert_anchor(session: Session):
+    """Alert dates are anchored on max_price_date so reruns are reproducible."""
+    max_price_date = get_max_price_date(session)
+    if max_price_date is None:
+        raise RuntimeError(
+            "FACT_STOCK_PRICES not found - cannot generate concentration alerts. "
+            "Run generate_market_data.build_price_anchor() first."
+        )
+    return max_price_date
+
+def _concentration_issues_sql(warning_threshold: float) -> str:
+    """Latest holding per portfolio/security at or above the warning threshold, largest first."""
+    database_name = config.DATABASE['name']
+    return f"""
+        WITH latest_holdings AS (
+            SELECT 
+                h.PortfolioID,
+                h.SecurityID,
+                h.PortfolioWeight,
+                h.MarketValue_Base,
+                p.PortfolioName,
+                s.Ticker,
+                s.Description,
+                ROW_NUMBER() OVER (PARTITION BY h.PortfolioID, h.SecurityID ORDER BY h.HoldingDate DESC) as rn
+            FROM {database_name}.CURATED.FACT_POSITION_DAILY_ABOR h
+            JOIN {database_name}.CURATED.DIM_PORTFOLIO p ON h.PortfolioID = p.PortfolioID
+            JOIN {database_name}.CURATED.DIM_SECURITY s ON h.SecurityID = s.SecurityID
+            WHERE h.PortfolioWeight >= {warning_threshold}
+        )
+        SELECT 
+            PortfolioID,
+            SecurityID,
+            PortfolioWeight,
+            MarketValue_Base,
+            PortfolioName,
+            Ticker,
+            Description,
+            ROW_NUMBER() OVER (ORDER BY PortfolioWeight DESC, PortfolioID, SecurityID) - 1 as AlertRank
+        FROM latest_holdings
+        WHERE rn = 1
+    """
+
+def generate_concentration_breach_alerts(session: Session, strategy: str = 'sql',
+                                         target_table: str = 'FACT_COMPLIANCE_ALERTS'):
     """
     Generate concentration breach alerts by scanning current positions
-    against the 7.0% breach threshold and 6.5% warning threshold.
-    Creates historical alerts for demo purposes (spread over last 30 days).
+    against the config.COMPLIANCE_RULES['concentration'] breach (7.0%) and
+    warning (6.5%) thresholds. Creates historical alerts for demo purposes,
+    spread over the 30 days before the max_price_date anchor.
+    
+    strategy='sql' (default) builds every alert in one INSERT ... SELECT;
+    strategy='python' is the original collect-and-loop implementation with a
+    write_pandas insert, kept as the benchmark baseline. Both produce the same rows.
     
-    Uses batched writes for efficiency per performance-io.mdc.
+    Args:
+        session: Active Snowpark session
+        strategy: One of CONCENTRATION_ALERT_STRATEGIES
+        target_table: CURATED table to insert into (benchmarks use a scratch copy)
+    """
+    if strategy not in CONCENTRATION_ALERT_STRATEGIES:
+        raise ValueError(f"Unknown concentration alert strategy '{strategy}' (expected one of {CONCENTRATION_ALERT_STRATEGIES})")
+    if strategy == 'python':
+        return _generate_concentration_breach_alerts_python(session, target_table)
+    
+    database_name = config.DATABASE['name']
+    breach_threshold = config.COMPLIANCE_RULES['concentration']['max_single_issuer']  # 0.07 = 7%
+    warning_threshold = config.COMPLIANCE_RULES['concentration']['warning_threshold']  # 0.065 = 6.5%
+    anchor_date = _concentration_alert_anchor(session)
+    
+    pm_name_cases = ' '.join(
+        f"WHEN {i} THEN '{name}'" for i, name in enumerate(CONCENTRATION_ALERT_PM_NAMES)
+    )
+    
+    result = session.sql(f"""
+        INSERT INTO {database_name}.CURATED.{target_table} (
+            AlertDate, PortfolioID, SecurityID, AlertType, AlertSeverity,
+            OriginalValue, CurrentValue, RequiresAction, ActionDeadline, AlertDescription,
+            ResolvedDate, ResolvedBy, ResolutionNotes
+        )
+        WITH issues AS (
+            {_concentration_issues_sql(warning_threshold)}
+        ),
+        alerts AS (
+            SELECT 
+                i.*,
+                -- Spread alert dates across last 30 days (older alerts for higher concentrations)
+                LEAST(28, 5 + AlertRank * 3) as days_ago,
+                DATEADD(day, -days_ago, '{anchor_date}'::DATE) as alert_date,
+                PortfolioWeight >= {breach_threshold} as is_breach,
+                IFF(is_breach, 'BREACH', 'WARNING') as severity,
+                IFF(is_breach, {round(breach_threshold * 100, 4)}, {round(warning_threshold * 100, 4)}) as threshold_pct,
+                -- Older warnings resolve naturally; every other older breach resolved by the PM
+                CASE
+                    WHEN NOT is_breach AND days_ago > 20 THEN 10
+                    WHEN is_breach AND days_ago > 25 AND MOD(AlertRank, 2) = 0 THEN 15
+                END as days_to_resolve,
+                CASE MOD(AlertRank, {len(CONCENTRATION_ALERT_PM_NAMES)}) {pm_name_cases} END as pm_name
+            FROM issues i
+        )
+        SELECT 
+            alert_date,
+            PortfolioID,
+            SecurityID,
+            IFF(is_breach, 'CONCENTRATION_BREACH', 'CONCENTRATION_WARNING'),
+            severity,
+            TO_VARCHAR(threshold_pct, 'FM990.0') || '%',
+            TO_VARCHAR(PortfolioWeight * 100, 'FM990.0') || '%',
+            is_breach,
+            IFF(is_breach, DATEADD(day, 30, alert_date), NULL),
+            Ticker || ' (' || Description || ') position at ' || TO_VARCHAR(PortfolioWeight * 100, 'FM990.0') || '% '
+                || 'exceeds ' || TO_VARCHAR(threshold_pct, 'FM990.0') || '% ' || LOWER(severity) || ' threshold in '
+                || PortfolioName || '. Market value: $' || TO_VARCHAR(MarketValue_Base, 'FM999,999,999,999,990'),
+            DATEADD(day, days_to_resolve, alert_date),
+            IFF(days_to_resolve IS NULL, NULL, pm_name),
+            CASE days_to_resolve
+                WHEN 10 THEN 'Position weight decreased to below warning threshold through market movement and natural rebalancing.'
+                WHEN 15 THEN 'Position reduced to ' || TO_VARCHAR(threshold_pct - 0.5, 'FM990.0')
+                    || '% per remediation plan. Executed via TWAP over 3 trading days to minimise market impact.'
+            END
+        FROM alerts
+    """).collect()
+    
+    inserted = result[0]['number of rows inserted'] if result else 0
+    if not inserted:
+        log_detail("  No concentration issues found - skipping breach alerts")
+        return
+    
+    counts = session.sql(f"""
+        SELECT 
+            COUNT_IF(AlertSeverity = 'BREACH') as BREACHES,
+            COUNT_IF(AlertSeverity = 'WARNING') as WARNINGS,
+            COUNT_IF(ResolvedDate IS NOT NULL) as RESOLVED
+        FROM {database_name}.CURATED.{target_table}
+        WHERE AlertType IN ('CONCENTRATION_BREACH', 'CONCENTRATION_WARNING')
+    """).collect()[0]
+    log_detail(f"  Generated {inserted} concentration alerts ({counts['BREACHES']} breaches, {counts['WARNINGS']} warnings, "
+               f"{counts['RESOLVED']} resolved, {inserted - counts['RESOLVED']} active)")
+
+
+def _generate_concentration_breach_alerts_python(session: Session, target_table: str):
+    """
+    Original collect-and-loop concentration alert generation (benchmark baseline).
+    
+    Collects the issues, builds each alert in Python and batch inserts them with
+    write_pandas. Alert dates are anchored on max_price_date like the SQL path.
     """
-    from datetime import datetime, timedelta
-    import snowflake_io_utils
     database_name = config.DATABASE['name']
     
     # Ensure database context is set (required for temp stage creation in complex queries)
@@ -2561,44 +2973,18 @@ def generate_concentration_breach_alerts(session: Session):
     
     # Get positions exceeding warning threshold from latest holdings
     concentration_issues = session.sql(f"""
-        WITH latest_holdings AS (
-            SELECT 
-                h.PortfolioID,
-                h.SecurityID,
-                h.PortfolioWeight,
-                h.MarketValue_Base,
-                p.PortfolioName,
-                s.Ticker,
-                s.Description,
-                ROW_NUMBER() OVER (PARTITION BY h.PortfolioID, h.SecurityID ORDER BY h.HoldingDate DESC) as rn
-            FROM {database_name}.CURATED.FACT_POSITION_DAILY_ABOR h
-            JOIN {database_name}.CURATED.DIM_PORTFOLIO p ON h.PortfolioID = p.PortfolioID
-            JOIN {database_name}.CURATED.DIM_SECURITY s ON h.SecurityID = s.SecurityID
-            WHERE h.PortfolioWeight >= {warning_threshold}
-        )
-        SELECT 
-            PortfolioID,
-            SecurityID,
-            PortfolioWeight,
-            MarketValue_Base,
-            PortfolioName,
-            Ticker,
-            Description
-        FROM latest_holdings
-        WHERE rn = 1
-        ORDER BY PortfolioWeight DESC
+        {_concentration_issues_sql(warning_threshold)}
+        ORDER BY AlertRank
     """).collect()
     
     if not concentration_issues:
         log_detail("  No concentration issues found - skipping breach alerts")
         return
     
-    # Generate alerts with dates spread over last 30 days for demo realism
-    today = datetime.now().date()
+    # Generate alerts with dates spread over the 30 days before the anchor date
+    anchor_date = date.fromisoformat(str(_concentration_alert_anchor(session)))
     rows = []
-    
-    # PM names for resolved breaches (demo data)
-    pm_names = ['Anna Chen', 'David Martinez', 'Sarah Thompson', 'Michael Roberts']
+    pm_names = CONCENTRATION_ALERT_PM_NAMES
     
     for i, issue in enumerate(concentration_issues):
         weight_pct = float(issue['PORTFOLIOWEIGHT']) * 100
@@ -2606,7 +2992,7 @@ def generate_concentration_breach_alerts(session: Session):
         
         # Spread alert dates across last 30 days (older alerts for higher concentrations)
         days_ago = min(28, 5 + i * 3)  # First alerts 5-28 days ago
-        alert_date = today - timedelta(days=days_ago)
+        alert_date = anchor_date - timedelta(days=days_ago)
         action_deadline = alert_date + timedelta(days=30)
         
         severity = 'BREACH' if is_breach else 'WARNING'
@@ -2659,7 +3045,7 @@ def generate_concentration_breach_alerts(session: Session):
         df = pd.DataFrame(rows)
         df.columns = [col.upper() for col in df.columns]
         session.write_pandas(
-            df, 'FACT_COMPLIANCE_ALERTS',
+            df, target_table,
             database=database_name, schema='CURATED',
             quote_identifiers=False, overwrite=False, auto_create_table=False
         )
@@ -2670,6 +3056,58 @@ def generate_concentration_breach_alerts(session: Session):
         log_detail(f"  Generated {len(rows)} concentration alerts ({breach_count} breaches, {warning_count} warnings, {resolved_count} resolved, {active_count} active)")
 
 
+def benchmark_concentration_alerts(session: Session, iterations: int = 3) -> dict:
+    """
+    Compare the set-based and Python-loop concentration alert strategies.
+    
+    Each strategy writes into its own scratch copy of FACT_COMPLIANCE_ALERTS
+    (truncated before every iteration), then the two outputs are diffed
+    column-by-column (excluding AlertID) to confirm they match.
+    
+    Returns:
+        Dict with per-strategy wall-clock timings (seconds) and 'mismatched_rows'
+    """
+    database_name = config.DATABASE['name']
+    curated = f"{database_name}.CURATED"
+    columns = ("AlertDate, PortfolioID, SecurityID, AlertType, AlertSeverity, OriginalValue, CurrentValue, "
+               "RequiresAction, ActionDeadline, AlertDescription, ResolvedDate, ResolvedBy, ResolutionNotes")
+    scratch_tables = {strategy: f"FACT_COMPLIANCE_ALERTS_BENCH_{strategy.upper()}" for strategy in CONCENTRATION_ALERT_STRATEGIES}
+    
+    log_info(f"Benchmarking concentration alert strategies ({iterations} iterations)")
+    results = {}
+    try:
+        for strategy, scratch_table in scratch_tables.items():
+            session.sql(f"CREATE OR REPLACE TRANSIENT TABLE {curated}.{scratch_table} LIKE {curated}.FACT_COMPLIANCE_ALERTS").collect()
+            timings = []
+            for _ in range(iterations):
+                session.sql(f"TRUNCATE TABLE {curated}.{scratch_table}").collect()
+                started = time.perf_counter()
+                generate_concentration_breach_alerts(session, strategy=strategy, target_table=scratch_table)
+                timings.append(time.perf_counter() - started)
+            results[strategy] = timings
+            log_info(f"  {strategy}: min {min(timings):.2f}s, mean {sum(timings) / len(timings):.2f}s")
+        
+        mismatched = session.sql(f"""
+            SELECT COUNT(*) AS CNT FROM (
+                (SELECT {columns} FROM {curated}.{scratch_tables['sql']}
+                 EXCEPT SELECT {columns} FROM {curated}.{scratch_tables['python']})
+                UNION ALL
+                (SELECT {columns} FROM {curated}.{scratch_tables['python']}
+                 EXCEPT SELECT {columns} FROM {curated}.{scratch_tables['sql']})
+            )
+        """).collect()[0]['CNT']
+        results['mismatched_rows'] = mismatched
+        
+        python_best, sql_best = min(results['python']), min(results['sql'])
+        speedup = f"{python_best / sql_best:.1f}x" if sql_best else "n/a"
+        log_info(f"  Set-based speedup: {speedup}; mismatched rows: {mismatched}")
+    finally:
+        for scratch_table in scratch_tables.values():
+            session.sql(f"DROP TABLE IF EXISTS {curated}.{scratch_table}").collect()
+    
+    return results
+
+
 def generate_demo_pre_screened_replacements(session: Session):
     """
     Generate pre-screened replacement candidates for the demo scenario.
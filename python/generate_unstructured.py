@@ -34,7 +34,8 @@ import config
 import hydration_engine
 from logging_utils import log_warning, log_error, log_success
 
-def build_all(session: Session, document_types: List[str], test_mode: bool = False):
+def build_all(session: Session, document_types: List[str], test_mode: bool = False,
+              incremental: bool = False):
     """
     Build all unstructured data for the specified document types using template hydration.
     
@@ -42,6 +43,7 @@ def build_all(session: Session, document_types: List[str], test_mode: bool = Fal
         session: Active Snowpark session
         document_types: List of document types to generate (use ['all'] for all types)
         test_mode: If True, use reduced document counts for faster development
+        incremental: If True, only re-render documents whose template or context changed
     """
     
     # Expand 'all' to actual document types from config
@@ -64,7 +66,8 @@ def build_all(session: Session, document_types: List[str], test_mode: bool = Fal
             continue
         
         try:
-            count = hydration_engine.hydrate_documents(session, doc_type, test_mode=test_mode)
+            count = hydration_engine.hydrate_documents(session, doc_type, test_mode=test_mode,
+                                                       incremental=incremental)
         except Exception as e:
             log_error(f" Failed to hydrate {doc_type}: {e}")
             # Continue with other document types
@@ -31,15 +31,20 @@ Modules:
 
 import os
 import re
+import json
 import yaml
 import random
 import hashlib
+import tempfile
+import threading
+import time
+import zipfile
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, date
 from snowflake.snowpark import Session
 import config
 import rules_loader
-from logging_utils import log_warning
+from logging_utils import log_warning, log_detail
 from demo_helpers import get_demo_company_priority_sql
 from db_helpers import get_max_price_date
 
@@ -47,6 +52,16 @@ from db_helpers import get_max_price_date
 # Set by hydrate_documents() to max_price_date from stock prices
 _anchor_date: Optional[date] = None
 
+def _stable_hash(value: str) -> int:
+    """MD5-based integer hash, stable across processes (Python's hash() is randomized per-process)."""
+    return int(hashlib.md5(value.encode('utf-8')).hexdigest(), 16)
+
+def _reference_datetime() -> datetime:
+    """Reference 'today' for document dates: the anchor date once set, so contexts are reproducible."""
+    if _anchor_date:
+        return datetime.combine(_anchor_date, datetime.min.time())
+    return datetime.now()
+
 # ============================================================================
 # MODULE: Content Loader
 # ============================================================================
@@ -87,6 +102,9 @@ def load_templates(doc_type: str) -> List[Dict[str, Any]]:
     if not templates:
         raise ValueError(f"No templates found for {doc_type} in {template_path}")
     
+    # Build the selection index once per load (see select_template)
+    _template_indexes[doc_type] = build_template_index(templates)
+    
     return templates
 
 def load_single_template(file_path: str) -> Optional[Dict[str, Any]]:
@@ -97,7 +115,8 @@ def load_single_template(file_path: str) -> Optional[Dict[str, Any]]:
         file_path: Path to template markdown file
     
     Returns:
-        Dict with 'metadata', 'body', and 'file_path' or None if parsing fails
+        Dict with 'metadata', 'body', 'file_path' and 'content_hash' (SHA-256 of the
+        file) or None if parsing fails
     """
     try:
         # Skip partials directory - these are loaded separately
@@ -135,7 +154,8 @@ def load_single_template(file_path: str) -> Optional[Dict[str, Any]]:
         return {
             'metadata': metadata,
             'body': body,
-            'file_path': file_path
+            'file_path': file_path,
+            'content_hash': hashlib.sha256(content.encode('utf-8')).hexdigest()
         }
         
     except Exception as e:
@@ -167,13 +187,66 @@ def load_sub_template(partial_name: str, base_template_path: str) -> str:
 # MODULE: Variant Picker
 # ============================================================================
 
-def select_template(templates: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+# Template selection indexes keyed by doc_type (built by load_templates)
+_template_indexes: Dict[str, Dict[str, Any]] = {}
+
+def build_template_index(templates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Index templates by the metadata select_template routes on, preserving
+    template order within each bucket.
+    
+    Returns:
+        Dict with 'templates', 'by_sector' (sector tag -> templates),
+        'by_meeting_type' (meeting_type -> first template) and 'candidates'
+        (memoized sector-matched candidates per (SIC description, GICS sector))
+    """
+    by_sector: Dict[str, List[Dict[str, Any]]] = {}
+    by_meeting_type: Dict[str, Dict[str, Any]] = {}
+    for template in templates:
+        metadata = template.get('metadata', {})
+        for tag in dict.fromkeys(metadata.get('sector_tags', [])):
+            by_sector.setdefault(tag, []).append(template)
+        meeting_type = metadata.get('meeting_type', '').lower()
+        if meeting_type:
+            by_meeting_type.setdefault(meeting_type, template)
+    return {
+        'templates': templates,
+        'by_sector': by_sector,
+        'by_meeting_type': by_meeting_type,
+        'candidates': {},
+    }
+
+def get_template_index(doc_type: str, templates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the index built for these templates, building one if they were not loaded via load_templates."""
+    index = _template_indexes.get(doc_type)
+    if index is None or index['templates'] is not templates:
+        index = build_template_index(templates)
+        _template_indexes[doc_type] = index
+    return index
+
+def _sector_candidates(index: Dict[str, Any], entity_sector: str, gics_sector: str) -> List[Dict[str, Any]]:
+    """Templates tagged with the entity's SIC description or GICS sector (all templates if none), in template order."""
+    key = (entity_sector, gics_sector)
+    candidates = index['candidates'].get(key)
+    if candidates is None:
+        matched = {id(t): t for t in index['by_sector'].get(entity_sector, [])}
+        matched.update((id(t), t) for t in index['by_sector'].get(gics_sector, []))
+        candidates = [t for t in index['templates'] if id(t) in matched] if matched else index['templates']
+        index['candidates'][key] = candidates
+    return candidates
+
+def select_template(templates: List[Dict[str, Any]], context: Dict[str, Any],
+                    template_index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Deterministically select template variant based on entity and context.
     
+    Candidates come from the per-doc-type index (build_template_index), so
+    selection is a dict lookup plus the MD5 pick regardless of library size.
+    
     Args:
         templates: List of available templates
         context: Entity context with SecurityID, sector, etc.
+        template_index: Index for these templates (defaults to get_template_index)
     
     Returns:
         Selected template dict
@@ -196,37 +269,28 @@ def select_template(templates: List[Dict[str, Any]], context: Dict[str, Any]) ->
         template_index = doc_num % len(templates)
         return templates[template_index]
     
+    if template_index is None:
+        template_index = get_template_index(doc_type, templates)
+    
     # Meeting type-based routing for engagement notes
-    # If context has MEETING_TYPE, find templates that match that meeting_type
+    # If context has MEETING_TYPE, use the first template for that meeting_type
     meeting_type = context.get('MEETING_TYPE', '')
     if meeting_type and doc_type == 'engagement_notes':
         # Convert meeting type to template metadata format (lowercase, underscore)
         meeting_type_key = meeting_type.lower().replace(' ', '_')
-        meeting_matched = [
-            t for t in templates
-            if t.get('metadata', {}).get('meeting_type', '').lower() == meeting_type_key
-        ]
+        meeting_matched = template_index['by_meeting_type'].get(meeting_type_key)
         if meeting_matched:
             # Use the meeting-type specific template
-            return meeting_matched[0]
+            return meeting_matched
     
     # Sector-aware routing: map SIC description to GICS sector for template matching
-    entity_sector = context.get('SIC_DESCRIPTION', '')
+    entity_sector = context.get('SIC_DESCRIPTION') or ''
     
     # Map SIC descriptions to GICS sectors for template matching
     gics_sector = map_sic_to_gics(entity_sector)
     
-    # Filter templates matching entity sector (check both SIC description and mapped GICS sector)
-    sector_matched = [
-        t for t in templates 
-        if any([
-            entity_sector in t['metadata'].get('sector_tags', []),
-            gics_sector in t['metadata'].get('sector_tags', [])
-        ])
-    ]
-    
-    # Use sector-matched templates if available, otherwise use all templates
-    candidate_templates = sector_matched if sector_matched else templates
+    # Templates matching entity sector (SIC description or mapped GICS sector), else all templates
+    candidate_templates = _sector_candidates(template_index, entity_sector, gics_sector)
     
     # Deterministic selection using MD5 hash (Python's hash() is randomized per-process)
     hash_input = f"{entity_id}:{doc_type}:{config.RNG_SEED}".encode('utf-8')
@@ -236,26 +300,58 @@ def select_template(templates: List[Dict[str, Any]], context: Dict[str, Any]) ->
     
     return selected
 
+# One compiled keyword pattern per GICS sector (config order = match priority)
+_gics_matchers: Optional[List[Tuple[str, Any]]] = None
+
+# SIC description -> GICS sector, resolved once per run (seeded from RAW.SIC_GICS_HYDRATION_CACHE)
+_sic_to_gics_cache: Dict[str, str] = {}
+
 def map_sic_to_gics(sic_description: str) -> str:
     """
     Map SIC industry description to GICS sector for template matching.
     Uses centralized mapping from config.SIC_TO_GICS_MAPPING.
     
+    Each distinct description is matched once (first sector in config order
+    with any keyword as a case-insensitive substring) and memoized.
+    
     Args:
         sic_description: SIC industry description from DIM_ISSUER
     
     Returns:
         GICS sector name
     """
-    sic_lower = sic_description.lower()
+    gics_sector = _sic_to_gics_cache.get(sic_description)
+    if gics_sector is not None:
+        return gics_sector
+    
+    global _gics_matchers
+    if _gics_matchers is None:
+        _gics_matchers = [
+            (sector, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+            for sector, keywords in config.SIC_TO_GICS_MAPPING.items()
+        ]
     
-    # Check each GICS sector's keywords from config
-    for gics_sector, keywords in config.SIC_TO_GICS_MAPPING.items():
-        if any(keyword in sic_lower for keyword in keywords):
-            return gics_sector
+    sic_lower = sic_description.lower()
     
-    # Default to empty if no match
-    return ''
+    # Check each GICS sector's keywords from config (default to empty if no match)
+    gics_sector = next((sector for sector, matcher in _gics_matchers if matcher.search(sic_lower)), '')
+    _sic_to_gics_cache[sic_description] = gics_sector
+    return gics_sector
+
+def preload_sic_to_gics(session: Session):
+    """
+    Seed the map_sic_to_gics memo from RAW.SIC_GICS_HYDRATION_CACHE (one query),
+    built by the structured build with the same keyword rules. Missing table is
+    not an error - descriptions are then matched on first use.
+    """
+    try:
+        rows = session.sql(f"""
+            SELECT SIC_DESCRIPTION, GICS_SECTOR
+            FROM {config.DATABASE['name']}.{config.DATABASE['schemas']['raw']}.SIC_GICS_HYDRATION_CACHE
+        """).collect()
+    except Exception:
+        return
+    _sic_to_gics_cache.update({row['SIC_DESCRIPTION']: row['GICS_SECTOR'] or '' for row in rows})
 
 def select_portfolio_review_variant(templates: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -538,11 +634,10 @@ def get_breach_context_for_issuer(session: Session, issuer_id: int) -> Optional[
     except:
         target_weight = '6.0'
     
-    # Calculate days outstanding
-    from datetime import datetime
+    # Calculate days outstanding (alerts are dated relative to the same anchor date)
     alert_date = b['ALERTDATE']
     if alert_date:
-        days_outstanding = (datetime.now().date() - alert_date).days
+        days_outstanding = (_reference_datetime().date() - alert_date).days
     else:
         days_outstanding = 10
     
@@ -560,32 +655,15 @@ def get_breach_context_for_issuer(session: Session, issuer_id: int) -> Optional[
     }
 
 
-def prefetch_issuers_with_breaches(session: Session) -> set:
-    """
-    Get set of IssuerIDs that have concentration breaches or warnings.
-    
-    Used to determine which issuers should get "Compliance Discussion" 
-    meeting type for engagement notes.
-    
-    Args:
-        session: Snowpark session
-    
-    Returns:
-        Set of IssuerIDs that have breach/warning alerts
-    """
+def issuers_with_breaches_sql() -> str:
+    """IssuerIDs with concentration breaches or warnings (Compliance Discussion meeting type)."""
     database_name = config.DATABASE['name']
-    
-    try:
-        result = session.sql(f"""
+    return f"""
             SELECT DISTINCT s.IssuerID
             FROM {database_name}.CURATED.FACT_COMPLIANCE_ALERTS ca
             JOIN {database_name}.CURATED.DIM_SECURITY s ON ca.SecurityID = s.SecurityID
             WHERE ca.AlertType IN ('CONCENTRATION_BREACH', 'CONCENTRATION_WARNING')
-        """).collect()
-        return {row['ISSUERID'] for row in result}
-    except Exception as e:
-        log_warning(f"  Could not prefetch breach data: {e}")
-        return set()
+        """
 
 
 # ============================================================================
@@ -661,7 +739,7 @@ def generate_dates_for_doc_type(doc_type: str, context: Optional[Dict[str, Any]]
     Returns:
         Dict with date placeholders
     """
-    current_date = datetime.now()
+    current_date = _reference_datetime()
     
     dates = {}
     
@@ -743,6 +821,23 @@ def generate_dates_for_doc_type(doc_type: str, context: Optional[Dict[str, Any]]
 # MODULE: Provider and Attribution Context
 # ============================================================================
 
+# Investment memo competitor sets by sector family
+TECH_COMPETITORS = ['Salesforce', 'Oracle', 'SAP', 'Adobe', 'ServiceNow', 'Workday', 'Splunk', 'Datadog']
+HEALTHCARE_COMPETITORS = ['Pfizer', 'Johnson & Johnson', 'AbbVie', 'Merck', 'Bristol-Myers Squibb', 'Eli Lilly']
+FINANCIAL_COMPETITORS = ['JPMorgan', 'Bank of America', 'Goldman Sachs', 'Morgan Stanley', 'Wells Fargo']
+
+NGO_CATEGORIES = ['environmental', 'social', 'governance']
+CARBON_NEUTRAL_STATUSES = ['carbon neutrality in Scope 1 and 2 emissions', 'working toward carbon neutrality', 'committed to net-zero by 2030']
+
+# Engagement meeting types for issuers without breach data (only types with matching templates),
+# as (values, cumulative weights)
+NON_COMPLIANCE_MEETING_TYPES = (['Management Meeting', 'Shareholder Call'], [0.60, 1.00])
+
+PRESS_RELEASE_CITIES = ['New York', 'San Francisco', 'Boston', 'Seattle', 'London', 'Frankfurt']
+PRESS_RELEASE_DRUG_NAMES = ['InnovaRx', 'BioAdvance', 'TherapX', 'MediCure', 'HealthPlus']
+PRESS_RELEASE_INDICATIONS = ['Type 2 Diabetes', 'Cardiovascular Disease', 'Oncology', 'Immunology']
+PRESS_RELEASE_PRODUCTS = ['Cloud Platform', 'AI Suite', 'Analytics Dashboard', 'Security Solution', 'Mobile App', 'Data Platform']
+
 def generate_provider_context(context: Dict[str, Any], doc_type: str, 
                               issuers_with_breaches: Optional[set] = None) -> Dict[str, Any]:
     """
@@ -763,11 +858,11 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
     if doc_type in ['broker_research', 'internal_research', 'investment_memo']:
         # Select fictional broker from YAML rules
         fictional_brokers = rules_loader.get_fictional_brokers()
-        broker_index = hash(f"{entity_id}:broker:{config.RNG_SEED}") % len(fictional_brokers)
+        broker_index = _stable_hash(f"{entity_id}:broker:{config.RNG_SEED}") % len(fictional_brokers)
         provider_context['BROKER_NAME'] = fictional_brokers[broker_index]
         
         # Generate analyst name
-        analyst_id = (hash(f"{entity_id}:analyst:{config.RNG_SEED}") % 100) + 1
+        analyst_id = (_stable_hash(f"{entity_id}:analyst:{config.RNG_SEED}") % 100) + 1
         provider_context['ANALYST_NAME'] = f'Analyst_{analyst_id:02d}'
         
         # Select rating from distribution
@@ -778,20 +873,16 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
             provider_context['PORTFOLIO_NAME'] = config.DEFAULT_DEMO_PORTFOLIO
         
         # Add investment memo specific placeholders (competitors, etc.)
-        tech_competitors = ['Salesforce', 'Oracle', 'SAP', 'Adobe', 'ServiceNow', 'Workday', 'Splunk', 'Datadog']
-        healthcare_competitors = ['Pfizer', 'Johnson & Johnson', 'AbbVie', 'Merck', 'Bristol-Myers Squibb', 'Eli Lilly']
-        financial_competitors = ['JPMorgan', 'Bank of America', 'Goldman Sachs', 'Morgan Stanley', 'Wells Fargo']
-        
         sector = context.get('SIC_DESCRIPTION', 'Information Technology')
         if 'Health' in sector or 'Pharma' in sector or 'Medical' in sector:
-            competitors = healthcare_competitors
+            competitors = HEALTHCARE_COMPETITORS
         elif 'Financ' in sector or 'Bank' in sector or 'Insurance' in sector:
-            competitors = financial_competitors
+            competitors = FINANCIAL_COMPETITORS
         else:
-            competitors = tech_competitors
+            competitors = TECH_COMPETITORS
         
         # Select 3 different competitors deterministically
-        comp1_idx = hash(f"{entity_id}:comp1:{config.RNG_SEED}") % len(competitors)
+        comp1_idx = _stable_hash(f"{entity_id}:comp1:{config.RNG_SEED}") % len(competitors)
         comp2_idx = (comp1_idx + 1) % len(competitors)
         comp3_idx = (comp1_idx + 2) % len(competitors)
         provider_context['COMPETITOR_1'] = competitors[comp1_idx]
@@ -800,12 +891,12 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
     
     elif doc_type == 'ngo_reports':
         # Determine ESG category (from template or random)
-        category = context.get('_category', random.choice(['environmental', 'social', 'governance']))
+        category = context.get('_category', random.choice(NGO_CATEGORIES))
         
         # Select NGO from appropriate category (from YAML rules)
         fictional_ngos = rules_loader.get_fictional_ngos()
         category_ngos = fictional_ngos.get(category, fictional_ngos.get('environmental', []))
-        ngo_index = hash(f"{entity_id}:ngo:{category}:{config.RNG_SEED}") % len(category_ngos) if category_ngos else 0
+        ngo_index = _stable_hash(f"{entity_id}:ngo:{category}:{config.RNG_SEED}") % len(category_ngos) if category_ngos else 0
         provider_context['NGO_NAME'] = category_ngos[ngo_index] if category_ngos else 'Global Sustainability Watch'
         
         # Select severity level
@@ -814,7 +905,7 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
         # Add environmental metrics
         provider_context['EMISSIONS_INCREASE'] = str(random.randint(5, 25))
         provider_context['EMISSIONS_REDUCTION'] = str(random.randint(5, 20))
-        provider_context['CARBON_NEUTRAL_STATUS'] = random.choice(['carbon neutrality in Scope 1 and 2 emissions', 'working toward carbon neutrality', 'committed to net-zero by 2030'])
+        provider_context['CARBON_NEUTRAL_STATUS'] = random.choice(CARBON_NEUTRAL_STATUSES)
         
         # Add governance metrics
         provider_context['BOARD_SIZE'] = str(random.randint(8, 15))
@@ -834,21 +925,8 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
             provider_context['MEETING_TYPE'] = 'Compliance Discussion'
         else:
             # No breach data - use other meeting types (exclude Compliance Discussion)
-            # Only include meeting types that have matching templates
-            non_compliance_types = {
-                'Management Meeting': 0.60,
-                'Shareholder Call': 0.40
-            }
-            # Select from distribution excluding Compliance Discussion
-            rand_val = random.random()
-            cumulative = 0.0
-            selected = 'Management Meeting'
-            for meeting_type, weight in non_compliance_types.items():
-                cumulative += weight
-                if rand_val <= cumulative:
-                    selected = meeting_type
-                    break
-            provider_context['MEETING_TYPE'] = selected
+            meeting_types, cum_weights = NON_COMPLIANCE_MEETING_TYPES
+            provider_context['MEETING_TYPE'] = random.choices(meeting_types, cum_weights=cum_weights)[0]
         
         # Add ESG engagement metrics
         provider_context['EMISSIONS_REDUCTION'] = str(random.randint(5, 20))
@@ -860,27 +938,26 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
         provider_context['SUPPLIER_ISSUES'] = str(random.randint(3, 15))
         provider_context['CERT_QUARTER'] = f'Q{random.randint(1, 4)}'
         provider_context['NEXT_QUARTER'] = f'Q{random.randint(1, 4)}'
-        provider_context['NEXT_YEAR'] = str(datetime.now().year + 1)
+        provider_context['NEXT_YEAR'] = str(_reference_datetime().year + 1)
     
     elif doc_type == 'press_releases':
         # Add common press release fields
-        cities = ['New York', 'San Francisco', 'Boston', 'Seattle', 'London', 'Frankfurt']
-        city_index = hash(f"{entity_id}:city:{config.RNG_SEED}") % len(cities)
-        provider_context['CITY'] = cities[city_index]
+        city_index = _stable_hash(f"{entity_id}:city:{config.RNG_SEED}") % len(PRESS_RELEASE_CITIES)
+        provider_context['CITY'] = PRESS_RELEASE_CITIES[city_index]
         
         # Generate executive name deterministically
-        ceo_id = hash(f"{entity_id}:ceo:{config.RNG_SEED}") % 100
+        ceo_id = _stable_hash(f"{entity_id}:ceo:{config.RNG_SEED}") % 100
         provider_context['CEO_NAME'] = f'CEO_{ceo_id:02d}'
         
-        cfo_id = hash(f"{entity_id}:cfo:{config.RNG_SEED}") % 100
+        cfo_id = _stable_hash(f"{entity_id}:cfo:{config.RNG_SEED}") % 100
         provider_context['CFO_NAME'] = f'CFO_{cfo_id:02d}'
         
         # Acquisition-specific
         provider_context['TARGET_COMPANY'] = 'Digital Solutions Inc.'
-        provider_context['NEXT_YEAR'] = str(datetime.now().year + 1)
+        provider_context['NEXT_YEAR'] = str(_reference_datetime().year + 1)
         
         # Earnings press release placeholders
-        quarter_date = datetime.now() - timedelta(days=random.randint(0, 90))
+        quarter_date = _reference_datetime() - timedelta(days=random.randint(0, 90))
         quarter_end = quarter_date.replace(day=1) + timedelta(days=32)
         quarter_end = quarter_end.replace(day=1) - timedelta(days=1)
         provider_context['QUARTER_END_DATE'] = quarter_end.strftime('%d %B %Y')
@@ -889,13 +966,11 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
         provider_context['GUIDANCE_GROWTH'] = str(round(random.uniform(10, 25), 0))
         
         # Healthcare press release specific
-        drug_names = ['InnovaRx', 'BioAdvance', 'TherapX', 'MediCure', 'HealthPlus']
-        drug_index = hash(f"{entity_id}:drug:{config.RNG_SEED}") % len(drug_names)
-        provider_context['DRUG_NAME'] = drug_names[drug_index]
+        drug_index = _stable_hash(f"{entity_id}:drug:{config.RNG_SEED}") % len(PRESS_RELEASE_DRUG_NAMES)
+        provider_context['DRUG_NAME'] = PRESS_RELEASE_DRUG_NAMES[drug_index]
         
-        indications = ['Type 2 Diabetes', 'Cardiovascular Disease', 'Oncology', 'Immunology']
-        indication_index = hash(f"{entity_id}:indication:{config.RNG_SEED}") % len(indications)
-        provider_context['INDICATION'] = indications[indication_index]
+        indication_index = _stable_hash(f"{entity_id}:indication:{config.RNG_SEED}") % len(PRESS_RELEASE_INDICATIONS)
+        provider_context['INDICATION'] = PRESS_RELEASE_INDICATIONS[indication_index]
         
         provider_context['TRIAL_PATIENTS'] = f'{random.randint(500, 3000):,}'
         provider_context['MARKET_SIZE'] = str(random.randint(5, 50))
@@ -908,16 +983,15 @@ def generate_provider_context(context: Dict[str, Any], doc_type: str,
         provider_context['PRIMARY_ENDPOINT'] = 'HbA1c reduction'
         provider_context['SECONDARY_ENDPOINTS'] = 'weight loss and cardiovascular safety'
         provider_context['LAUNCH_QUARTER'] = f'Q{random.randint(1, 4)}'
-        provider_context['LAUNCH_YEAR'] = str(datetime.now().year + 1)
+        provider_context['LAUNCH_YEAR'] = str(_reference_datetime().year + 1)
         
         # Acquisition specific
         provider_context['CLOSE_QUARTER'] = f'Q{random.randint(1, 4)}'
-        provider_context['CLOSE_YEAR'] = str(datetime.now().year)
+        provider_context['CLOSE_YEAR'] = str(_reference_datetime().year)
         
         # Product launch placeholders  
-        products = ['Cloud Platform', 'AI Suite', 'Analytics Dashboard', 'Security Solution', 'Mobile App', 'Data Platform']
-        product_index = hash(f"{entity_id}:product:{config.RNG_SEED}") % len(products)
-        provider_context['PRODUCT_CATEGORY'] = products[product_index]
+        product_index = _stable_hash(f"{entity_id}:product:{config.RNG_SEED}") % len(PRESS_RELEASE_PRODUCTS)
+        provider_context['PRODUCT_CATEGORY'] = PRESS_RELEASE_PRODUCTS[product_index]
     
     return provider_context
 
@@ -931,99 +1005,161 @@ def select_from_distribution(distribution_name: str) -> str:
     Returns:
         Selected value
     """
-    # Load distributions from numeric_bounds.yaml (simplified for now)
-    distributions = {
-        'rating': {
-            'Strong Buy': 0.10,
-            'Buy': 0.25,
-            'Hold': 0.45,
-            'Sell': 0.15,
-            'Strong Sell': 0.05
-        },
-        'severity_level': {
-            'High': 0.20,
-            'Medium': 0.40,
-            'Low': 0.40
-        },
-        'meeting_type': {
-            'Management Meeting': 0.40,
-            'Shareholder Call': 0.25,
-            'Site Visit': 0.15,
-            'Compliance Discussion': 0.20
-        }
-    }
-    
-    if distribution_name not in distributions:
+    # Precompiled from numeric_bounds.yaml distributions
+    try:
+        values, cum_weights = rules_loader.get_distribution(distribution_name)
+    except KeyError:
         raise ValueError(f"Unknown distribution: {distribution_name}")
     
-    dist = distributions[distribution_name]
-    values = list(dist.keys())
-    weights = list(dist.values())
-    
-    return random.choices(values, weights=weights)[0]
+    return random.choices(values, cum_weights=cum_weights)[0]
 
 # ============================================================================
 # MODULE: Numeric Rules (Tier 1)
 # ============================================================================
 
-def generate_tier1_numerics(context: Dict[str, Any], doc_type: str) -> Dict[str, Any]:
+# Placeholder name -> decimal places (memoized; derived from the name only)
+_numeric_precision_cache = {}
+
+def _numeric_precision(placeholder: str) -> int:
+    """Get rounding precision for a Tier 1 placeholder based on its name."""
+    digits = _numeric_precision_cache.get(placeholder)
+    if digits is not None:
+        return digits
+    
+    # Format based on placeholder type
+    if 'PCT' in placeholder or 'MARGIN' in placeholder or 'GROWTH' in placeholder:
+        digits = 1
+    elif 'BILLIONS' in placeholder:
+        digits = 2
+    elif '_USD' in placeholder or 'PRICE' in placeholder or 'TARGET' in placeholder:
+        digits = 2
+    elif 'RATIO' in placeholder:
+        digits = 1
+    elif 'REVENUE' in placeholder or 'PROFIT' in placeholder or 'INCOME' in placeholder:
+        digits = 2
+    elif 'SPEND' in placeholder or 'OPEX' in placeholder or 'CASH' in placeholder:
+        digits = 2
+    elif 'AMOUNT' in placeholder or 'FLOW' in placeholder or 'BALANCE' in placeholder:
+        digits = 2
+    elif 'RATE' in placeholder:
+        digits = 1
+    else:
+        digits = 2
+    
+    _numeric_precision_cache[placeholder] = digits
+    return digits
+
+def get_tier1_rng(doc_type: str, entity_id: Any) -> random.Random:
+    """
+    Independent Tier 1 random stream for one document.
+    
+    Seeded from a stable string key (str seeds are hashed with SHA-512, not hash()),
+    so draws are identical across processes and threads and never touch the global RNG.
+    """
+    return random.Random(f"{config.RNG_SEED}:tier1:{doc_type}:{entity_id}")
+
+def _tier1_entity(context: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Entity key and sector that determine a document's Tier 1 stream and bounds."""
+    entity_id = context.get('SECURITY_ID') or context.get('PORTFOLIO_ID') or 0
+    sector = context.get('SIC_DESCRIPTION', 'Information Technology')
+    return entity_id, sector
+
+def generate_tier1_numerics(context: Dict[str, Any], doc_type: str,
+                            tier1_samples: Optional[Dict[Any, Dict[str, float]]] = None) -> Dict[str, Any]:
     """
     Generate Tier 1 numeric placeholders by sampling within sector-specific bounds.
     
     ONLY fills missing placeholders - does not overwrite values already set in context.
     This allows SEC financial metrics (injected earlier) to take precedence over sampling.
     
+    All values for a document come from its own stream (get_tier1_rng), drawn in bounds
+    order. A draw is consumed for every placeholder, including skipped ones, so each
+    placeholder's value does not depend on which others were pre-set.
+    
     Args:
         context: Existing context with sector info (may contain pre-set financial metrics)
         doc_type: Document type
+        tier1_samples: Optional output of sample_tier1_numerics_batch(); used instead of
+                       sampling when it has values for this entity
     
     Returns:
         Dict with Tier 1 numeric placeholders (only for keys not already in context)
     """
-    numerics = {}
-    entity_id = context.get('SECURITY_ID') or context.get('PORTFOLIO_ID') or 0
-    sector = context.get('SIC_DESCRIPTION', 'Information Technology')
+    entity_id, sector = _tier1_entity(context)
+    
+    sampled = tier1_samples.get(entity_id) if tier1_samples else None
+    if sampled is None:
+        sampled = sample_tier1_numerics(doc_type, entity_id, sector)
     
+    # Skip placeholders that already have values (e.g., from SEC financial data)
+    return {
+        placeholder: value for placeholder, value in sampled.items()
+        if context.get(placeholder) is None
+    }
+
+def sample_tier1_numerics(doc_type: str, entity_id: Any, sector: Any) -> Dict[str, float]:
+    """Sample every Tier 1 placeholder for one entity (scalar path)."""
     # Load numeric bounds from YAML rules
     bounds = rules_loader.get_numeric_bounds(doc_type, sector)
+    if not bounds:
+        return {}
     
-    # Sample each numeric placeholder deterministically (ONLY if not already set)
+    numerics = {}
+    rng = get_tier1_rng(doc_type, entity_id)
     for placeholder, bound_spec in bounds.items():
-        # Skip placeholders that already have values (e.g., from SEC financial data)
-        if placeholder in context and context[placeholder] is not None:
-            continue
-        
-        seed = config.RNG_SEED + hash(str(entity_id)) + hash(doc_type) + hash(placeholder)
-        random.seed(seed)
-        
         min_val = bound_spec.get('min', 0)
         max_val = bound_spec.get('max', 100)
         
         # Generate value within bounds
-        value = random.uniform(min_val, max_val)
+        value = rng.uniform(min_val, max_val)
         
-        # Format based on placeholder type
-        if 'PCT' in placeholder or 'MARGIN' in placeholder or 'GROWTH' in placeholder:
-            numerics[placeholder] = round(value, 1)
-        elif 'BILLIONS' in placeholder:
-            numerics[placeholder] = round(value, 2)
-        elif '_USD' in placeholder or 'PRICE' in placeholder or 'TARGET' in placeholder:
-            numerics[placeholder] = round(value, 2)
-        elif 'RATIO' in placeholder:
-            numerics[placeholder] = round(value, 1)
-        elif 'REVENUE' in placeholder or 'PROFIT' in placeholder or 'INCOME' in placeholder:
-            numerics[placeholder] = round(value, 2)
-        elif 'SPEND' in placeholder or 'OPEX' in placeholder or 'CASH' in placeholder:
-            numerics[placeholder] = round(value, 2)
-        elif 'AMOUNT' in placeholder or 'FLOW' in placeholder or 'BALANCE' in placeholder:
-            numerics[placeholder] = round(value, 2)
-        elif 'RATE' in placeholder:
-            numerics[placeholder] = round(value, 1)
-        else:
-            numerics[placeholder] = round(value, 2)
+        numerics[placeholder] = round(value, _numeric_precision(placeholder))
     
     return numerics
 
+def sample_tier1_numerics_batch(doc_type: str,
+                                contexts: List[Dict[str, Any]]) -> Dict[Any, Dict[str, float]]:
+    """
+    Sample every Tier 1 placeholder for all entities of a doc type in one pass.
+    
+    Entities are grouped by sector so bounds, spans and rounding are resolved once per
+    column rather than per document; each entity then only draws its row of uniforms from
+    its own stream. Values are identical to sample_tier1_numerics() for the same entity.
+    
+    Args:
+        contexts: Contexts (or prefetched-row-shaped dicts) carrying SECURITY_ID /
+                  PORTFOLIO_ID and SIC_DESCRIPTION
+    
+    Returns:
+        Dict mapping entity key -> {placeholder: value}, for generate_tier1_numerics()
+    """
+    entities_by_sector: Dict[Any, List[Any]] = {}
+    for context in contexts:
+        entity_id, sector = _tier1_entity(context)
+        entities_by_sector.setdefault(sector, []).append(entity_id)
+    
+    samples: Dict[Any, Dict[str, float]] = {}
+    for sector, entity_ids in entities_by_sector.items():
+        bounds = rules_loader.get_numeric_bounds(doc_type, sector)
+        placeholders = list(bounds)
+        mins = [spec.get('min', 0) for spec in bounds.values()]
+        # random.uniform(a, b) is a + (b - a) * random(); same operations, same floats
+        spans = [spec.get('max', 100) - spec.get('min', 0) for spec in bounds.values()]
+        digits = [_numeric_precision(placeholder) for placeholder in placeholders]
+        columns = list(zip(placeholders, mins, spans, digits))
+        if not columns:
+            samples.update((entity_id, {}) for entity_id in entity_ids)
+            continue
+        
+        for entity_id in entity_ids:
+            draw = get_tier1_rng(doc_type, entity_id).random
+            samples[entity_id] = {
+                placeholder: round(min_val + span * draw(), places)
+                for placeholder, min_val, span, places in columns
+            }
+    
+    return samples
+
 # ============================================================================
 # MODULE: Tier 2 Derivations (Portfolio Metrics from CURATED Tables)
 # ============================================================================
@@ -1094,15 +1230,15 @@ def query_tier2_portfolio_metrics(session: Session, portfolio_id: int) -> Dict[s
 
 def select_market_regime() -> str:
     """
-    Select market regime based on build date (weekly rotation).
+    Select market regime based on the reference date (weekly rotation).
     
     Returns:
         Regime name: 'risk_on', 'risk_off', or 'mixed'
     """
     # Hash current week to select regime
-    current_date = datetime.now()
+    current_date = _reference_datetime()
     week_start = current_date - timedelta(days=current_date.weekday())
-    week_hash = hash(week_start.strftime('%Y-%W'))
+    week_hash = _stable_hash(week_start.strftime('%Y-%W'))
     
     regimes = ['risk_on', 'risk_off', 'mixed']
     regime_index = week_hash % len(regimes)
@@ -1195,12 +1331,25 @@ def render_template(template: Dict[str, Any], context: Dict[str, Any]) -> Tuple[
     Returns:
         Tuple of (rendered_markdown, enriched_context)
     """
-    body = template['body']
-    metadata = template['metadata']
-    
     # Process conditional placeholders first
     context = process_conditional_placeholders(template, context)
     
+    return fill_placeholders(template, context)
+
+def fill_placeholders(template: Dict[str, Any], context: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Fill partial includes and {{PLACEHOLDER}} patterns (conditionals already resolved).
+    
+    Args:
+        template: Template dict with metadata and body
+        context: Context dict with all placeholder values
+    
+    Returns:
+        Tuple of (rendered_markdown, enriched_context)
+    """
+    body = template['body']
+    metadata = template['metadata']
+    
     # Process sub-template includes (for market data partials)
     includes = metadata.get('placeholders', {}).get('includes', metadata.get('includes', []))
     for partial_name in includes:
@@ -1250,25 +1399,100 @@ def render_template(template: Dict[str, Any], context: Dict[str, Any]) -> Tuple[
     
     return rendered, context
 
+# ============================================================================
+# MODULE: Render Keys (Incremental Hydration)
+# ============================================================================
+
+# Partial file hashes keyed by path (partials are shared across templates)
+_partial_hashes: Dict[str, str] = {}
+
+def get_template_hash(template: Dict[str, Any]) -> str:
+    """
+    Hash of a template file plus the partials it includes, so editing either
+    changes the render key of every document that uses the template.
+    """
+    metadata = template['metadata']
+    includes = metadata.get('placeholders', {}).get('includes', metadata.get('includes', []))
+    if not includes:
+        return template['content_hash']
+    
+    digest = hashlib.sha256(template['content_hash'].encode('utf-8'))
+    for partial_name in sorted(includes):
+        partial_path = os.path.join(os.path.dirname(template['file_path']), '_partials', f'{partial_name}.md')
+        if partial_path not in _partial_hashes:
+            try:
+                with open(partial_path, 'rb') as f:
+                    _partial_hashes[partial_path] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                _partial_hashes[partial_path] = ''  # Missing partial (render_template logs it)
+        digest.update(f"{partial_name}:{_partial_hashes[partial_path]}".encode('utf-8'))
+    return digest.hexdigest()
+
+def compute_render_key(template: Dict[str, Any], context: Dict[str, Any]) -> str:
+    """
+    Render key for one document: SHA-256 of the template hash, the (pre-render)
+    context and the RNG seed. An unchanged key means the document would render
+    identically, so incremental hydration can skip it.
+    """
+    payload = json.dumps(
+        {'template': get_template_hash(template), 'context': context, 'seed': config.RNG_SEED},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def get_document_key(doc_type: str, entity: Dict[str, Any]) -> str:
+    """Stable per-entity key used to match documents across incremental runs."""
+    return f"{doc_type}:{entity['id']}"
+
+def get_template_variant(template: Dict[str, Any]) -> str:
+    """Template variant identifier: metadata variant_id, else the path within the content library."""
+    variant_id = template['metadata'].get('variant_id')
+    if variant_id:
+        return str(variant_id)
+    return os.path.relpath(template['file_path'], config.CONTENT_LIBRARY_PATH).replace(os.sep, '/')
+
+def get_document_id(doc_type: str, entity: Dict[str, Any], template: Dict[str, Any]) -> str:
+    """
+    Stable, collision-resistant document ID: SHA-256 of doc type, entity and
+    template variant (128 bits kept). The same document keeps its ID across
+    runs and processes, so downstream MERGEs and search refreshes only see
+    real changes.
+    """
+    digest = hashlib.sha256(
+        f"{doc_type}\x1f{entity['id']}\x1f{get_template_variant(template)}".encode('utf-8')
+    ).hexdigest()
+    return f"{doc_type}_{digest[:32]}"
+
+def get_existing_render_keys(session: Session, doc_type: str) -> Optional[Dict[str, str]]:
+    """
+    Fetch DOCUMENT_KEY -> RENDER_KEY from the RAW table in one query.
+    
+    Returns:
+        Dict of existing keys, or None if the table does not exist yet or was
+        built before render keys were recorded (caller falls back to a full build)
+    """
+    table_name = f"{config.DATABASE['name']}.RAW.{config.DOCUMENT_TYPES[doc_type]['table_name']}"
+    try:
+        rows = session.sql(f"SELECT DOCUMENT_KEY, RENDER_KEY FROM {table_name}").collect()
+    except Exception:
+        return None
+    return {row['DOCUMENT_KEY']: row['RENDER_KEY'] for row in rows}
+
 # ============================================================================
 # MODULE: Writer (RAW Tables with Context-First Approach)
 # ============================================================================
 
-def write_to_raw_table(session: Session, doc_type: str, documents: List[Dict[str, Any]]):
+def build_raw_rows(doc_type: str, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Write rendered documents to RAW table using Context-First approach.
+    Build RAW table rows using Context-First approach.
     
     Args:
-        session: Snowpark session
         doc_type: Document type
         documents: List of dicts with 'rendered' content and 'context'
-    """
-    if not documents:
-        log_warning(f"  No documents to write for {doc_type}")
-        return
-    
-    table_name = f"{config.DATABASE['name']}.RAW.{config.DOCUMENT_TYPES[doc_type]['table_name']}"
     
+    Returns:
+        List of row dicts (columns depend on linkage level and doc type)
+    """
     # Build data for DataFrame based on linkage level
     linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
     
@@ -1279,7 +1503,9 @@ def write_to_raw_table(session: Session, doc_type: str, documents: List[Dict[str
         
         # Base columns (common to all document types)
         row = {
-            'DOCUMENT_ID': ctx.get('_document_id', str(hash(rendered))[:16]),
+            'DOCUMENT_ID': ctx.get('_document_id') or hashlib.sha256(rendered.encode('utf-8')).hexdigest()[:32],
+            'DOCUMENT_KEY': ctx.get('_document_key'),
+            'RENDER_KEY': ctx.get('_render_key'),
             'DOCUMENT_TITLE': ctx.get('DOCUMENT_TITLE', '')[:500],
             'DOCUMENT_TYPE': doc_type.replace('_', ' ').title(),
             'PUBLISH_DATE': ctx.get('PUBLISH_DATE', ctx.get('REPORT_DATE', '')),
@@ -1333,28 +1559,100 @@ def write_to_raw_table(session: Session, doc_type: str, documents: List[Dict[str
         
         data.append(row)
     
+    return data
+
+def write_to_raw_table(session: Session, doc_type: str, documents: List[Dict[str, Any]]):
+    """
+    Write rendered documents to RAW table, replacing its contents.
+    
+    Args:
+        session: Snowpark session
+        doc_type: Document type
+        documents: List of dicts with 'rendered' content and 'context'
+    """
+    if not documents:
+        log_warning(f"  No documents to write for {doc_type}")
+        return
+    
+    table_name = f"{config.DATABASE['name']}.RAW.{config.DOCUMENT_TYPES[doc_type]['table_name']}"
+    
     # Create DataFrame and write to table
+    data = build_raw_rows(doc_type, documents)
     if data:
         df = session.create_dataframe(data)
         df.write.mode("overwrite").save_as_table(table_name)
 
+def merge_into_raw_table(session: Session, doc_type: str, documents: List[Dict[str, Any]],
+                         document_keys: List[str]):
+    """
+    Incrementally update the RAW table: MERGE re-rendered documents on
+    DOCUMENT_KEY, then delete documents whose entity is no longer in scope.
+    Unchanged rows are left untouched.
+    
+    Args:
+        session: Snowpark session
+        doc_type: Document type
+        documents: Re-rendered documents (new or changed render key)
+        document_keys: DOCUMENT_KEYs of every document that should remain
+    """
+    table_name = f"{config.DATABASE['name']}.RAW.{config.DOCUMENT_TYPES[doc_type]['table_name']}"
+    
+    data = build_raw_rows(doc_type, documents)
+    if data:
+        stage_table = f"{table_name}_MERGE_STAGE"
+        columns = list(data[0].keys())
+        session.create_dataframe(data).write.mode("overwrite").save_as_table(stage_table, table_type="temporary")
+        try:
+            session.sql(f"""
+                MERGE INTO {table_name} t
+                USING {stage_table} s
+                ON t.DOCUMENT_KEY = s.DOCUMENT_KEY
+                WHEN MATCHED THEN UPDATE SET {', '.join(f't.{c} = s.{c}' for c in columns if c != 'DOCUMENT_KEY')}
+                WHEN NOT MATCHED THEN INSERT ({', '.join(columns)})
+                    VALUES ({', '.join(f's.{c}' for c in columns)})
+            """).collect()
+        finally:
+            session.sql(f"DROP TABLE IF EXISTS {stage_table}").collect()
+    
+    if document_keys:
+        # Stage the keys to keep and anti-join, rather than inlining every key in the DELETE
+        keys_table = f"{table_name}_KEEP_KEYS"
+        session.create_dataframe(
+            [{'DOCUMENT_KEY': key} for key in document_keys]
+        ).write.mode("overwrite").save_as_table(keys_table, table_type="temporary")
+        try:
+            session.sql(f"""
+                DELETE FROM {table_name} t
+                WHERE NOT EXISTS (SELECT 1 FROM {keys_table} k WHERE k.DOCUMENT_KEY = t.DOCUMENT_KEY)
+            """).collect()
+        finally:
+            session.sql(f"DROP TABLE IF EXISTS {keys_table}").collect()
+
 # ============================================================================
 # PUBLIC API
 # ============================================================================
 
-def hydrate_documents(session: Session, doc_type: str, test_mode: bool = False) -> int:
+def hydrate_documents(session: Session, doc_type: str, test_mode: bool = False,
+                      incremental: bool = False) -> int:
     """
     Main hydration function: load templates, build contexts, render, and write.
     
     Uses batched prefetch for efficiency (no per-entity SELECT queries per performance-io.mdc).
     
+    Every document gets a render key (compute_render_key: template file hash +
+    context hash + seed). With incremental=True, documents whose render key
+    matches the RAW table are not re-rendered, and only new or changed ones are
+    MERGEd in; e.g. editing one broker_research template only regenerates the
+    documents that use it.
+    
     Args:
         session: Snowpark session
         doc_type: Document type to hydrate
         test_mode: If True, use reduced document counts for faster development
+        incremental: If True, re-render and MERGE only documents whose render key changed
     
     Returns:
-        Number of documents generated
+        Number of documents generated (re-rendered)
     """
     import snowflake_io_utils
     
@@ -1364,6 +1662,10 @@ def hydrate_documents(session: Session, doc_type: str, test_mode: bool = False)
     if _anchor_date is None:
         _anchor_date = get_max_price_date(session)
     
+    # Resolve SIC -> GICS from the precomputed table once per run
+    if not _sic_to_gics_cache:
+        preload_sic_to_gics(session)
+    
     # Load templates
     templates = load_templates(doc_type)
     
@@ -1374,153 +1676,259 @@ def hydrate_documents(session: Session, doc_type: str, test_mode: bool = False)
         log_warning(f"  No entities found for {doc_type}")
         return 0
     
+    # Warehouse mode: full builds of doc types with prefetch-only contexts render in Snowflake
+    if config.HYDRATION['mode'] == 'warehouse':
+        if incremental:
+            log_detail(f"  {doc_type}: incremental run - rendering on the client")
+        elif not supports_warehouse_hydration(doc_type):
+            log_detail(f"  {doc_type}: contexts need per-entity queries - rendering on the client")
+        else:
+            return hydrate_documents_in_warehouse(session, doc_type, entities)
+    
     linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
     database_name = config.DATABASE['name']
     
-    # PREFETCH: Get all needed data in ONE query per linkage level (no collect-in-loop)
+    # Existing render keys for incremental mode (None -> full build)
+    existing_render_keys = get_existing_render_keys(session, doc_type) if incremental else None
+    if incremental and existing_render_keys is None:
+        log_detail(f"  No render keys recorded for {doc_type} yet - full build")
+    
+    # PREFETCH: Get all needed data in ONE query per linkage level (no collect-in-loop).
+    # The prefetches are independent (CIKs are resolved by subquery rather than from the
+    # context rows), so they are submitted together and gathered afterwards: setup
+    # latency is that of the slowest prefetch rather than the sum of all of them.
     prefetched_contexts: Dict[int, Dict[str, Any]] = {}
     fiscal_calendar_cache: Dict[str, List[Dict[str, Any]]] = {}
     
     # SEC financials cache for period-aligned metrics (security-level docs)
     sec_financials_cache: Dict[str, Dict[tuple, Dict[str, Any]]] = {}
     
+    # Issuers with breaches for engagement_notes (for Compliance Discussion meeting type)
+    issuers_with_breaches: set = set()
+    
+    id_list = ", ".join(str(e['id']) for e in entities)
+    real_database = config.REAL_DATA_SOURCES['database']
+    real_schema = config.REAL_DATA_SOURCES['schema']
+    queries: Dict[str, str] = {}
+    
     if linkage_level == 'security':
-        security_ids = [e['id'] for e in entities]
-        prefetched_contexts = snowflake_io_utils.prefetch_security_contexts(
-            session, database_name, security_ids
-        )
-        # Prefetch fiscal calendars for all CIKs if needed for this doc type
+        queries['contexts'] = snowflake_io_utils.security_contexts_sql(database_name, id_list)
+        cik_subquery = snowflake_io_utils.security_ciks_sql(database_name, id_list)
+        # Fiscal calendars are only needed for broker research period references
         if doc_type == 'broker_research':
-            ciks = [ctx.get('CIK') for ctx in prefetched_contexts.values() if ctx.get('CIK')]
-            if ciks:
-                fiscal_calendar_cache = snowflake_io_utils.prefetch_fiscal_calendars(
-                    session,
-                    config.REAL_DATA_SOURCES['database'],
-                    config.REAL_DATA_SOURCES['schema'],
-                    ciks
-                )
-        
-        # Prefetch SEC financials for period-aligned metrics in security-level docs
-        # This enables broker research and other docs to quote actual financial figures
-        ciks_for_financials = [ctx.get('CIK') for ctx in prefetched_contexts.values() if ctx.get('CIK')]
-        if ciks_for_financials:
-            sec_financials_cache = snowflake_io_utils.prefetch_sec_financials(
-                session, database_name, ciks_for_financials
+            queries['fiscal_calendars'] = snowflake_io_utils.fiscal_calendars_sql(
+                real_database, real_schema, cik_subquery
             )
+        # SEC financials let security-level docs quote actual period-aligned figures
+        queries['sec_financials'] = snowflake_io_utils.sec_financials_sql(database_name, cik_subquery)
     
     elif linkage_level == 'issuer':
-        issuer_ids = [e['id'] for e in entities]
-        prefetched_contexts = snowflake_io_utils.prefetch_issuer_contexts(
-            session, database_name, issuer_ids
-        )
-        # Prefetch fiscal calendars for issuer CIKs if needed
+        queries['contexts'] = snowflake_io_utils.issuer_contexts_sql(database_name, id_list)
         if doc_type in ['ngo_reports', 'engagement_notes']:
-            ciks = [ctx.get('CIK') for ctx in prefetched_contexts.values() if ctx.get('CIK')]
-            if ciks:
-                fiscal_calendar_cache = snowflake_io_utils.prefetch_fiscal_calendars(
-                    session,
-                    config.REAL_DATA_SOURCES['database'],
-                    config.REAL_DATA_SOURCES['schema'],
-                    ciks
-                )
+            queries['fiscal_calendars'] = snowflake_io_utils.fiscal_calendars_sql(
+                real_database, real_schema,
+                snowflake_io_utils.issuer_ciks_sql(database_name, id_list)
+            )
+    
+    elif linkage_level == 'portfolio':
+        queries['contexts'] = snowflake_io_utils.portfolio_contexts_sql(database_name, id_list)
     
-    # Prefetch issuers with breaches for engagement_notes (for Compliance Discussion meeting type)
-    issuers_with_breaches: set = set()
     if doc_type == 'engagement_notes':
-        issuers_with_breaches = prefetch_issuers_with_breaches(session)
+        queries['breaches'] = issuers_with_breaches_sql()
+    
+    prefetch_start = time.perf_counter()
+    jobs = snowflake_io_utils.submit_queries(session, queries)
+    
+    if 'contexts' in jobs:
+        rows = jobs['contexts'].result()
+        if linkage_level == 'security':
+            prefetched_contexts = snowflake_io_utils.index_security_contexts(rows)
+        elif linkage_level == 'issuer':
+            prefetched_contexts = snowflake_io_utils.index_issuer_contexts(rows)
+        else:
+            prefetched_contexts = snowflake_io_utils.index_portfolio_contexts(rows)
+    
+    if 'fiscal_calendars' in jobs:
+        try:
+            fiscal_calendar_cache = snowflake_io_utils.group_fiscal_calendars(
+                row.as_dict() for row in jobs['fiscal_calendars'].result()
+            )
+        except Exception:
+            # If SEC_FISCAL_CALENDARS is not accessible, fall back to synthetic dates
+            fiscal_calendar_cache = {}
+    
+    if 'sec_financials' in jobs:
+        try:
+            sec_financials_cache = snowflake_io_utils.index_sec_financials(
+                jobs['sec_financials'].result()
+            )
+        except Exception:
+            # If FACT_SEC_FINANCIALS is not accessible, docs use Tier 1 numerics only
+            sec_financials_cache = {}
+    
+    if 'breaches' in jobs:
+        try:
+            issuers_with_breaches = {row['ISSUERID'] for row in jobs['breaches'].result()}
+        except Exception as e:
+            log_warning(f"  Could not prefetch breach data: {e}")
         if issuers_with_breaches:
-            from logging_utils import log_detail
             log_detail(f"  Found {len(issuers_with_breaches)} issuers with breach data for Compliance Discussion")
     
+    if jobs:
+        log_detail(f"  Prefetched {len(jobs)} queries concurrently in {time.perf_counter() - prefetch_start:.2f}s")
+    
+    # Presample Tier 1 numerics for every prefetched entity in one pass
+    tier1_samples: Dict[Any, Dict[str, float]] = {}
+    if linkage_level == 'security':
+        tier1_samples = sample_tier1_numerics_batch(doc_type, [
+            {'SECURITY_ID': row.get('SECURITYID'), 'SIC_DESCRIPTION': row.get('SIC_DESCRIPTION')}
+            for row in prefetched_contexts.values()
+        ])
     elif linkage_level == 'portfolio':
-        portfolio_ids = [e['id'] for e in entities]
-        prefetched_contexts = snowflake_io_utils.prefetch_portfolio_contexts(
-            session, database_name, portfolio_ids
-        )
+        tier1_samples = sample_tier1_numerics_batch(doc_type, [
+            {'PORTFOLIO_ID': row.get('PORTFOLIOID')} for row in prefetched_contexts.values()
+        ])
     
     # Render documents using prefetched data
     documents = []
+    document_keys = [get_document_key(doc_type, entity) for entity in entities]
+    unchanged_count = 0
     
-    for entity in entities:
+    for entity, document_key in zip(entities, document_keys):
+        # Seed per document so its context does not depend on which other documents are built
+        random.seed(f"{config.RNG_SEED}:{document_key}")
         try:
             # Build context from prefetched data (no per-entity queries)
-            if linkage_level == 'security':
-                context = build_security_context_from_prefetch(
-                    prefetched_contexts.get(entity['id']), 
-                    doc_type,
-                    fiscal_calendar_cache,
-                    sec_financials_cache
-                )
-            elif linkage_level == 'issuer':
-                context = build_issuer_context_from_prefetch(
-                    prefetched_contexts.get(entity['id']),
-                    doc_type,
-                    fiscal_calendar_cache,
-                    session,  # Pass session for breach context queries (engagement notes)
-                    issuers_with_breaches  # Pass breach set for Compliance Discussion meeting type
-                )
-            elif linkage_level == 'portfolio':
-                context = build_portfolio_context_from_prefetch(
-                    session,  # Still need session for Tier 2 portfolio metrics
-                    prefetched_contexts.get(entity['id']),
-                    doc_type
-                )
-            else:  # global
-                context = build_global_context(doc_type, entity.get('num', 0))
+            context = build_entity_context(
+                doc_type, linkage_level, entity, prefetched_contexts.get(entity['id']),
+                fiscal_calendar_cache, sec_financials_cache, tier1_samples,
+                issuers_with_breaches, session
+            )
             
             if context is None:
                 log_warning(f"  No prefetched data for {doc_type} entity {entity.get('id')}")
                 continue
             
             # Select appropriate template
-            if doc_type == 'portfolio_review':
-                template = select_portfolio_review_variant(templates, context)
-            else:
-                template = select_template(templates, context)
-            
-            # Override SEVERITY_LEVEL from template metadata for NGO reports
-            # This ensures metadata field matches hardcoded severity in template body
-            if doc_type == 'ngo_reports':
-                template_severity = template.get('metadata', {}).get('severity', '')
-                if template_severity:
-                    context['SEVERITY_LEVEL'] = template_severity.title()  # 'high' -> 'High'
-            
-            # Render template
-            rendered, enriched_context = render_template(template, context)
+            template = select_document_template(doc_type, templates, context)
             
-            # Add document ID
-            enriched_context['_document_id'] = f"{doc_type}_{entity['id']}_{hash(rendered) % 100000}"
+            # Skip rendering when template and context are unchanged since the last build
+            render_key = compute_render_key(template, context)
+            if existing_render_keys is not None and existing_render_keys.get(document_key) == render_key:
+                unchanged_count += 1
+                continue
             
-            documents.append({
-                'rendered': rendered,
-                'context': enriched_context
-            })
+            documents.append(render_document(doc_type, entity, document_key, template, context, render_key))
             
         except Exception as e:
             log_warning(f"  Failed to hydrate {doc_type} for entity {entity.get('id')}: {e}")
             continue
     
     # Write to RAW table
-    write_to_raw_table(session, doc_type, documents)
+    if existing_render_keys is not None:
+        merge_into_raw_table(session, doc_type, documents, document_keys)
+        log_detail(f"  {doc_type}: {len(documents)} re-rendered, {unchanged_count} unchanged")
+    else:
+        write_to_raw_table(session, doc_type, documents)
     
     return len(documents)
 
 
+def build_entity_context(
+    doc_type: str,
+    linkage_level: str,
+    entity: Dict[str, Any],
+    prefetched_row: Optional[Dict[str, Any]],
+    fiscal_calendar_cache: Dict[str, List[Dict[str, Any]]],
+    sec_financials_cache: Dict[str, Dict[tuple, Dict[str, Any]]],
+    tier1_samples: Optional[Dict[Any, Dict[str, float]]] = None,
+    issuers_with_breaches: Optional[set] = None,
+    session: Optional[Session] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build one document's context for its linkage level from prefetched data.
+    
+    Returns:
+        Context dict or None if the prefetched row is missing
+    """
+    if linkage_level == 'security':
+        return build_security_context_from_prefetch(
+            prefetched_row, 
+            doc_type,
+            fiscal_calendar_cache,
+            sec_financials_cache,
+            tier1_samples
+        )
+    elif linkage_level == 'issuer':
+        return build_issuer_context_from_prefetch(
+            prefetched_row,
+            doc_type,
+            fiscal_calendar_cache,
+            session,  # Pass session for breach context queries (engagement notes)
+            issuers_with_breaches  # Pass breach set for Compliance Discussion meeting type
+        )
+    elif linkage_level == 'portfolio':
+        return build_portfolio_context_from_prefetch(
+            session,  # Still need session for Tier 2 portfolio metrics
+            prefetched_row,
+            doc_type,
+            tier1_samples=tier1_samples
+        )
+    else:  # global
+        return build_global_context(doc_type, entity.get('num', 0))
+
+
+def select_document_template(doc_type: str, templates: List[Dict[str, Any]],
+                             context: Dict[str, Any]) -> Dict[str, Any]:
+    """Select the template for a document (may set SEVERITY_LEVEL in context for NGO reports)."""
+    if doc_type == 'portfolio_review':
+        template = select_portfolio_review_variant(templates, context)
+    else:
+        template = select_template(templates, context)
+    
+    # Override SEVERITY_LEVEL from template metadata for NGO reports
+    # This ensures metadata field matches hardcoded severity in template body
+    if doc_type == 'ngo_reports':
+        template_severity = template.get('metadata', {}).get('severity', '')
+        if template_severity:
+            context['SEVERITY_LEVEL'] = template_severity.title()  # 'high' -> 'High'
+    
+    return template
+
+
+def render_document(doc_type: str, entity: Dict[str, Any], document_key: str,
+                    template: Dict[str, Any], context: Dict[str, Any], render_key: str) -> Dict[str, Any]:
+    """Render one document; returns the {'rendered', 'context'} dict consumed by build_raw_rows."""
+    rendered, enriched_context = render_template(template, context)
+    
+    # Add document ID and incremental keys
+    enriched_context['_document_id'] = get_document_id(doc_type, entity, template)
+    enriched_context['_document_key'] = document_key
+    enriched_context['_render_key'] = render_key
+    
+    return {
+        'rendered': rendered,
+        'context': enriched_context
+    }
+
+
 def build_security_context_from_prefetch(
     prefetched_row: Optional[Dict[str, Any]],
     doc_type: str,
     fiscal_calendar_cache: Dict[str, List[Dict[str, Any]]],
-    sec_financials_cache: Optional[Dict[str, Dict[tuple, Dict[str, Any]]]] = None
+    sec_financials_cache: Optional[Dict[str, Dict[tuple, Dict[str, Any]]]] = None,
+    tier1_samples: Optional[Dict[Any, Dict[str, float]]] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Build context for security-level documents from prefetched data.
     No database queries - uses data already fetched in batch.
     
     Args:
-        prefetched_row: Row from prefetch_security_contexts()
+        prefetched_row: Row from snowflake_io_utils.index_security_contexts()
         doc_type: Document type for context enrichment
         fiscal_calendar_cache: Prefetched fiscal calendar data keyed by CIK
         sec_financials_cache: Prefetched SEC financial metrics keyed by CIK then (year, period)
+        tier1_samples: Presampled Tier 1 numerics from sample_tier1_numerics_batch()
     
     Returns:
         Context dict or None if prefetched_row is missing
@@ -1559,7 +1967,7 @@ def build_security_context_from_prefetch(
         context.update(inject_sec_financial_metrics(context, sec_financials_cache))
     
     # Add Tier 1 numerics (fills in missing placeholders with sampled values)
-    context.update(generate_tier1_numerics(context, doc_type))
+    context.update(generate_tier1_numerics(context, doc_type, tier1_samples))
     
     return context
 
@@ -1711,7 +2119,7 @@ def build_issuer_context_from_prefetch(
     Mostly uses prefetched data, but may query for breach context when needed.
     
     Args:
-        prefetched_row: Row from prefetch_issuer_contexts()
+        prefetched_row: Row from snowflake_io_utils.index_issuer_contexts()
         doc_type: Document type
         fiscal_calendar_cache: Prefetched fiscal calendar data keyed by CIK
         session: Optional Snowpark session for breach context queries
@@ -1765,7 +2173,9 @@ def build_issuer_context_from_prefetch(
 def build_portfolio_context_from_prefetch(
     session: Session,
     prefetched_row: Optional[Dict[str, Any]],
-    doc_type: str
+    doc_type: str,
+    tier2_metrics: Optional[Dict[str, Any]] = None,
+    tier1_samples: Optional[Dict[Any, Dict[str, float]]] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Build context for portfolio-level documents from prefetched data.
@@ -1773,8 +2183,10 @@ def build_portfolio_context_from_prefetch(
     
     Args:
         session: Snowpark session (for Tier 2 metrics only)
-        prefetched_row: Row from prefetch_portfolio_contexts()
+        prefetched_row: Row from snowflake_io_utils.index_portfolio_contexts()
         doc_type: Document type
+        tier2_metrics: Precomputed Tier 2 metrics; skips the query (offline benchmark)
+        tier1_samples: Presampled Tier 1 numerics from sample_tier1_numerics_batch()
     
     Returns:
         Context dict or None if prefetched_row is missing
@@ -1797,10 +2209,12 @@ def build_portfolio_context_from_prefetch(
     # Add Tier 2 derived metrics for portfolio reviews (still needs session)
     portfolio_id = context.get('PORTFOLIO_ID')
     if doc_type == 'portfolio_review' and portfolio_id:
-        context.update(query_tier2_portfolio_metrics(session, portfolio_id))
+        if tier2_metrics is None:
+            tier2_metrics = query_tier2_portfolio_metrics(session, portfolio_id)
+        context.update(tier2_metrics)
     
     # Add Tier 1 numerics for performance data
-    context.update(generate_tier1_numerics(context, doc_type))
+    context.update(generate_tier1_numerics(context, doc_type, tier1_samples))
     
     return context
 
@@ -1823,7 +2237,7 @@ def generate_dates_for_doc_type_from_cache(
     Returns:
         Dict with date placeholders
     """
-    current_date = datetime.now()
+    current_date = _reference_datetime()
     dates = {}
     
     if doc_type in ['broker_research', 'internal_research', 'press_releases', 'investment_memo']:
@@ -1987,3 +2401,333 @@ def get_entities_for_doc_type(session: Session, doc_type: str, test_mode: bool =
         docs_total = max(1, int(base_count * config.TEST_MODE_MULTIPLIER)) if test_mode else base_count
         return [{'id': i, 'num': i} for i in range(docs_total)]
 
+
+# ============================================================================
+# MODULE: Warehouse Hydration (Snowpark vectorized UDTF)
+# ============================================================================
+
+# Modules imported by the HYDRATE_DOCUMENTS UDTF (hydration_engine and its imports)
+HYDRATION_UDTF_MODULES = (
+    'hydration_engine', 'config', 'rules_loader', 'logging_utils',
+    'demo_helpers', 'db_helpers', 'sql_utils', 'snowflake_io_utils'
+)
+HYDRATION_BUNDLE_NAME = 'hydration_bundle.zip'
+HYDRATION_SETTINGS_NAME = 'hydration_settings.json'
+
+# Set once the UDTF has been deployed in this run (the bundle carries the run's anchor date)
+_hydration_udtf_deployed = False
+
+# Templates loaded from the unpacked bundle, keyed by doc_type (UDTF side)
+_warehouse_templates: Dict[str, List[Dict[str, Any]]] = {}
+
+# Serializes rendering inside a UDTF process (documents are seeded on the global RNG)
+_warehouse_render_lock = threading.Lock()
+
+# RAW columns that are not VARCHAR (see build_raw_rows)
+RAW_COLUMN_TYPES = {
+    'SecurityID': 'NUMBER',
+    'IssuerID': 'NUMBER',
+    'PortfolioID': 'NUMBER',
+    'PRICE_TARGET': 'FLOAT',
+    'QTD_RETURN_PCT': 'FLOAT',
+    'YTD_RETURN_PCT': 'FLOAT'
+}
+
+def supports_warehouse_hydration(doc_type: str) -> bool:
+    """Whether a doc type's contexts can be built from prefetched data alone (no per-entity queries)."""
+    linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
+    if linkage_level == 'portfolio':
+        return False  # Tier 2 metrics are queried per portfolio
+    if doc_type == 'engagement_notes':
+        return False  # Breach context is queried per issuer
+    return config.DOCUMENT_TYPES[doc_type].get('source') != 'real'
+
+def build_hydration_bundle(bundle_path: str):
+    """
+    Zip the hydration modules, the templates and rules of every warehouse-capable
+    doc type, and the run settings (anchor date, SIC -> GICS map) for the UDTF.
+    Template paths keep their place under content_library/, so template hashes,
+    variants and document IDs match client-side hydration.
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    content_dirs = ['_rules'] + [
+        cfg['template_dir'] for doc_type, cfg in config.DOCUMENT_TYPES.items()
+        if cfg.get('template_dir') and supports_warehouse_hydration(doc_type)
+    ]
+    settings = {
+        'anchor_date': _anchor_date.isoformat() if _anchor_date else None,
+        'sic_to_gics': _sic_to_gics_cache
+    }
+    
+    with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as bundle:
+        for module in HYDRATION_UDTF_MODULES:
+            bundle.write(os.path.join(module_dir, f'{module}.py'), f'{module}.py')
+        for content_dir in sorted(set(content_dirs)):
+            root_dir = os.path.join(config.CONTENT_LIBRARY_PATH, content_dir)
+            for root, dirs, files in os.walk(root_dir):
+                for file in sorted(files):
+                    file_path = os.path.join(root, file)
+                    relative_path = os.path.relpath(file_path, config.CONTENT_LIBRARY_PATH)
+                    bundle.write(file_path, f"content_library/{relative_path.replace(os.sep, '/')}")
+        bundle.writestr(HYDRATION_SETTINGS_NAME, json.dumps(settings))
+
+def install_hydration_bundle(bundle_path: str, extract_dir: str):
+    """UDTF side: unpack the content library and apply the run settings from the bundle."""
+    global _anchor_date
+    with zipfile.ZipFile(bundle_path) as bundle:
+        bundle.extractall(extract_dir, [name for name in bundle.namelist() if name.startswith('content_library/')])
+        settings = json.loads(bundle.read(HYDRATION_SETTINGS_NAME))
+    
+    config.CONTENT_LIBRARY_PATH = os.path.join(extract_dir, 'content_library')
+    rules_loader.clear_cache()
+    if settings.get('anchor_date'):
+        _anchor_date = date.fromisoformat(settings['anchor_date'])
+    _sic_to_gics_cache.update(settings.get('sic_to_gics') or {})
+
+def _hydration_udtf_sql(stage_path: str) -> str:
+    """CREATE FUNCTION statement for the HYDRATE_DOCUMENTS vectorized UDTF."""
+    return f"""
+CREATE OR REPLACE FUNCTION {config.DATABASE['name']}.{config.HYDRATION['udtf']}(
+    doc_type VARCHAR,
+    entity_id NUMBER,
+    entity_json VARCHAR,
+    fiscal_json VARCHAR,
+    financials_json VARCHAR
+)
+RETURNS TABLE (DOCUMENT_KEY VARCHAR, RAW_ROW VARCHAR)
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python', 'pandas', 'pyyaml')
+IMPORTS = ('{stage_path}/{HYDRATION_BUNDLE_NAME}')
+HANDLER = 'HydrateDocuments'
+AS
+$$
+import os
+import sys
+import tempfile
+
+import pandas
+from _snowflake import vectorized
+
+_bundle_path = os.path.join(sys._xoptions['snowflake_import_directory'], '{HYDRATION_BUNDLE_NAME}')
+sys.path.insert(0, _bundle_path)
+
+import hydration_engine
+
+hydration_engine.install_hydration_bundle(_bundle_path, tempfile.mkdtemp(prefix='sam_hydration_'))
+
+class HydrateDocuments:
+    @vectorized(input=pandas.DataFrame)
+    def end_partition(self, df):
+        rows = hydration_engine.render_warehouse_partition(df.itertuples(index=False, name=None))
+        return pandas.DataFrame(rows, columns=['DOCUMENT_KEY', 'RAW_ROW'])
+$$;
+    """
+
+def deploy_hydration_udtf(session: Session):
+    """Stage the hydration bundle and (re)create the HYDRATE_DOCUMENTS UDTF, once per run."""
+    global _hydration_udtf_deployed
+    if _hydration_udtf_deployed:
+        return
+    
+    stage = f"{config.DATABASE['name']}.{config.HYDRATION['stage']}"
+    stage_path = f"@{stage}"
+    session.sql(f"CREATE STAGE IF NOT EXISTS {stage}").collect()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_path = os.path.join(directory, HYDRATION_BUNDLE_NAME)
+        build_hydration_bundle(bundle_path)
+        session.file.put(bundle_path, stage_path, overwrite=True, auto_compress=False)
+    
+    session.sql(_hydration_udtf_sql(stage_path)).collect()
+    _hydration_udtf_deployed = True
+    log_detail(f"  Deployed {config.HYDRATION['udtf']} UDTF")
+
+def _parse_warehouse_dates(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn ISO *_DATE strings (dates serialized by TO_JSON) back into dates, as prefetch returns them."""
+    for key, value in row.items():
+        if key.endswith('_DATE') and isinstance(value, str):
+            row[key] = date.fromisoformat(value[:10])
+    return row
+
+def render_warehouse_partition(rows) -> List[Tuple[str, str]]:
+    """
+    UDTF side: render the documents of one partition.
+    
+    Mirrors the hydrate_documents render loop (same seeds, contexts, templates and
+    document IDs), with the prefetched data arriving as JSON columns.
+    
+    Args:
+        rows: (doc_type, entity_id, entity_json, fiscal_json, financials_json) tuples
+    
+    Returns:
+        (DOCUMENT_KEY, RAW_ROW JSON) tuples; RAW_ROW holds the build_raw_rows columns
+    """
+    import snowflake_io_utils
+    
+    entries = []
+    fiscal_calendar_cache: Dict[str, List[Dict[str, Any]]] = {}
+    sec_financials_cache: Dict[str, Dict[tuple, Dict[str, Any]]] = {}
+    for doc_type, entity_id, entity_json, fiscal_json, financials_json in rows:
+        entity_id = int(entity_id)
+        linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
+        entity = {'id': entity_id, 'num': entity_id} if linkage_level == 'global' else {'id': entity_id}
+        prefetched_row = _parse_warehouse_dates(json.loads(entity_json)) if entity_json else None
+        if fiscal_json:
+            fiscal_calendar_cache.update(snowflake_io_utils.group_fiscal_calendars(
+                _parse_warehouse_dates(period) for period in json.loads(fiscal_json)
+            ))
+        if financials_json:
+            sec_financials_cache.update(snowflake_io_utils.index_sec_financials(
+                _parse_warehouse_dates(period) for period in json.loads(financials_json)
+            ))
+        entries.append((doc_type, linkage_level, entity, prefetched_row))
+    
+    results = []
+    with _warehouse_render_lock:
+        for doc_type, linkage_level, entity, prefetched_row in entries:
+            templates = _warehouse_templates.get(doc_type)
+            if templates is None:
+                templates = _warehouse_templates[doc_type] = load_templates(doc_type)
+            
+            document_key = get_document_key(doc_type, entity)
+            random.seed(f"{config.RNG_SEED}:{document_key}")
+            try:
+                context = build_entity_context(
+                    doc_type, linkage_level, entity, prefetched_row,
+                    fiscal_calendar_cache, sec_financials_cache
+                )
+                if context is None:
+                    continue
+                
+                template = select_document_template(doc_type, templates, context)
+                render_key = compute_render_key(template, context)
+                document = render_document(doc_type, entity, document_key, template, context, render_key)
+                raw_row = build_raw_rows(doc_type, [document])[0]
+                results.append((document_key, json.dumps(raw_row, default=str)))
+            except Exception as e:
+                log_warning(f"  Failed to hydrate {doc_type} for entity {entity.get('id')}: {e}")
+    
+    return results
+
+def _warehouse_source_accessible(session: Session, source_sql: str) -> bool:
+    """Whether a prefetch SELECT compiles and its tables are readable (LIMIT 0, no rows scanned)."""
+    try:
+        session.sql(f"SELECT 1 FROM ({source_sql}) LIMIT 0").collect()
+        return True
+    except Exception:
+        return False
+
+def _warehouse_input_ctes(session: Session, doc_type: str, entities: List[Dict[str, Any]]) -> str:
+    """
+    CTEs ending in 'inputs': one UDTF input row per entity with its prefetched row,
+    fiscal periods and SEC financials as JSON (the same queries as the client prefetch).
+    
+    Fiscal calendars and SEC financials are checked first: an inaccessible source
+    becomes an empty CTE, as the client prefetch falls back to empty caches.
+    """
+    import snowflake_io_utils
+    
+    database_name = config.DATABASE['name']
+    linkage_level = config.DOCUMENT_TYPES[doc_type]['linkage_level']
+    id_list = ", ".join(str(int(e['id'])) for e in entities)
+    
+    if linkage_level == 'global':
+        return f"""inputs AS (
+            SELECT VALUE::NUMBER AS ENTITY_ID, NULL::VARCHAR AS ENTITY_JSON,
+                   NULL::VARCHAR AS FISCAL_JSON, NULL::VARCHAR AS FINANCIALS_JSON
+            FROM TABLE(FLATTEN(INPUT => ARRAY_CONSTRUCT({id_list})))
+        )"""
+    
+    if linkage_level == 'security':
+        entity_sql = snowflake_io_utils.security_contexts_sql(database_name, id_list)
+        entity_id_column = 'SECURITYID'
+    else:
+        # Keep one row per issuer: the first in issuer_contexts_sql order, as index_issuer_contexts does
+        entity_sql = f"""
+            SELECT * FROM ({snowflake_io_utils.issuer_contexts_sql(database_name, id_list)})
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY ISSUERID ORDER BY TICKER NULLS LAST) = 1
+        """
+        entity_id_column = 'ISSUERID'
+    
+    # Same prefetch conditions as hydrate_documents
+    ciks = "SELECT CIK FROM entities WHERE CIK IS NOT NULL"
+    fiscal_sql = "SELECT NULL::VARCHAR AS CIK, NULL::VARCHAR AS FISCAL_JSON WHERE FALSE"
+    real_database = config.REAL_DATA_SOURCES['database']
+    real_schema = config.REAL_DATA_SOURCES['schema']
+    if doc_type in ('broker_research', 'ngo_reports', 'engagement_notes') and _warehouse_source_accessible(
+            session, snowflake_io_utils.fiscal_calendars_sql(real_database, real_schema, 'NULL')):
+        fiscal_sql = f"""
+            SELECT CIK, TO_JSON(ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*))
+                                WITHIN GROUP (ORDER BY PERIOD_END_DATE DESC)) AS FISCAL_JSON
+            FROM ({snowflake_io_utils.fiscal_calendars_sql(real_database, real_schema, ciks)})
+            GROUP BY CIK
+        """
+    financials_sql = "SELECT NULL::VARCHAR AS CIK, NULL::VARCHAR AS FINANCIALS_JSON WHERE FALSE"
+    if linkage_level == 'security' and _warehouse_source_accessible(
+            session, snowflake_io_utils.sec_financials_sql(database_name, 'NULL')):
+        financials_sql = f"""
+            SELECT CIK, TO_JSON(ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*))
+                                WITHIN GROUP (ORDER BY PERIOD_END_DATE DESC)) AS FINANCIALS_JSON
+            FROM ({snowflake_io_utils.sec_financials_sql(database_name, ciks)})
+            GROUP BY CIK
+        """
+    
+    return f"""entities AS ({entity_sql}),
+        fiscal AS ({fiscal_sql}),
+        financials AS ({financials_sql}),
+        inputs AS (
+            SELECT
+                e.{entity_id_column} AS ENTITY_ID,
+                TO_JSON(OBJECT_CONSTRUCT_KEEP_NULL(e.*)) AS ENTITY_JSON,
+                f.FISCAL_JSON,
+                s.FINANCIALS_JSON
+            FROM entities e
+            LEFT JOIN fiscal f ON f.CIK = e.CIK
+            LEFT JOIN financials s ON s.CIK = e.CIK
+        )"""
+
+def hydrate_documents_in_warehouse(session: Session, doc_type: str, entities: List[Dict[str, Any]]) -> int:
+    """
+    Render a doc type inside Snowflake and replace its RAW table in one statement.
+    
+    Only entity IDs go up and nothing comes back but a row count: prefetch joins,
+    rendering (HYDRATE_DOCUMENTS, partitioned by entity hash so it scales with the
+    warehouse) and the RAW write all run server-side.
+    
+    Returns:
+        Number of documents written
+    """
+    deploy_hydration_udtf(session)
+    
+    table_name = f"{config.DATABASE['name']}.RAW.{config.DOCUMENT_TYPES[doc_type]['table_name']}"
+    raw_columns = build_raw_rows(doc_type, [{'rendered': '', 'context': {}}])[0]
+    column_sql = ",\n            ".join(
+        f"DOC:\"{column}\"::{RAW_COLUMN_TYPES.get(column, 'VARCHAR')} AS {column}" for column in raw_columns
+    )
+    
+    session.sql(f"""
+        CREATE OR REPLACE TABLE {table_name} AS
+        WITH {_warehouse_input_ctes(session, doc_type, entities)},
+        hydrated AS (
+            SELECT PARSE_JSON(h.RAW_ROW) AS DOC
+            FROM inputs i,
+                 TABLE({config.DATABASE['name']}.{config.HYDRATION['udtf']}(
+                     '{doc_type}', i.ENTITY_ID, i.ENTITY_JSON, i.FISCAL_JSON, i.FINANCIALS_JSON
+                 ) OVER (PARTITION BY MOD(ABS(HASH(i.ENTITY_ID)), {int(config.HYDRATION['partitions'])}))) h
+        )
+        SELECT
+            {column_sql}
+        FROM hydrated
+    """).collect()
+    
+    document_count = session.sql(f"SELECT COUNT(*) AS N FROM {table_name}").collect()[0]['N']
+    
+    # Render failures are only logged inside the UDTF; surface the shortfall here
+    if document_count < len(entities):
+        log_warning(
+            f"  {doc_type}: {len(entities) - document_count} of {len(entities)} entities produced no document "
+            f"(no context or render failure - see the {config.HYDRATION['udtf']} UDTF logs)"
+        )
+    
+    return document_count
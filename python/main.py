@@ -31,6 +31,12 @@ Examples:
     python main.py --connection-name my_demo --scope data                # Build structured + unstructured data
     python main.py --connection-name my_demo --scope ai                  # Build only AI components (semantic + search)
     python main.py --connection-name my_demo --test-mode                 # Use test mode
+    python main.py --connection-name my_demo --stats-mode cheap          # Skip full-scan build statistics
+    python main.py --connection-name my_demo --scope structured --incremental  # Quarterly SEC refresh (new filings only)
+    python main.py --connection-name my_demo --scope unstructured --incremental  # Re-render only changed documents
+    python main.py --connection-name my_demo --holdings-materialization table  # Materialize V_HOLDINGS_WITH_ESG
+    python main.py --connection-name my_demo --table-layout sort         # Sort fact tables for partition pruning
+    python main.py --connection-name my_demo --scope unstructured --hydration-mode warehouse  # Render documents in Snowflake
 """
 
 import argparse
@@ -80,6 +86,44 @@ def parse_arguments() -> argparse.Namespace:
         help='Scope of build: all=everything, data=structured+unstructured, structured=tables only, unstructured=documents only, ai=semantic+search+agents, semantic=views only, search=services only, agents=agents only'
     )
     
+    parser.add_argument(
+        '--stats-mode',
+        type=str,
+        choices=['off', 'cheap', 'full'],
+        default=None,
+        help='Post-build statistics for MARKET_DATA tables: off=emptiness check only, cheap=metadata row counts, full=COUNT(DISTINCT) scans (default: config MARKET_DATA stats_mode)'
+    )
+    
+    parser.add_argument(
+        '--holdings-materialization',
+        type=str,
+        choices=['view', 'table', 'dynamic_table'],
+        default=None,
+        help='How V_HOLDINGS_WITH_ESG is backed: view=logical view, table=table rebuilt after the structured build, dynamic_table=dynamic table refreshed after the structured build (default: config HOLDINGS_ENRICHMENT materialization)'
+    )
+    
+    parser.add_argument(
+        '--table-layout',
+        type=str,
+        choices=['off', 'sort', 'cluster'],
+        default=None,
+        help='Post-build layout of large fact tables, profiled on the SAM_ANALYST_VIEW / SAM_IMPLEMENTATION_VIEW queries (needs the semantic views): off=build order, sort=rewrite sorted by date/portfolio/security keys, cluster=sort and set clustering keys (default: config TABLE_LAYOUT mode)'
+    )
+    
+    parser.add_argument(
+        '--hydration-mode',
+        type=str,
+        choices=['client', 'warehouse'],
+        default=None,
+        help='Where hydrated documents are rendered: client=render locally and upload, warehouse=render in Snowflake with the HYDRATE_DOCUMENTS vectorized UDTF and write RAW tables server-side (default: config HYDRATION mode)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Refresh append-only sources incrementally where supported (SEC filings: filings (ADSH) not yet loaded, including amendments; company event transcripts: transcripts not yet in the corpus; hydrated documents: only those whose template or context changed)'
+    )
+    
     parser.add_argument(
         '--test-mode',
         action='store_true',
@@ -202,6 +246,22 @@ def main():
     # Set verbosity based on args (could add --verbose flag later)
     set_verbosity(2)  # Default to minimal output
     
+    # Override post-build statistics mode for MARKET_DATA tables
+    if args.stats_mode:
+        config.MARKET_DATA['stats_mode'] = args.stats_mode
+    
+    # Override enriched holdings materialization (V_HOLDINGS_WITH_ESG)
+    if args.holdings_materialization:
+        config.HOLDINGS_ENRICHMENT['materialization'] = args.holdings_materialization
+    
+    # Override post-build fact table layout (sorting / clustering keys)
+    if args.table_layout:
+        config.TABLE_LAYOUT['mode'] = args.table_layout
+    
+    # Override where hydrated documents are rendered
+    if args.hydration_mode:
+        config.HYDRATION['mode'] = args.hydration_mode
+    
     # Parse and validate scenarios
     if args.scenarios.lower() == 'all':
         scenario_list = AVAILABLE_SCENARIOS
@@ -275,7 +335,7 @@ def main():
             market_data_scenarios = {'research_copilot', 'portfolio_copilot', 'compliance_advisor', 'all'}
             if market_data_scenarios.intersection(set(validated_scenarios)):
                 try:
-                    generate_market_data.build_all(session, args.test_mode)
+                    generate_market_data.build_all(session, args.test_mode, incremental=args.incremental)
                     
                     # Build returns view and update enriched holdings (requires FACT_STOCK_PRICES from market data)
                     log_substep("Security returns and enriched holdings")
@@ -298,6 +358,12 @@ def main():
                     log_error("Market data is required for performance metrics in semantic views.")
                     raise
             
+            # Optional fact table layout. Builds that also create semantic views run it in
+            # build_ai right after them; otherwise the existing views are profiled (fails if none)
+            if config.TABLE_LAYOUT['mode'] != 'off' and not build_semantic:
+                log_substep(f"Fact table layout ({config.TABLE_LAYOUT['mode']})")
+                generate_structured.optimize_table_layouts(session)
+            
         # Step 2: Build unstructured data (documents and content)
         if build_unstructured:
             log_phase("Unstructured Data")
@@ -312,7 +378,7 @@ def main():
             
             import generate_unstructured
             required_doc_types = get_required_document_types(validated_scenarios)
-            generate_unstructured.build_all(session, required_doc_types, args.test_mode)
+            generate_unstructured.build_all(session, required_doc_types, args.test_mode, incremental=args.incremental)
             
             # Build real company event transcripts (replaces synthetic earnings transcripts)
             # Only run if company_event_transcripts is in required document types
@@ -320,7 +386,7 @@ def main():
                 try:
                     import generate_real_transcripts
                     if generate_real_transcripts.verify_transcripts_available(session):
-                        generate_real_transcripts.build_all(session, args.test_mode)
+                        generate_real_transcripts.build_all(session, args.test_mode, incremental=args.incremental)
                     else:
                         log_warning("Real transcripts source not available, skipping...")
                 except Exception as e:
@@ -21,13 +21,18 @@ Loads configuration from content_library/_rules/ YAML files.
 Provides centralized access to:
 - Numeric bounds (by doc_type and sector)
 - Fictional provider names (brokers, NGOs)
+- Categorical distributions (rating, severity level, meeting type)
 - Placeholder contracts (validation specs)
+
+Numeric bounds, providers and distributions are compiled once per run
+(get_compiled_rules) so per-document lookups are plain dict accesses.
 """
 
 import os
 import yaml
 from functools import lru_cache
-from typing import Dict, List, Any, Optional
+from itertools import accumulate
+from typing import Dict, List, Any, Optional, Tuple
 
 import config
 
@@ -76,6 +81,122 @@ def _load_placeholder_contract() -> Dict[str, Any]:
         return {}
 
 
+# =============================================================================
+# COMPILED RULES TABLE
+# =============================================================================
+
+# Map doc_type to YAML structure
+# YAML structure: security.broker_research.{sector} or issuer.ngo_reports.{sector}
+# (doc types not listed are looked up under 'security')
+NUMERIC_BOUNDS_LINKAGE = {
+    'broker_research': 'security',
+    'internal_research': 'security',
+    'investment_memo': 'security',
+    'press_releases': 'security',
+    'ngo_reports': 'issuer',
+    'engagement_notes': 'issuer',
+    'policy_docs': 'global',
+    'sales_templates': 'global',
+    'philosophy_docs': 'global',
+    'report_templates': 'global',
+    'macro_events': 'global'
+}
+
+# Fallbacks if YAML not loaded
+DEFAULT_FICTIONAL_BROKERS = [
+    'Ashfield Partners', 'Northgate Analytics', 'Blackstone Ridge Research',
+    'Fairmont Capital Insights', 'Kingswell Securities Research',
+    'Brookline Advisory Group', 'Harrow Street Markets', 'Marlowe & Co. Research',
+    'Crescent Point Analytics', 'Simulated Wharf Intelligence', 'Granite Peak Advisory',
+    'Alder & Finch Investments', 'Bluehaven Capital Research', 'Regent Square Analytics',
+    'Whitestone Equity Research'
+]
+
+DEFAULT_FICTIONAL_NGOS = {
+    'environmental': [
+        'Global Sustainability Watch', 'Environmental Justice Initiative',
+        'Climate Action Network', 'Green Future Alliance'
+    ],
+    'social': [
+        'Human Rights Monitor', 'Labour Rights Observatory',
+        'Ethical Investment Coalition', 'Fair Workplace Institute'
+    ],
+    'governance': [
+        'Corporate Accountability Forum', 'Transparency Advocacy Group',
+        'Corporate Responsibility Institute', 'Ethical Governance Council'
+    ]
+}
+
+DEFAULT_DISTRIBUTIONS = {
+    'rating': {
+        'Strong Buy': 0.10,
+        'Buy': 0.25,
+        'Hold': 0.45,
+        'Sell': 0.15,
+        'Strong Sell': 0.05
+    },
+    'severity_level': {
+        'High': 0.20,
+        'Medium': 0.40,
+        'Low': 0.40
+    },
+    'meeting_type': {
+        'Management Meeting': 0.40,
+        'Shareholder Call': 0.25,
+        'Site Visit': 0.15,
+        'Compliance Discussion': 0.20
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def get_compiled_rules() -> Dict[str, Any]:
+    """
+    Compile numeric_bounds.yaml and fictional_providers.yaml into lookup tables (cached).
+    
+    Returns:
+        Dict with:
+        - 'numeric_bounds': doc_type -> {sector: bounds with _default merged in, '_default': bounds}
+        - 'brokers': fictional broker names
+        - 'ngos': category -> fictional NGO names
+        - 'distributions': name -> (values, cumulative weights) for random.choices
+    """
+    bounds_data = _load_numeric_bounds()
+    doc_types = {
+        doc_type
+        for section in bounds_data.values() if isinstance(section, dict)
+        for doc_type in section
+    }
+    
+    numeric_bounds = {}
+    for doc_type in doc_types:
+        linkage = NUMERIC_BOUNDS_LINKAGE.get(doc_type, 'security')
+        doc_bounds = (bounds_data.get(linkage) or {}).get(doc_type)
+        if not isinstance(doc_bounds, dict):
+            continue
+        default_bounds = doc_bounds.get('_default') or {}
+        # Merge default with sector-specific (sector takes priority)
+        compiled = {
+            sector: {**default_bounds, **(sector_bounds or {})}
+            for sector, sector_bounds in doc_bounds.items()
+        }
+        compiled['_default'] = dict(default_bounds)
+        numeric_bounds[doc_type] = compiled
+    
+    providers = _load_fictional_providers()
+    distributions = {**DEFAULT_DISTRIBUTIONS, **(bounds_data.get('distributions') or {})}
+    
+    return {
+        'numeric_bounds': numeric_bounds,
+        'brokers': providers.get('fictional_brokers') or DEFAULT_FICTIONAL_BROKERS,
+        'ngos': providers.get('fictional_ngos') or DEFAULT_FICTIONAL_NGOS,
+        'distributions': {
+            name: (list(dist.keys()), list(accumulate(dist.values())))
+            for name, dist in distributions.items()
+        },
+    }
+
+
 # =============================================================================
 # NUMERIC BOUNDS ACCESSORS
 # =============================================================================
@@ -89,40 +210,14 @@ def get_numeric_bounds(doc_type: str, sector: str) -> Dict[str, Dict[str, float]
         sector: GICS sector (e.g., 'Information Technology')
     
     Returns:
-        Dict mapping placeholder names to {min, max} bounds
+        Dict mapping placeholder names to {min, max} bounds (shared - do not modify)
     """
-    bounds_data = _load_numeric_bounds()
-    
-    # Map doc_type to YAML structure
-    # YAML structure: security.broker_research.{sector} or issuer.ngo_reports.{sector}
-    linkage_map = {
-        'broker_research': 'security',
-        'internal_research': 'security',
-        'investment_memo': 'security',
-        'press_releases': 'security',
-        'ngo_reports': 'issuer',
-        'engagement_notes': 'issuer',
-        'policy_docs': 'global',
-        'sales_templates': 'global',
-        'philosophy_docs': 'global',
-        'report_templates': 'global',
-        'macro_events': 'global'
-    }
-    
-    linkage = linkage_map.get(doc_type, 'security')
-    
-    # Get bounds for this doc_type and sector
-    linkage_data = bounds_data.get(linkage, {})
-    doc_bounds = linkage_data.get(doc_type, {})
+    doc_bounds = get_compiled_rules()['numeric_bounds'].get(doc_type)
+    if not doc_bounds:
+        return {}
     
     # Try sector-specific, then default
-    sector_bounds = doc_bounds.get(sector, {})
-    default_bounds = doc_bounds.get('_default', {})
-    
-    # Merge default with sector-specific (sector takes priority)
-    merged = {**default_bounds, **sector_bounds}
-    
-    return merged
+    return doc_bounds.get(sector, doc_bounds['_default'])
 
 
 def get_all_numeric_bounds() -> Dict[str, Any]:
@@ -136,44 +231,22 @@ def get_all_numeric_bounds() -> Dict[str, Any]:
 
 def get_fictional_brokers() -> List[str]:
     """Get list of fictional broker names."""
-    providers = _load_fictional_providers()
-    brokers = providers.get('fictional_brokers', [])
-    
-    # Fallback if YAML not loaded
-    if not brokers:
-        return [
-            'Ashfield Partners', 'Northgate Analytics', 'Blackstone Ridge Research',
-            'Fairmont Capital Insights', 'Kingswell Securities Research',
-            'Brookline Advisory Group', 'Harrow Street Markets', 'Marlowe & Co. Research',
-            'Crescent Point Analytics', 'Simulated Wharf Intelligence', 'Granite Peak Advisory',
-            'Alder & Finch Investments', 'Bluehaven Capital Research', 'Regent Square Analytics',
-            'Whitestone Equity Research'
-        ]
-    return brokers
+    return get_compiled_rules()['brokers']
 
 
 def get_fictional_ngos() -> Dict[str, List[str]]:
     """Get dict of fictional NGO names by category."""
-    providers = _load_fictional_providers()
-    ngos = providers.get('fictional_ngos', {})
+    return get_compiled_rules()['ngos']
+
+
+def get_distribution(name: str) -> Tuple[List[str], List[float]]:
+    """
+    Get a categorical distribution as (values, cumulative weights).
     
-    # Fallback if YAML not loaded
-    if not ngos:
-        return {
-            'environmental': [
-                'Global Sustainability Watch', 'Environmental Justice Initiative',
-                'Climate Action Network', 'Green Future Alliance'
-            ],
-            'social': [
-                'Human Rights Monitor', 'Labour Rights Observatory',
-                'Ethical Investment Coalition', 'Fair Workplace Institute'
-            ],
-            'governance': [
-                'Corporate Accountability Forum', 'Transparency Advocacy Group',
-                'Corporate Responsibility Institute', 'Ethical Governance Council'
-            ]
-        }
-    return ngos
+    Raises:
+        KeyError: If the distribution is not defined
+    """
+    return get_compiled_rules()['distributions'][name]
 
 
 def get_forbidden_providers() -> Dict[str, List[str]]:
@@ -212,6 +285,7 @@ def clear_cache():
     _load_numeric_bounds.cache_clear()
     _load_fictional_providers.cache_clear()
     _load_placeholder_contract.cache_clear()
+    get_compiled_rules.cache_clear()
 
 
 def reload_rules():
@@ -221,4 +295,5 @@ def reload_rules():
     _load_numeric_bounds()
     _load_fictional_providers()
     _load_placeholder_contract()
+    get_compiled_rules()
 
@@ -18,14 +18,16 @@ Snowflake I/O Utilities
 
 This module provides:
 - cleanup_temp_stages(): Clean up leftover Snowpark temp stages
-- prefetch_* functions: Batch data lookups for hydration (avoid per-entity queries)
+- *_sql / index_* functions: Batch prefetch queries for hydration (avoid per-entity
+  queries) and their row indexing; callers submit several prefetches concurrently
+  (submit_queries) or embed them in larger SQL
 
 For writes, use native session.write_pandas() directly.
 For simple lookups, use session.sql().collect() with dict comprehension.
 """
 
-from typing import Dict, List, Any, Tuple
-from snowflake.snowpark import Session
+from typing import Dict, Iterable, List, Any, Tuple
+from snowflake.snowpark import AsyncJob, Session
 
 
 def cleanup_temp_objects(session: Session) -> None:
@@ -73,30 +75,9 @@ cleanup_temp_stages = cleanup_temp_objects
 # =============================================================================
 
 
-def prefetch_security_contexts(
-    session: Session,
-    database_name: str,
-    security_ids: List[int]
-) -> Dict[int, Dict[str, Any]]:
-    """
-    Prefetch security context data for multiple SecurityIDs in a single query.
-    
-    Used by hydration engine to avoid per-entity SELECT queries.
-    
-    Args:
-        session: Active Snowpark session
-        database_name: Database name
-        security_ids: List of SecurityIDs to prefetch
-    
-    Returns:
-        Dict mapping SecurityID to context data
-    """
-    if not security_ids:
-        return {}
-    
-    id_list = ", ".join(str(sid) for sid in security_ids)
-    
-    rows = session.sql(f"""
+def security_contexts_sql(database_name: str, id_list: str) -> str:
+    """Security context rows for the given SecurityIDs (id_list: literal list or subquery)."""
+    return f"""
         SELECT 
             ds.SecurityID,
             ds.Ticker,
@@ -110,35 +91,27 @@ def prefetch_security_contexts(
         FROM {database_name}.CURATED.DIM_SECURITY ds
         JOIN {database_name}.CURATED.DIM_ISSUER di ON ds.IssuerID = di.IssuerID
         WHERE ds.SecurityID IN ({id_list})
-    """).collect()
-    
-    return {row['SECURITYID']: row.as_dict() for row in rows}
+    """
 
 
-def prefetch_issuer_contexts(
-    session: Session,
-    database_name: str,
-    issuer_ids: List[int]
-) -> Dict[int, Dict[str, Any]]:
-    """
-    Prefetch issuer context data for multiple IssuerIDs in a single query.
-    
-    Used by hydration engine to avoid per-entity SELECT queries.
-    
-    Args:
-        session: Active Snowpark session
-        database_name: Database name
-        issuer_ids: List of IssuerIDs to prefetch
-    
-    Returns:
-        Dict mapping IssuerID to context data
+def security_ciks_sql(database_name: str, id_list: str) -> str:
+    """CIKs of the given SecurityIDs, as a subquery for fiscal calendar / SEC financials prefetches."""
+    return f"""
+        SELECT di.CIK
+        FROM {database_name}.CURATED.DIM_SECURITY ds
+        JOIN {database_name}.CURATED.DIM_ISSUER di ON ds.IssuerID = di.IssuerID
+        WHERE ds.SecurityID IN ({id_list}) AND di.CIK IS NOT NULL
     """
-    if not issuer_ids:
-        return {}
-    
-    id_list = ", ".join(str(iid) for iid in issuer_ids)
-    
-    rows = session.sql(f"""
+
+
+def index_security_contexts(rows: Iterable[Any]) -> Dict[int, Dict[str, Any]]:
+    """Map SecurityID to context data."""
+    return {row['SECURITYID']: row.as_dict() for row in rows}
+
+
+def issuer_contexts_sql(database_name: str, id_list: str) -> str:
+    """Issuer context rows for the given IssuerIDs; one row per security (id_list: literal list or subquery)."""
+    return f"""
         SELECT 
             di.IssuerID,
             di.LegalName as ISSUER_NAME,
@@ -149,9 +122,22 @@ def prefetch_issuer_contexts(
         FROM {database_name}.CURATED.DIM_ISSUER di
         LEFT JOIN {database_name}.CURATED.DIM_SECURITY ds ON di.IssuerID = ds.IssuerID
         WHERE di.IssuerID IN ({id_list})
-    """).collect()
-    
-    # Handle potential duplicate issuers with multiple securities (keep first)
+        ORDER BY di.IssuerID, ds.Ticker NULLS LAST
+    """
+
+
+def issuer_ciks_sql(database_name: str, id_list: str) -> str:
+    """CIKs of the given IssuerIDs, as a subquery for fiscal calendar prefetches."""
+    return f"""
+        SELECT CIK
+        FROM {database_name}.CURATED.DIM_ISSUER
+        WHERE IssuerID IN ({id_list}) AND CIK IS NOT NULL
+    """
+
+
+def index_issuer_contexts(rows: Iterable[Any]) -> Dict[int, Dict[str, Any]]:
+    """Map IssuerID to context data."""
+    # Handle potential duplicate issuers with multiple securities (keep first, i.e. lowest ticker)
     result = {}
     for row in rows:
         issuer_id = row['ISSUERID']
@@ -161,28 +147,9 @@ def prefetch_issuer_contexts(
     return result
 
 
-def prefetch_portfolio_contexts(
-    session: Session,
-    database_name: str,
-    portfolio_ids: List[int]
-) -> Dict[int, Dict[str, Any]]:
-    """
-    Prefetch portfolio context data for multiple PortfolioIDs in a single query.
-    
-    Args:
-        session: Active Snowpark session
-        database_name: Database name
-        portfolio_ids: List of PortfolioIDs to prefetch
-    
-    Returns:
-        Dict mapping PortfolioID to context data
-    """
-    if not portfolio_ids:
-        return {}
-    
-    id_list = ", ".join(str(pid) for pid in portfolio_ids)
-    
-    rows = session.sql(f"""
+def portfolio_contexts_sql(database_name: str, id_list: str) -> str:
+    """Portfolio context rows for the given PortfolioIDs."""
+    return f"""
         SELECT 
             PortfolioID,
             PortfolioName,
@@ -191,45 +158,18 @@ def prefetch_portfolio_contexts(
             InceptionDate
         FROM {database_name}.CURATED.DIM_PORTFOLIO
         WHERE PortfolioID IN ({id_list})
-    """).collect()
-    
+    """
+
+
+def index_portfolio_contexts(rows: Iterable[Any]) -> Dict[int, Dict[str, Any]]:
+    """Map PortfolioID to context data."""
     return {row['PORTFOLIOID']: row.as_dict() for row in rows}
 
 
-def prefetch_fiscal_calendars(
-    session: Session,
-    real_data_database: str,
-    real_data_schema: str,
-    ciks: List[str],
-    num_periods: int = 4
-) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Prefetch fiscal calendar data for multiple CIKs in a single query.
-    
-    Used by hydration engine for fiscal period lookups.
-    
-    Args:
-        session: Active Snowpark session
-        real_data_database: Database containing SEC data
-        real_data_schema: Schema containing SEC data
-        ciks: List of CIK identifiers to prefetch
-        num_periods: Number of recent periods per CIK
-    
-    Returns:
-        Dict mapping CIK to list of fiscal period dicts (most recent first)
-    """
-    if not ciks:
-        return {}
-    
-    # Filter out None/empty CIKs
-    valid_ciks = [c for c in ciks if c]
-    if not valid_ciks:
-        return {}
-    
-    cik_list = ", ".join(f"'{c}'" for c in valid_ciks)
-    
-    try:
-        rows = session.sql(f"""
+def fiscal_calendars_sql(real_data_database: str, real_data_schema: str, cik_list: str,
+                         num_periods: int = 4) -> str:
+    """Most recent fiscal quarters per CIK from SEC_FISCAL_CALENDARS (cik_list: quoted literal list or subquery)."""
+    return f"""
             SELECT 
                 CIK,
                 COMPANY_NAME,
@@ -245,57 +185,24 @@ def prefetch_fiscal_calendars(
                 AND PERIOD_END_DATE IS NOT NULL
             QUALIFY rn <= {num_periods}
             ORDER BY CIK, PERIOD_END_DATE DESC
-        """).collect()
-        
-        # Build dict of lists
-        result: Dict[str, List[Dict[str, Any]]] = {}
-        for row in rows:
-            cik = row['CIK']
-            if cik not in result:
-                result[cik] = []
-            result[cik].append(row.as_dict())
-        
-        return result
-    except Exception:
-        # If SEC_FISCAL_CALENDARS is not accessible, return empty dict
-        return {}
+        """
 
 
-def prefetch_sec_financials(
-    session: Session,
-    database_name: str,
-    ciks: List[str],
-    num_periods: int = 8
-) -> Dict[str, Dict[Tuple[int, str], Dict[str, Any]]]:
-    """
-    Prefetch SEC financial metrics for multiple CIKs in a single query.
-    
-    Returns data keyed by CIK then by (fiscal_year, fiscal_period) tuple,
-    enabling efficient lookup when hydrating documents for a specific quarter.
-    
-    Pre-computes YoY revenue growth using LAG window over 4 periods.
-    
-    Args:
-        session: Active Snowpark session
-        database_name: Database containing MARKET_DATA.FACT_SEC_FINANCIALS
-        ciks: List of CIK identifiers to prefetch
-        num_periods: Number of recent periods per CIK (default 8 for YoY calc)
-    
-    Returns:
-        Nested dict: financials[cik][(fiscal_year, fiscal_period)] = {metrics...}
-    """
-    if not ciks:
-        return {}
-    
-    # Filter out None/empty CIKs
-    valid_ciks = [c for c in ciks if c]
-    if not valid_ciks:
-        return {}
-    
-    cik_list = ", ".join(f"'{c}'" for c in valid_ciks)
+def group_fiscal_calendars(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group fiscal calendar rows (most recent first) into a dict of lists keyed by CIK."""
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        cik = row['CIK']
+        if cik not in result:
+            result[cik] = []
+        result[cik].append(row)
     
-    try:
-        rows = session.sql(f"""
+    return result
+
+
+def sec_financials_sql(database_name: str, cik_list: str, num_periods: int = 8) -> str:
+    """Recent quarterly SEC financials per CIK, with YoY revenue growth (cik_list: quoted literal list or subquery)."""
+    return f"""
             WITH ranked_financials AS (
                 SELECT 
                     CIK,
@@ -338,50 +245,66 @@ def prefetch_sec_financials(
             FROM ranked_financials
             WHERE rn <= {num_periods}
             ORDER BY CIK, PERIOD_END_DATE DESC
-        """).collect()
-        
-        # Build nested dict: cik -> (year, period) -> metrics
-        result: Dict[str, Dict[Tuple[int, str], Dict[str, Any]]] = {}
+        """
+
+
+def index_sec_financials(rows: Iterable[Any]) -> Dict[str, Dict[Tuple[int, str], Dict[str, Any]]]:
+    """Index SEC financial rows (Rows or dicts) as financials[cik][(fiscal_year, fiscal_period)]."""
+    # Build nested dict: cik -> (year, period) -> metrics
+    result: Dict[str, Dict[Tuple[int, str], Dict[str, Any]]] = {}
+    
+    for row in rows:
+        cik = row['CIK']
+        fiscal_year = int(row['FISCAL_YEAR']) if row['FISCAL_YEAR'] else None
+        fiscal_period = row['FISCAL_PERIOD']
         
-        for row in rows:
-            cik = row['CIK']
-            fiscal_year = int(row['FISCAL_YEAR']) if row['FISCAL_YEAR'] else None
-            fiscal_period = row['FISCAL_PERIOD']
-            
-            if not cik or not fiscal_year or not fiscal_period:
-                continue
-            
-            if cik not in result:
-                result[cik] = {}
-            
-            key = (fiscal_year, fiscal_period)
-            result[cik][key] = {
-                'REVENUE': row['REVENUE'],
-                'NET_INCOME': row['NET_INCOME'],
-                'GROSS_PROFIT': row['GROSS_PROFIT'],
-                'OPERATING_INCOME': row['OPERATING_INCOME'],
-                'EPS_BASIC': row['EPS_BASIC'],
-                'EPS_DILUTED': row['EPS_DILUTED'],
-                'GROSS_MARGIN_PCT': row['GROSS_MARGIN_PCT'],
-                'OPERATING_MARGIN_PCT': row['OPERATING_MARGIN_PCT'],
-                'NET_MARGIN_PCT': row['NET_MARGIN_PCT'],
-                'ROE_PCT': row['ROE_PCT'],
-                'ROA_PCT': row['ROA_PCT'],
-                'TOTAL_ASSETS': row['TOTAL_ASSETS'],
-                'TOTAL_LIABILITIES': row['TOTAL_LIABILITIES'],
-                'TOTAL_EQUITY': row['TOTAL_EQUITY'],
-                'CASH_AND_EQUIVALENTS': row['CASH_AND_EQUIVALENTS'],
-                'LONG_TERM_DEBT': row['LONG_TERM_DEBT'],
-                'OPERATING_CASH_FLOW': row['OPERATING_CASH_FLOW'],
-                'FREE_CASH_FLOW': row['FREE_CASH_FLOW'],
-                'DEBT_TO_EQUITY': row['DEBT_TO_EQUITY'],
-                'CURRENT_RATIO': row['CURRENT_RATIO'],
-                'YOY_REVENUE_GROWTH_PCT': row['YOY_REVENUE_GROWTH_PCT'],
-                'PERIOD_END_DATE': row['PERIOD_END_DATE'],
-            }
+        if not cik or not fiscal_year or not fiscal_period:
+            continue
         
-        return result
+        if cik not in result:
+            result[cik] = {}
         
-    except Exception:
-        # If FACT_SEC_FINANCIALS is not accessible, return empty dict
-        return {}
+        key = (fiscal_year, fiscal_period)
+        result[cik][key] = {
+            'REVENUE': row['REVENUE'],
+            'NET_INCOME': row['NET_INCOME'],
+            'GROSS_PROFIT': row['GROSS_PROFIT'],
+            'OPERATING_INCOME': row['OPERATING_INCOME'],
+            'EPS_BASIC': row['EPS_BASIC'],
+            'EPS_DILUTED': row['EPS_DILUTED'],
+            'GROSS_MARGIN_PCT': row['GROSS_MARGIN_PCT'],
+            'OPERATING_MARGIN_PCT': row['OPERATING_MARGIN_PCT'],
+            'NET_MARGIN_PCT': row['NET_MARGIN_PCT'],
+            'ROE_PCT': row['ROE_PCT'],
+            'ROA_PCT': row['ROA_PCT'],
+            'TOTAL_ASSETS': row['TOTAL_ASSETS'],
+            'TOTAL_LIABILITIES': row['TOTAL_LIABILITIES'],
+            'TOTAL_EQUITY': row['TOTAL_EQUITY'],
+            'CASH_AND_EQUIVALENTS': row['CASH_AND_EQUIVALENTS'],
+            'LONG_TERM_DEBT': row['LONG_TERM_DEBT'],
+            'OPERATING_CASH_FLOW': row['OPERATING_CASH_FLOW'],
+            'FREE_CASH_FLOW': row['FREE_CASH_FLOW'],
+            'DEBT_TO_EQUITY': row['DEBT_TO_EQUITY'],
+            'CURRENT_RATIO': row['CURRENT_RATIO'],
+            'YOY_REVENUE_GROWTH_PCT': row['YOY_REVENUE_GROWTH_PCT'],
+            'PERIOD_END_DATE': row['PERIOD_END_DATE'],
+        }
+    
+    return result
+
+
+def submit_queries(session: Session, queries: Dict[str, str]) -> Dict[str, AsyncJob]:
+    """
+    Submit independent queries without waiting for each other (collect_nowait).
+    
+    Snowflake runs them concurrently; call .result() on each job to gather rows.
+    Query errors surface from .result(), so callers keep their per-query handling.
+    
+    Args:
+        session: Active Snowpark session
+        queries: Dict mapping a name to SQL text
+    
+    Returns:
+        Dict mapping the same names to AsyncJob handles
+    """
+    return {name: session.sql(sql).collect_nowait() for name, sql in queries.items()}
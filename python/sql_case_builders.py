@@ -90,6 +90,32 @@ def build_sector_case_sql(column: str, path: str, sectors: list = None) -> str:
     return f"CASE {' '.join(clauses)} ELSE {default_sql} END"
 
 
+def build_sic_to_gics_case_sql(column: str) -> str:
+    """
+    Build SQL CASE WHEN mapping a SIC description to a GICS sector.
+    
+    Mirrors hydration_engine.map_sic_to_gics: the first sector in
+    config.SIC_TO_GICS_MAPPING order with any keyword contained in the
+    lower-cased description wins; no match maps to ''.
+    
+    Args:
+        column: SQL column name (e.g., 'i.SIC_DESCRIPTION')
+    
+    Returns:
+        SQL CASE expression
+    
+    Example:
+        build_sic_to_gics_case_sql('SIC_DESCRIPTION')
+        # Returns: "CASE WHEN CONTAINS(LOWER(SIC_DESCRIPTION), 'software') OR ... THEN 'Information Technology' ... ELSE '' END"
+    """
+    clauses = []
+    for sector, keywords in config.SIC_TO_GICS_MAPPING.items():
+        conditions = ' OR '.join(f"CONTAINS(LOWER({column}), '{keyword}')" for keyword in keywords)
+        clauses.append(f"WHEN {conditions} THEN '{sector}'")
+    
+    return f"CASE {' '.join(clauses)} ELSE '' END"
+
+
 def build_country_group_case_sql(column: str, path: str) -> str:
     """
     Build SQL CASE WHEN for country-group-based UNIFORM ranges.
@@ -364,7 +364,7 @@ $$;
 -- ============================================================================
 
 -- AI Components Setup (Semantic Views & Search Services)
-CREATE OR REPLACE PROCEDURE SAM_DEMO.PUBLIC.SETUP_AI_COMPONENTS()
+CREATE OR REPLACE PROCEDURE SAM_DEMO.PUBLIC.SETUP_AI_COMPONENTS(TABLE_LAYOUT VARCHAR DEFAULT NULL)
 RETURNS STRING
 LANGUAGE PYTHON
 RUNTIME_VERSION = '3.11'
@@ -376,8 +376,13 @@ $$
 import os
 import sys
 
-def run_ai_setup(session) -> str:
-    """Creates AI components: semantic views and Cortex Search services."""
+def run_ai_setup(session, table_layout=None) -> str:
+    """
+    Creates AI components: semantic views and Cortex Search services.
+    
+    table_layout ('off', 'sort' or 'cluster'; default config TABLE_LAYOUT) rewrites
+    the large fact tables after the semantic views exist, profiling their queries.
+    """
     import tempfile
     
     tmp_dir = tempfile.mkdtemp(prefix='sam_ai_')
@@ -389,8 +394,8 @@ def run_ai_setup(session) -> str:
     
     python_files = [
         'config.py', 'config_accessors.py', 'db_helpers.py', 'demo_helpers.py',
-        'logging_utils.py', 'scenario_utils.py',
-        'build_ai.py', 'create_semantic_views.py', 'create_cortex_search.py'
+        'logging_utils.py', 'scenario_utils.py', 'sql_case_builders.py', 'sql_utils.py',
+        'generate_structured.py', 'build_ai.py', 'create_semantic_views.py', 'create_cortex_search.py'
     ]
     
     for f in python_files:
@@ -417,6 +422,19 @@ def run_ai_setup(session) -> str:
         results.append(f"  ERROR: {e}")
         raise
     
+    # Optional fact table layout (profiled on the semantic-view queries)
+    if table_layout:
+        config.TABLE_LAYOUT['mode'] = table_layout
+    if config.TABLE_LAYOUT['mode'] != 'off':
+        results.append(f"\n=== Fact Table Layout ({config.TABLE_LAYOUT['mode']}) ===")
+        import generate_structured
+        layout = generate_structured.optimize_table_layouts(session)
+        for query, stats in layout['queries'].items():
+            results.append(
+                f"  {query}: partitions scanned {stats['before'].get('partitions_scanned', 0):,} -> "
+                f"{stats['after'].get('partitions_scanned', 0):,}"
+            )
+    
     # Create search services
     results.append(f"\n=== Creating Cortex Search Services ===")
     try:
@@ -507,7 +525,22 @@ $$;
 CREATE STAGE IF NOT EXISTS SAM_DEMO.AI.PDF_REPORTS
     ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE');
 
--- PDF Report Generator (used by all agents) 
+-- Cache index for GENERATE_PDF_REPORT (matches build_ai.create_pdf_report_stage)
+CREATE TABLE IF NOT EXISTS SAM_DEMO.AI.PDF_REPORT_CACHE (
+    CACHE_KEY VARCHAR NOT NULL PRIMARY KEY,
+    PDF_FILENAME VARCHAR NOT NULL,
+    DOCUMENT_AUDIENCE VARCHAR,
+    REPORT_TITLE VARCHAR,
+    RENDER_MS NUMBER(38,0),
+    RENDER_COUNT NUMBER(38,0) DEFAULT 1,
+    HIT_COUNT NUMBER(38,0) DEFAULT 0,
+    CREATED_AT TIMESTAMP_NTZ,
+    LAST_USED_AT TIMESTAMP_NTZ
+)
+COMMENT = 'Cache index for GENERATE_PDF_REPORT keyed on SHA-256 of markdown, title and audience';
+
+-- PDF Report Generator (used by all agents) - content-addressed and cached in
+-- PDF_REPORT_CACHE; body is python/pdf_report_renderer.py (matches build_ai.py)
 CREATE OR REPLACE PROCEDURE SAM_DEMO.AI.GENERATE_PDF_REPORT(
     markdown_content VARCHAR,
     report_title VARCHAR,
@@ -520,39 +553,537 @@ PACKAGES = ('snowflake-snowpark-python','markdown','weasyprint')
 HANDLER = 'generate_pdf'
 AS
 $$
-from snowflake.snowpark import Session
-from datetime import datetime
+# Copyright 2026 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# =============================================================================
+# PDF REPORT RENDERER - Markdown -> HTML -> PDF
+# =============================================================================
+"""
+Branded PDF report renderer shared by the GENERATE_PDF_REPORT and
+GENERATE_PDF_REPORTS_BATCH stored procedures.
+
+build_ai.create_pdf_report_tool inlines this file as the procedure body, and
+scripts/setup.sql carries the same generated procedures, so it must stay
+self-contained (no config or logging imports) and setup.sql must be
+regenerated when it changes. Locally it can be
+imported to render, profile and load-test reports with a local disk store in
+place of the Snowflake stage.
+
+Stores are dicts of callables (see stage_report_store / local_report_store):
+- find_cached(reports) -> set of cache keys already rendered and stored
+- record_hits({cache_key: hits})
+- record_renders([(report, render_ms), ...])
+- upload(directory) -> stores every *.pdf rendered into directory
+- links([pdf_filename, ...]) -> {pdf_filename: download_url}
+"""
+
+import base64
+import glob
+import hashlib
+import json
+import os
 import re
-import markdown
+import shutil
 import tempfile
-import os
-import base64
+import time
+from collections import Counter
+from datetime import datetime
+
+import markdown
+
+VALID_AUDIENCES = ['internal', 'external_client', 'external_regulatory']
+
+AUDIENCE_LABELS = {
+    'internal': 'Internal Report',
+    'external_client': 'Client Report',
+    'external_regulatory': 'Regulatory Report'
+}
+
+# Embedded SVG logo (mountain peak design with SAM brand colors)
+SVG_LOGO = '''
+    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 120 50" width="120" height="50">
+        <!-- Mountain peaks -->
+        <polygon points="30,45 45,15 60,45" fill="#1F4E79"/>
+        <polygon points="50,45 70,8 90,45" fill="#2E75B6"/>
+        <polygon points="15,45 25,30 35,45" fill="#3F7CAC" opacity="0.8"/>
+        <!-- Snow cap on main peak -->
+        <polygon points="70,8 65,18 75,18" fill="white"/>
+        <!-- Base line -->
+        <line x1="10" y1="45" x2="95" y2="45" stroke="#1F4E79" stroke-width="2"/>
+    </svg>
+    '''
+
+# Encoded once per process instead of once per report
+LOGO_SRC = f"data:image/svg+xml;base64,{base64.b64encode(SVG_LOGO.encode('utf-8')).decode('utf-8')}"
+
+# Professional CSS styling for investment reports
+CSS_STYLE = """
+    @page { size: A4; margin: 2cm; }
+    body { font-family: Arial, sans-serif; line-height: 1.6; color: #2C3E50; }
+    h1 { color: #1F4E79; border-bottom: 3px solid #1F4E79; padding-bottom: 10px; }
+    h2 { color: #2E75B6; border-left: 4px solid #2E75B6; padding-left: 15px; margin-top: 25px; }
+    h3 { color: #3F7CAC; }
+    table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+    th { background-color: #1F4E79; color: white; padding: 12px; font-weight: bold; text-align: left; }
+    td { padding: 10px; border-bottom: 1px solid #ddd; }
+    tr:nth-child(even) { background-color: #F8F9FA; }
+    .header { display: flex; align-items: center; border-bottom: 3px solid #1F4E79; padding-bottom: 15px; margin-bottom: 25px; }
+    .header-logo { margin-right: 20px; }
+    .header-text { flex: 1; }
+    .header-title { margin: 0; color: #1F4E79; font-size: 24px; }
+    .header-subtitle { margin: 5px 0 0 0; color: #666; font-size: 14px; }
+    .footer { margin-top: 30px; padding-top: 15px; border-top: 2px solid #1F4E79; font-size: 11px; color: #666; }
+    .demo-disclaimer { background: #FFF3CD; border: 1px solid #FFE69C; padding: 12px; margin-top: 15px; font-size: 10px; color: #664D03; border-radius: 4px; }
+    .internal-badge { background: #E7F3FF; color: #1F4E79; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }
+    .regulatory-badge { background: #F8D7DA; color: #721C24; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }
+"""
+
+# Demo disclaimer (all audiences)
+DEMO_DISCLAIMER = """
+    <div class="demo-disclaimer">
+        <strong>DEMONSTRATION ONLY:</strong> This document was generated by Snowflake Intelligence
+        for demonstration purposes. It does not represent real investment advice, actual portfolio data,
+        or genuine recommendations. Simulated Asset Management is a fictional entity created for this demo.
+    </div>
+"""
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def parse_report_records(records: list) -> list:
+    """
+    Validate GENERATE_PDF_REPORTS_BATCH input into (markdown, title, audience) tuples.
+
+    Each record is an object with markdown_content, report_title and optional
+    document_audience keys, a [markdown_content, report_title(, document_audience)]
+    array, or a JSON string of either. The audience defaults to 'internal'.
+    Malformed records raise ValueError naming the record index.
+    """
+    reports = []
+    for index, record in enumerate(records or []):
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except ValueError:
+                raise ValueError(f"Report record {index}: string is not a JSON object or array")
+        if isinstance(record, dict):
+            markdown_content = record.get('markdown_content')
+            report_title = record.get('report_title')
+            document_audience = record.get('document_audience')
+        elif isinstance(record, (list, tuple)) and len(record) in (2, 3):
+            markdown_content, report_title = record[0], record[1]
+            document_audience = record[2] if len(record) == 3 else None
+        else:
+            raise ValueError(
+                f"Report record {index}: expected an object or a "
+                "[markdown_content, report_title, document_audience] array"
+            )
+        if not isinstance(markdown_content, str) or not markdown_content.strip():
+            raise ValueError(f"Report record {index}: markdown_content is required")
+        if not isinstance(report_title, str) or not report_title.strip():
+            raise ValueError(f"Report record {index}: report_title is required")
+        reports.append((markdown_content, report_title, document_audience or 'internal'))
+    return reports
+
+
+def prepare_report(markdown_content: str, report_title: str, document_audience: str) -> dict:
+    """Validate audience and derive the content-addressed cache key and filename."""
+    # Validate audience
+    if document_audience not in VALID_AUDIENCES:
+        document_audience = 'internal'  # Default to internal if invalid
+
+    # Content-addressed filename: identical markdown, title and audience map to the same PDF
+    cache_key = hashlib.sha256(
+        '\x1f'.join([markdown_content or '', report_title or '', document_audience]).encode('utf-8')
+    ).hexdigest()
+    safe_title = re.sub(r'[^a-zA-Z0-9_]', '_', report_title)[:30]
+    return {
+        'markdown_content': markdown_content,
+        'report_title': report_title,
+        'document_audience': document_audience,
+        'cache_key': cache_key,
+        'pdf_filename': f'{document_audience}_{safe_title}_{cache_key[:16]}.pdf'
+    }
+
+
+def build_report_html(markdown_content: str, report_title: str, document_audience: str) -> str:
+    """Build the complete branded HTML document for one report."""
+    # Convert markdown to HTML
+    html_body = markdown.markdown(markdown_content, extensions=['tables', 'fenced_code'])
+
+    # Audience-specific header subtitle
+    if document_audience == 'internal':
+        header_subtitle = f'<span class="internal-badge">INTERNAL DOCUMENT</span> | {report_title}'
+    elif document_audience == 'external_regulatory':
+        header_subtitle = f'<span class="regulatory-badge">FCA REGULATED</span> | {report_title}'
+    else:  # external_client
+        header_subtitle = report_title
+
+    # Build header with logo
+    sam_header = f"""
+    <div class="header">
+        <div class="header-logo">
+            <img src="{LOGO_SRC}" alt="Simulated Asset Management" style="height: 50px;"/>
+        </div>
+        <div class="header-text">
+            <h1 class="header-title" style="border: none; padding: 0;">SIMULATED ASSET MANAGEMENT</h1>
+            <p class="header-subtitle">{header_subtitle}</p>
+        </div>
+    </div>
+    """
+
+    # Audience-specific footer content
+    report_timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p UTC')
+
+    if document_audience == 'internal':
+        footer_content = f"""
+        <p><strong>Classification:</strong> Internal Use Only - Not for Distribution</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        <p><strong>Generated By:</strong> Snowflake Intelligence</p>
+        """
+    elif document_audience == 'external_regulatory':
+        footer_content = f"""
+        <p><strong>Regulatory Status:</strong> Prepared in accordance with FCA reporting requirements</p>
+        <p><strong>Compliance Contact:</strong> compliance@sam-demo.example</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        """
+    else:  # external_client
+        footer_content = f"""
+        <p><strong>Important:</strong> Past performance does not guarantee future results. Investment involves risk including possible loss of principal.</p>
+        <p><strong>Contact:</strong> clientservices@sam-demo.example</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        """
+
+    # Complete HTML document
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <title>Simulated Asset Management - {report_title}</title>
+        <style>{CSS_STYLE}</style>
+    </head>
+    <body>
+        {sam_header}
+        {html_body}
+        <div class="footer">
+            {footer_content}
+            {DEMO_DISCLAIMER}
+        </div>
+    </body>
+    </html>
+    """
+
+
+def create_font_config():
+    """Create a weasyprint font configuration to share across renders."""
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # weasyprint < 53
+        from weasyprint.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+def render_pdf(report: dict, pdf_path: str, font_config=None):
+    """Render one prepared report to pdf_path."""
+    import weasyprint
+    html_content = build_report_html(
+        report['markdown_content'], report['report_title'], report['document_audience']
+    )
+    weasyprint.HTML(string=html_content).write_pdf(pdf_path, font_config=font_config)
+
+
+def format_report_link(report_title: str, document_audience: str, presigned_url: str) -> str:
+    """Format the agent-facing download link for a generated report."""
+    audience_label = AUDIENCE_LABELS.get(document_audience, 'Report')
+    return f"[{audience_label}: {report_title}]({presigned_url}) - Professional PDF generated successfully with Simulated branding."
+
+
+def generate_reports(reports: list, store: dict) -> list:
+    """
+    Render, store and link a list of (markdown_content, report_title, document_audience).
+
+    Cached reports skip rendering; the remaining ones share one weasyprint font
+    configuration and are handed to the store in a single upload. Links are
+    returned in input order.
+    """
+    prepared = [prepare_report(*report) for report in reports]
+    unique_reports = {r['cache_key']: r for r in prepared}
+    cached_keys = store['find_cached'](list(unique_reports.values()))
+    to_render = [r for key, r in unique_reports.items() if key not in cached_keys]
+
+    if to_render:
+        font_config = create_font_config()
+        rendered = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for report in to_render:
+                render_started = time.perf_counter()
+                render_pdf(report, os.path.join(tmpdir, report['pdf_filename']), font_config)
+                rendered.append((report, time.perf_counter() - render_started))
+
+            # Upload all rendered PDFs together
+            upload_started = time.perf_counter()
+            store['upload'](tmpdir)
+            upload_share = (time.perf_counter() - upload_started) / len(rendered)
+
+        store['record_renders']([
+            (report, int((render_seconds + upload_share) * 1000)) for report, render_seconds in rendered
+        ])
+
+    # Every request beyond the first render of a report is a cache hit
+    hit_counts = Counter(r['cache_key'] for r in prepared)
+    for report in to_render:
+        hit_counts[report['cache_key']] -= 1
+    hit_counts = {key: hits for key, hits in hit_counts.items() if hits > 0}
+    if hit_counts:
+        store['record_hits'](hit_counts)
+
+    links = store['links']([r['pdf_filename'] for r in unique_reports.values()])
+    return [
+        format_report_link(r['report_title'], r['document_audience'], links[r['pdf_filename']])
+        for r in prepared
+    ]
+
+
+# =============================================================================
+# STORES
+# =============================================================================
+
+def stage_report_store(session, stage_path: str, cache_table: str) -> dict:
+    """Store PDFs on a Snowflake stage, indexed by a cache table, linked by presigned URL."""
+
+    def find_cached(reports: list) -> set:
+        placeholders = ', '.join(['?'] * len(reports))
+        cached_keys = {
+            row['CACHE_KEY'] for row in session.sql(
+                f"SELECT CACHE_KEY FROM {cache_table} WHERE CACHE_KEY IN ({placeholders})",
+                params=[r['cache_key'] for r in reports]
+            ).collect()
+        }
+        if not cached_keys:
+            return set()
+
+        # Guard against stage files removed outside the procedures (one LIST per call)
+        key_pattern = '|'.join(key[:16] for key in cached_keys)
+        staged_files = {
+            row['name'].rsplit('/', 1)[-1] for row in session.sql(
+                f"LIST {stage_path} PATTERN = '.*_({key_pattern})[.]pdf'"
+            ).collect()
+        }
+        return {r['cache_key'] for r in reports
+                if r['cache_key'] in cached_keys and r['pdf_filename'] in staged_files}
+
+    def record_hits(hit_counts: dict):
+        values = ', '.join(['(?, ?)'] * len(hit_counts))
+        params = [v for key, hits in hit_counts.items() for v in (key, hits)]
+        session.sql(
+            f"""MERGE INTO {cache_table} t
+                USING (SELECT column1 AS CACHE_KEY, column2 AS HITS FROM VALUES {values}) s
+                ON t.CACHE_KEY = s.CACHE_KEY
+                WHEN MATCHED THEN UPDATE SET
+                    HIT_COUNT = t.HIT_COUNT + s.HITS,
+                    LAST_USED_AT = CURRENT_TIMESTAMP()::TIMESTAMP_NTZ""",
+            params=params
+        ).collect()
+
+    def record_renders(rendered: list):
+        values = ', '.join(['(?, ?, ?, ?, ?)'] * len(rendered))
+        params = [v for report, render_ms in rendered
+                  for v in (report['cache_key'], report['pdf_filename'], report['document_audience'],
+                            report['report_title'], render_ms)]
+        session.sql(
+            f"""MERGE INTO {cache_table} t
+                USING (SELECT column1 AS CACHE_KEY, column2 AS PDF_FILENAME, column3 AS DOCUMENT_AUDIENCE,
+                              column4 AS REPORT_TITLE, column5 AS RENDER_MS
+                       FROM VALUES {values}) s
+                ON t.CACHE_KEY = s.CACHE_KEY
+                WHEN MATCHED THEN UPDATE SET
+                    PDF_FILENAME = s.PDF_FILENAME,
+                    RENDER_MS = s.RENDER_MS,
+                    RENDER_COUNT = t.RENDER_COUNT + 1,
+                    LAST_USED_AT = CURRENT_TIMESTAMP()::TIMESTAMP_NTZ
+                WHEN NOT MATCHED THEN INSERT
+                    (CACHE_KEY, PDF_FILENAME, DOCUMENT_AUDIENCE, REPORT_TITLE, RENDER_MS,
+                     RENDER_COUNT, HIT_COUNT, CREATED_AT, LAST_USED_AT)
+                VALUES
+                    (s.CACHE_KEY, s.PDF_FILENAME, s.DOCUMENT_AUDIENCE, s.REPORT_TITLE, s.RENDER_MS,
+                     1, 0, CURRENT_TIMESTAMP()::TIMESTAMP_NTZ, CURRENT_TIMESTAMP()::TIMESTAMP_NTZ)""",
+            params=params
+        ).collect()
+
+    def upload(directory: str):
+        session.file.put(os.path.join(directory, '*.pdf'), stage_path, overwrite=True, auto_compress=False)
+
+    def links(pdf_filenames: list) -> dict:
+        values = ', '.join(['(?)'] * len(pdf_filenames))
+        return {
+            row['FILE_NAME']: row['URL'] for row in session.sql(
+                f"""SELECT column1 AS FILE_NAME, GET_PRESIGNED_URL('{stage_path}', column1) AS URL
+                    FROM VALUES {values}""",
+                params=list(pdf_filenames)
+            ).collect()
+        }
+
+    return {
+        'find_cached': find_cached,
+        'record_hits': record_hits,
+        'record_renders': record_renders,
+        'upload': upload,
+        'links': links,
+    }
+
+
+def local_report_store(directory: str, use_cache: bool = True) -> dict:
+    """
+    Store PDFs in a local directory, linked by file:// URL.
+
+    Cache bookkeeping is kept in memory on the returned dict ('hits' and
+    'render_ms'); use_cache=False forces every report to render.
+    """
+    os.makedirs(directory, exist_ok=True)
+    store = {'hits': Counter(), 'render_ms': {}}
+
+    def find_cached(reports: list) -> set:
+        if not use_cache:
+            return set()
+        return {r['cache_key'] for r in reports
+                if os.path.exists(os.path.join(directory, r['pdf_filename']))}
+
+    def record_hits(hit_counts: dict):
+        store['hits'].update(hit_counts)
+
+    def record_renders(rendered: list):
+        for report, render_ms in rendered:
+            store['render_ms'][report['cache_key']] = render_ms
+
+    def upload(source_directory: str):
+        for pdf_path in glob.glob(os.path.join(source_directory, '*.pdf')):
+            shutil.copy(pdf_path, directory)
+
+    def links(pdf_filenames: list) -> dict:
+        return {name: 'file://' + os.path.abspath(os.path.join(directory, name)) for name in pdf_filenames}
+
+    store.update({
+        'find_cached': find_cached,
+        'record_hits': record_hits,
+        'record_renders': record_renders,
+        'upload': upload,
+        'links': links,
+    })
+    return store
+
+
+from snowflake.snowpark import Session
+
+STAGE_PATH = '@SAM_DEMO.AI.PDF_REPORTS'
+CACHE_TABLE = 'SAM_DEMO.AI.PDF_REPORT_CACHE'
+
 
 def generate_pdf(session: Session, markdown_content: str, report_title: str, document_audience: str):
     """
     Generate professional branded PDF report from markdown content.
-    
+
     Args:
         session: Snowpark session
         markdown_content: Complete markdown document from agent (using retrieved templates)
         report_title: Title for the document header (e.g., "Q4 2024 Client Review")
         document_audience: One of "internal", "external_client", or "external_regulatory"
-        
+
     Returns:
         String with download link to generated PDF
     """
-    # Validate audience
-    valid_audiences = ['internal', 'external_client', 'external_regulatory']
-    if document_audience not in valid_audiences:
-        document_audience = 'internal'  # Default to internal if invalid
-    
-    # Generate filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    safe_title = re.sub(r'[^a-zA-Z0-9_]', '_', report_title)[:30]
-    pdf_filename = f'{document_audience}_{safe_title}_{timestamp}.pdf'
-    
-    # Embedded SVG logo (mountain peak design with SAM brand colors)
-    svg_logo = '''
+    store = stage_report_store(session, STAGE_PATH, CACHE_TABLE)
+    return generate_reports([(markdown_content, report_title, document_audience)], store)[0]
+$$;
+
+-- Batch PDF Report Generator - many reports per call, sharing the renderer and
+-- cache of GENERATE_PDF_REPORT (matches build_ai.py)
+CREATE OR REPLACE PROCEDURE SAM_DEMO.AI.GENERATE_PDF_REPORTS_BATCH(
+    reports ARRAY
+)
+RETURNS ARRAY
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python','markdown','weasyprint')
+HANDLER = 'generate_pdf_batch'
+AS
+$$
+# Copyright 2026 Snowflake Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# =============================================================================
+# PDF REPORT RENDERER - Markdown -> HTML -> PDF
+# =============================================================================
+"""
+Branded PDF report renderer shared by the GENERATE_PDF_REPORT and
+GENERATE_PDF_REPORTS_BATCH stored procedures.
+
+build_ai.create_pdf_report_tool inlines this file as the procedure body, and
+scripts/setup.sql carries the same generated procedures, so it must stay
+self-contained (no config or logging imports) and setup.sql must be
+regenerated when it changes. Locally it can be
+imported to render, profile and load-test reports with a local disk store in
+place of the Snowflake stage.
+
+Stores are dicts of callables (see stage_report_store / local_report_store):
+- find_cached(reports) -> set of cache keys already rendered and stored
+- record_hits({cache_key: hits})
+- record_renders([(report, render_ms), ...])
+- upload(directory) -> stores every *.pdf rendered into directory
+- links([pdf_filename, ...]) -> {pdf_filename: download_url}
+"""
+
+import base64
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+
+import markdown
+
+VALID_AUDIENCES = ['internal', 'external_client', 'external_regulatory']
+
+AUDIENCE_LABELS = {
+    'internal': 'Internal Report',
+    'external_client': 'Client Report',
+    'external_regulatory': 'Regulatory Report'
+}
+
+# Embedded SVG logo (mountain peak design with SAM brand colors)
+SVG_LOGO = '''
     <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 120 50" width="120" height="50">
         <!-- Mountain peaks -->
         <polygon points="30,45 45,15 60,45" fill="#1F4E79"/>
@@ -564,142 +1095,392 @@ def generate_pdf(session: Session, markdown_content: str, report_title: str, doc
         <line x1="10" y1="45" x2="95" y2="45" stroke="#1F4E79" stroke-width="2"/>
     </svg>
     '''
-    
-    # Encode SVG for embedding
-    svg_base64 = base64.b64encode(svg_logo.encode('utf-8')).decode('utf-8')
-    logo_src = f'data:image/svg+xml;base64,{svg_base64}'
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Convert markdown to HTML
-        html_body = markdown.markdown(markdown_content, extensions=['tables', 'fenced_code'])
-        
-        # Professional CSS styling for investment reports
-        css_style = """
-            @page { size: A4 landscape; margin: 1.2cm; }
-            body { font-family: Arial, sans-serif; line-height: 1.5; color: #2C3E50; font-size: 11px; }
-            h1 { color: #1F4E79; border-bottom: 3px solid #1F4E79; padding-bottom: 8px; font-size: 20px; }
-            h2 { color: #2E75B6; border-left: 4px solid #2E75B6; padding-left: 12px; margin-top: 20px; font-size: 16px; }
-            h3 { color: #3F7CAC; font-size: 14px; }
-            table { border-collapse: collapse; width: 100%; margin: 15px 0; table-layout: fixed; font-size: 9px; }
-            th { background-color: #1F4E79; color: white; padding: 6px 4px; font-weight: bold; text-align: left; word-wrap: break-word; overflow-wrap: break-word; }
-            td { padding: 5px 4px; border-bottom: 1px solid #ddd; word-wrap: break-word; overflow-wrap: break-word; }
-            tr:nth-child(even) { background-color: #F8F9FA; }
-            .header { display: flex; align-items: center; border-bottom: 3px solid #1F4E79; padding-bottom: 12px; margin-bottom: 20px; }
-            .header-logo { margin-right: 15px; }
-            .header-text { flex: 1; }
-            .header-title { margin: 0; color: #1F4E79; font-size: 20px; }
-            .header-subtitle { margin: 5px 0 0 0; color: #666; font-size: 12px; }
-            .footer { margin-top: 25px; padding-top: 12px; border-top: 2px solid #1F4E79; font-size: 9px; color: #666; }
-            .demo-disclaimer { background: #FFF3CD; border: 1px solid #FFE69C; padding: 10px; margin-top: 12px; font-size: 9px; color: #664D03; border-radius: 4px; }
-            .internal-badge { background: #E7F3FF; color: #1F4E79; padding: 2px 6px; border-radius: 3px; font-size: 10px; font-weight: bold; }
-            .regulatory-badge { background: #F8D7DA; color: #721C24; padding: 2px 6px; border-radius: 3px; font-size: 10px; font-weight: bold; }
-        """
-        
-        # Audience-specific header subtitle
-        if document_audience == 'internal':
-            header_subtitle = f'<span class="internal-badge">INTERNAL DOCUMENT</span> | {report_title}'
-        elif document_audience == 'external_regulatory':
-            header_subtitle = f'<span class="regulatory-badge">FCA REGULATED</span> | {report_title}'
-        else:  # external_client
-            header_subtitle = report_title
-        
-        # Build header with logo
-        sam_header = f"""
-        <div class="header">
-            <div class="header-logo">
-                <img src="{logo_src}" alt="Simulated Asset Management" style="height: 50px;"/>
-            </div>
-            <div class="header-text">
-                <h1 class="header-title" style="border: none; padding: 0;">SIMULATED ASSET MANAGEMENT</h1>
-                <p class="header-subtitle">{header_subtitle}</p>
-            </div>
+
+# Encoded once per process instead of once per report
+LOGO_SRC = f"data:image/svg+xml;base64,{base64.b64encode(SVG_LOGO.encode('utf-8')).decode('utf-8')}"
+
+# Professional CSS styling for investment reports
+CSS_STYLE = """
+    @page { size: A4; margin: 2cm; }
+    body { font-family: Arial, sans-serif; line-height: 1.6; color: #2C3E50; }
+    h1 { color: #1F4E79; border-bottom: 3px solid #1F4E79; padding-bottom: 10px; }
+    h2 { color: #2E75B6; border-left: 4px solid #2E75B6; padding-left: 15px; margin-top: 25px; }
+    h3 { color: #3F7CAC; }
+    table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+    th { background-color: #1F4E79; color: white; padding: 12px; font-weight: bold; text-align: left; }
+    td { padding: 10px; border-bottom: 1px solid #ddd; }
+    tr:nth-child(even) { background-color: #F8F9FA; }
+    .header { display: flex; align-items: center; border-bottom: 3px solid #1F4E79; padding-bottom: 15px; margin-bottom: 25px; }
+    .header-logo { margin-right: 20px; }
+    .header-text { flex: 1; }
+    .header-title { margin: 0; color: #1F4E79; font-size: 24px; }
+    .header-subtitle { margin: 5px 0 0 0; color: #666; font-size: 14px; }
+    .footer { margin-top: 30px; padding-top: 15px; border-top: 2px solid #1F4E79; font-size: 11px; color: #666; }
+    .demo-disclaimer { background: #FFF3CD; border: 1px solid #FFE69C; padding: 12px; margin-top: 15px; font-size: 10px; color: #664D03; border-radius: 4px; }
+    .internal-badge { background: #E7F3FF; color: #1F4E79; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }
+    .regulatory-badge { background: #F8D7DA; color: #721C24; padding: 3px 8px; border-radius: 3px; font-size: 11px; font-weight: bold; }
+"""
+
+# Demo disclaimer (all audiences)
+DEMO_DISCLAIMER = """
+    <div class="demo-disclaimer">
+        <strong>DEMONSTRATION ONLY:</strong> This document was generated by Snowflake Intelligence
+        for demonstration purposes. It does not represent real investment advice, actual portfolio data,
+        or genuine recommendations. Simulated Asset Management is a fictional entity created for this demo.
+    </div>
+"""
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def parse_report_records(records: list) -> list:
+    """
+    Validate GENERATE_PDF_REPORTS_BATCH input into (markdown, title, audience) tuples.
+
+    Each record is an object with markdown_content, report_title and optional
+    document_audience keys, a [markdown_content, report_title(, document_audience)]
+    array, or a JSON string of either. The audience defaults to 'internal'.
+    Malformed records raise ValueError naming the record index.
+    """
+    reports = []
+    for index, record in enumerate(records or []):
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except ValueError:
+                raise ValueError(f"Report record {index}: string is not a JSON object or array")
+        if isinstance(record, dict):
+            markdown_content = record.get('markdown_content')
+            report_title = record.get('report_title')
+            document_audience = record.get('document_audience')
+        elif isinstance(record, (list, tuple)) and len(record) in (2, 3):
+            markdown_content, report_title = record[0], record[1]
+            document_audience = record[2] if len(record) == 3 else None
+        else:
+            raise ValueError(
+                f"Report record {index}: expected an object or a "
+                "[markdown_content, report_title, document_audience] array"
+            )
+        if not isinstance(markdown_content, str) or not markdown_content.strip():
+            raise ValueError(f"Report record {index}: markdown_content is required")
+        if not isinstance(report_title, str) or not report_title.strip():
+            raise ValueError(f"Report record {index}: report_title is required")
+        reports.append((markdown_content, report_title, document_audience or 'internal'))
+    return reports
+
+
+def prepare_report(markdown_content: str, report_title: str, document_audience: str) -> dict:
+    """Validate audience and derive the content-addressed cache key and filename."""
+    # Validate audience
+    if document_audience not in VALID_AUDIENCES:
+        document_audience = 'internal'  # Default to internal if invalid
+
+    # Content-addressed filename: identical markdown, title and audience map to the same PDF
+    cache_key = hashlib.sha256(
+        '\x1f'.join([markdown_content or '', report_title or '', document_audience]).encode('utf-8')
+    ).hexdigest()
+    safe_title = re.sub(r'[^a-zA-Z0-9_]', '_', report_title)[:30]
+    return {
+        'markdown_content': markdown_content,
+        'report_title': report_title,
+        'document_audience': document_audience,
+        'cache_key': cache_key,
+        'pdf_filename': f'{document_audience}_{safe_title}_{cache_key[:16]}.pdf'
+    }
+
+
+def build_report_html(markdown_content: str, report_title: str, document_audience: str) -> str:
+    """Build the complete branded HTML document for one report."""
+    # Convert markdown to HTML
+    html_body = markdown.markdown(markdown_content, extensions=['tables', 'fenced_code'])
+
+    # Audience-specific header subtitle
+    if document_audience == 'internal':
+        header_subtitle = f'<span class="internal-badge">INTERNAL DOCUMENT</span> | {report_title}'
+    elif document_audience == 'external_regulatory':
+        header_subtitle = f'<span class="regulatory-badge">FCA REGULATED</span> | {report_title}'
+    else:  # external_client
+        header_subtitle = report_title
+
+    # Build header with logo
+    sam_header = f"""
+    <div class="header">
+        <div class="header-logo">
+            <img src="{LOGO_SRC}" alt="Simulated Asset Management" style="height: 50px;"/>
         </div>
-        """
-        
-        # Audience-specific footer content
-        report_timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p UTC')
-        
-        if document_audience == 'internal':
-            footer_content = f"""
-            <p><strong>Classification:</strong> Internal Use Only - Not for Distribution</p>
-            <p><strong>Generated:</strong> {report_timestamp}</p>
-            <p><strong>Generated By:</strong> Snowflake Intelligence</p>
-            """
-        elif document_audience == 'external_regulatory':
-            footer_content = f"""
-            <p><strong>Regulatory Status:</strong> Prepared in accordance with FCA reporting requirements</p>
-            <p><strong>Compliance Contact:</strong> compliance@sam-demo.example</p>
-            <p><strong>Generated:</strong> {report_timestamp}</p>
-            """
-        else:  # external_client
-            footer_content = f"""
-            <p><strong>Important:</strong> Past performance does not guarantee future results. Investment involves risk including possible loss of principal.</p>
-            <p><strong>Contact:</strong> clientservices@sam-demo.example</p>
-            <p><strong>Generated:</strong> {report_timestamp}</p>
-            """
-        
-        # Demo disclaimer (all audiences)
-        demo_disclaimer = """
-        <div class="demo-disclaimer">
-            <strong>DEMONSTRATION ONLY:</strong> This document was generated by Snowflake Intelligence 
-            for demonstration purposes. It does not represent real investment advice, actual portfolio data, 
-            or genuine recommendations. Simulated Asset Management is a fictional entity created for this demo.
+        <div class="header-text">
+            <h1 class="header-title" style="border: none; padding: 0;">SIMULATED ASSET MANAGEMENT</h1>
+            <p class="header-subtitle">{header_subtitle}</p>
         </div>
+    </div>
+    """
+
+    # Audience-specific footer content
+    report_timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p UTC')
+
+    if document_audience == 'internal':
+        footer_content = f"""
+        <p><strong>Classification:</strong> Internal Use Only - Not for Distribution</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        <p><strong>Generated By:</strong> Snowflake Intelligence</p>
         """
-        
-        # Complete footer
-        footer = f"""
+    elif document_audience == 'external_regulatory':
+        footer_content = f"""
+        <p><strong>Regulatory Status:</strong> Prepared in accordance with FCA reporting requirements</p>
+        <p><strong>Compliance Contact:</strong> compliance@sam-demo.example</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        """
+    else:  # external_client
+        footer_content = f"""
+        <p><strong>Important:</strong> Past performance does not guarantee future results. Investment involves risk including possible loss of principal.</p>
+        <p><strong>Contact:</strong> clientservices@sam-demo.example</p>
+        <p><strong>Generated:</strong> {report_timestamp}</p>
+        """
+
+    # Complete HTML document
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <title>Simulated Asset Management - {report_title}</title>
+        <style>{CSS_STYLE}</style>
+    </head>
+    <body>
+        {sam_header}
+        {html_body}
         <div class="footer">
             {footer_content}
-            {demo_disclaimer}
+            {DEMO_DISCLAIMER}
         </div>
-        """
-        
-        # Complete HTML document
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>Simulated Asset Management - {report_title}</title>
-            <style>{css_style}</style>
-        </head>
-        <body>
-            {sam_header}
-            {html_body}
-            {footer}
-        </body>
-        </html>
-        """
-        
-        # Create HTML file
-        html_path = os.path.join(tmpdir, 'report.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Convert HTML to PDF
-        import weasyprint
-        pdf_path = os.path.join(tmpdir, pdf_filename)
-        weasyprint.HTML(filename=html_path).write_pdf(pdf_path)
-        
-        # Upload to stage (AI schema to match am_ai_demo)
-        stage_path = '@SAM_DEMO.AI.PDF_REPORTS'
-        session.file.put(pdf_path, stage_path, overwrite=True, auto_compress=False)
-        
-        # Generate presigned URL for download
-        presigned_url = session.sql(
-            f"SELECT GET_PRESIGNED_URL('{stage_path}', '{pdf_filename}') AS url"
-        ).collect()[0]['URL']
-        
-        # Format response based on audience
-        audience_labels = {
-            'internal': 'Internal Report',
-            'external_client': 'Client Report', 
-            'external_regulatory': 'Regulatory Report'
+    </body>
+    </html>
+    """
+
+
+def create_font_config():
+    """Create a weasyprint font configuration to share across renders."""
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # weasyprint < 53
+        from weasyprint.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+def render_pdf(report: dict, pdf_path: str, font_config=None):
+    """Render one prepared report to pdf_path."""
+    import weasyprint
+    html_content = build_report_html(
+        report['markdown_content'], report['report_title'], report['document_audience']
+    )
+    weasyprint.HTML(string=html_content).write_pdf(pdf_path, font_config=font_config)
+
+
+def format_report_link(report_title: str, document_audience: str, presigned_url: str) -> str:
+    """Format the agent-facing download link for a generated report."""
+    audience_label = AUDIENCE_LABELS.get(document_audience, 'Report')
+    return f"[{audience_label}: {report_title}]({presigned_url}) - Professional PDF generated successfully with Simulated branding."
+
+
+def generate_reports(reports: list, store: dict) -> list:
+    """
+    Render, store and link a list of (markdown_content, report_title, document_audience).
+
+    Cached reports skip rendering; the remaining ones share one weasyprint font
+    configuration and are handed to the store in a single upload. Links are
+    returned in input order.
+    """
+    prepared = [prepare_report(*report) for report in reports]
+    unique_reports = {r['cache_key']: r for r in prepared}
+    cached_keys = store['find_cached'](list(unique_reports.values()))
+    to_render = [r for key, r in unique_reports.items() if key not in cached_keys]
+
+    if to_render:
+        font_config = create_font_config()
+        rendered = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for report in to_render:
+                render_started = time.perf_counter()
+                render_pdf(report, os.path.join(tmpdir, report['pdf_filename']), font_config)
+                rendered.append((report, time.perf_counter() - render_started))
+
+            # Upload all rendered PDFs together
+            upload_started = time.perf_counter()
+            store['upload'](tmpdir)
+            upload_share = (time.perf_counter() - upload_started) / len(rendered)
+
+        store['record_renders']([
+            (report, int((render_seconds + upload_share) * 1000)) for report, render_seconds in rendered
+        ])
+
+    # Every request beyond the first render of a report is a cache hit
+    hit_counts = Counter(r['cache_key'] for r in prepared)
+    for report in to_render:
+        hit_counts[report['cache_key']] -= 1
+    hit_counts = {key: hits for key, hits in hit_counts.items() if hits > 0}
+    if hit_counts:
+        store['record_hits'](hit_counts)
+
+    links = store['links']([r['pdf_filename'] for r in unique_reports.values()])
+    return [
+        format_report_link(r['report_title'], r['document_audience'], links[r['pdf_filename']])
+        for r in prepared
+    ]
+
+
+# =============================================================================
+# STORES
+# =============================================================================
+
+def stage_report_store(session, stage_path: str, cache_table: str) -> dict:
+    """Store PDFs on a Snowflake stage, indexed by a cache table, linked by presigned URL."""
+
+    def find_cached(reports: list) -> set:
+        placeholders = ', '.join(['?'] * len(reports))
+        cached_keys = {
+            row['CACHE_KEY'] for row in session.sql(
+                f"SELECT CACHE_KEY FROM {cache_table} WHERE CACHE_KEY IN ({placeholders})",
+                params=[r['cache_key'] for r in reports]
+            ).collect()
         }
-        audience_label = audience_labels.get(document_audience, 'Report')
-        
-        return f"[{audience_label}: {report_title}]({presigned_url}) - Professional PDF generated successfully with SAM branding."
+        if not cached_keys:
+            return set()
+
+        # Guard against stage files removed outside the procedures (one LIST per call)
+        key_pattern = '|'.join(key[:16] for key in cached_keys)
+        staged_files = {
+            row['name'].rsplit('/', 1)[-1] for row in session.sql(
+                f"LIST {stage_path} PATTERN = '.*_({key_pattern})[.]pdf'"
+            ).collect()
+        }
+        return {r['cache_key'] for r in reports
+                if r['cache_key'] in cached_keys and r['pdf_filename'] in staged_files}
+
+    def record_hits(hit_counts: dict):
+        values = ', '.join(['(?, ?)'] * len(hit_counts))
+        params = [v for key, hits in hit_counts.items() for v in (key, hits)]
+        session.sql(
+            f"""MERGE INTO {cache_table} t
+                USING (SELECT column1 AS CACHE_KEY, column2 AS HITS FROM VALUES {values}) s
+                ON t.CACHE_KEY = s.CACHE_KEY
+                WHEN MATCHED THEN UPDATE SET
+                    HIT_COUNT = t.HIT_COUNT + s.HITS,
+                    LAST_USED_AT = CURRENT_TIMESTAMP()::TIMESTAMP_NTZ""",
+            params=params
+        ).collect()
+
+    def record_renders(rendered: list):
+        values = ', '.join(['(?, ?, ?, ?, ?)'] * len(rendered))
+        params = [v for report, render_ms in rendered
+                  for v in (report['cache_key'], report['pdf_filename'], report['document_audience'],
+                            report['report_title'], render_ms)]
+        session.sql(
+            f"""MERGE INTO {cache_table} t
+                USING (SELECT column1 AS CACHE_KEY, column2 AS PDF_FILENAME, column3 AS DOCUMENT_AUDIENCE,
+                              column4 AS REPORT_TITLE, column5 AS RENDER_MS
+                       FROM VALUES {values}) s
+                ON t.CACHE_KEY = s.CACHE_KEY
+                WHEN MATCHED THEN UPDATE SET
+                    PDF_FILENAME = s.PDF_FILENAME,
+                    RENDER_MS = s.RENDER_MS,
+                    RENDER_COUNT = t.RENDER_COUNT + 1,
+                    LAST_USED_AT = CURRENT_TIMESTAMP()::TIMESTAMP_NTZ
+                WHEN NOT MATCHED THEN INSERT
+                    (CACHE_KEY, PDF_FILENAME, DOCUMENT_AUDIENCE, REPORT_TITLE, RENDER_MS,
+                     RENDER_COUNT, HIT_COUNT, CREATED_AT, LAST_USED_AT)
+                VALUES
+                    (s.CACHE_KEY, s.PDF_FILENAME, s.DOCUMENT_AUDIENCE, s.REPORT_TITLE, s.RENDER_MS,
+                     1, 0, CURRENT_TIMESTAMP()::TIMESTAMP_NTZ, CURRENT_TIMESTAMP()::TIMESTAMP_NTZ)""",
+            params=params
+        ).collect()
+
+    def upload(directory: str):
+        session.file.put(os.path.join(directory, '*.pdf'), stage_path, overwrite=True, auto_compress=False)
+
+    def links(pdf_filenames: list) -> dict:
+        values = ', '.join(['(?)'] * len(pdf_filenames))
+        return {
+            row['FILE_NAME']: row['URL'] for row in session.sql(
+                f"""SELECT column1 AS FILE_NAME, GET_PRESIGNED_URL('{stage_path}', column1) AS URL
+                    FROM VALUES {values}""",
+                params=list(pdf_filenames)
+            ).collect()
+        }
+
+    return {
+        'find_cached': find_cached,
+        'record_hits': record_hits,
+        'record_renders': record_renders,
+        'upload': upload,
+        'links': links,
+    }
+
+
+def local_report_store(directory: str, use_cache: bool = True) -> dict:
+    """
+    Store PDFs in a local directory, linked by file:// URL.
+
+    Cache bookkeeping is kept in memory on the returned dict ('hits' and
+    'render_ms'); use_cache=False forces every report to render.
+    """
+    os.makedirs(directory, exist_ok=True)
+    store = {'hits': Counter(), 'render_ms': {}}
+
+    def find_cached(reports: list) -> set:
+        if not use_cache:
+            return set()
+        return {r['cache_key'] for r in reports
+                if os.path.exists(os.path.join(directory, r['pdf_filename']))}
+
+    def record_hits(hit_counts: dict):
+        store['hits'].update(hit_counts)
+
+    def record_renders(rendered: list):
+        for report, render_ms in rendered:
+            store['render_ms'][report['cache_key']] = render_ms
+
+    def upload(source_directory: str):
+        for pdf_path in glob.glob(os.path.join(source_directory, '*.pdf')):
+            shutil.copy(pdf_path, directory)
+
+    def links(pdf_filenames: list) -> dict:
+        return {name: 'file://' + os.path.abspath(os.path.join(directory, name)) for name in pdf_filenames}
+
+    store.update({
+        'find_cached': find_cached,
+        'record_hits': record_hits,
+        'record_renders': record_renders,
+        'upload': upload,
+        'links': links,
+    })
+    return store
+
+
+from snowflake.snowpark import Session
+
+STAGE_PATH = '@SAM_DEMO.AI.PDF_REPORTS'
+CACHE_TABLE = 'SAM_DEMO.AI.PDF_REPORT_CACHE'
+
+
+def generate_pdf_batch(session: Session, reports: list):
+    """
+    Generate many branded PDF reports in one call.
+
+    Args:
+        session: Snowpark session
+        reports: Array of records, each either an object with markdown_content,
+                 report_title and (optional) document_audience keys or a
+                 [markdown_content, report_title, document_audience] array
+
+    Returns:
+        Array of download links, in the same order as the input records
+    """
+    records = parse_report_records(reports)
+    if not records:
+        return []
+    return generate_reports(records, stage_report_store(session, STAGE_PATH, CACHE_TABLE))
 $$;
 
 -- M&A Simulation Tool - matches am_ai_demo/build_ai.py exactly
@@ -807,6 +1588,382 @@ def simulate_acquisition(target_aum: float, target_revenue: float, cost_synergy_
     }
 $$;
 
+-- M&A Simulation Grid - table function for sensitivity analysis (matches build_ai.py)
+CREATE OR REPLACE FUNCTION SAM_DEMO.AI.MA_SIMULATION_GRID(
+    target_aum_min FLOAT,
+    target_aum_max FLOAT,
+    target_aum_steps INT,
+    target_revenue_min FLOAT,
+    target_revenue_max FLOAT,
+    target_revenue_steps INT,
+    cost_synergy_pct_min FLOAT DEFAULT 0.20,
+    cost_synergy_pct_max FLOAT DEFAULT 0.20,
+    cost_synergy_pct_steps INT DEFAULT 1
+)
+RETURNS TABLE (
+    TARGET_AUM FLOAT,
+    TARGET_REVENUE FLOAT,
+    COST_SYNERGY_PCT FLOAT,
+    YEAR1_EPS_ACCRETION_PCT FLOAT,
+    YEAR2_EPS_ACCRETION_PCT FLOAT,
+    YEAR1_NET_CONTRIBUTION_MILLIONS FLOAT,
+    YEAR2_NET_CONTRIBUTION_MILLIONS FLOAT,
+    COMBINED_AUM_BILLIONS FLOAT,
+    INTEGRATION_RISK_LEVEL VARCHAR,
+    TIMELINE_MONTHS INT,
+    SIMULATION OBJECT
+)
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+HANDLER = 'MaSimulationGrid'
+AS
+$$
+
+def simulate_acquisition(target_aum: float, target_revenue: float, cost_synergy_pct: float = 0.20) -> dict:
+    """
+    Simulate the financial impact of an acquisition on Simulated Asset Management.
+    
+    This model uses SAM's standard acquisition assumptions:
+    - Integration costs: $30M one-time (standard for mid-sized deals)
+    - Operating margin: 35% (SAM's current margin)
+    - Cost synergy realization: 70% in Year 1, 100% by Year 2
+    - Revenue synergy: Conservative 2% cross-sell uplift
+    - SAM baseline EPS: $2.50 (illustrative)
+    - SAM shares outstanding: 50M (illustrative)
+    
+    Args:
+        target_aum: Target company AUM in USD (e.g., 50000000000 for $50B)
+        target_revenue: Target company annual revenue in USD
+        cost_synergy_pct: Expected cost synergy as decimal (default 0.20 = 20%)
+    
+    Returns:
+        Dict with simulation results including EPS accretion, synergy value, timeline
+    """
+    
+    # SAM baseline assumptions (illustrative for demo)
+    sam_baseline_eps = 2.50  # Current EPS
+    sam_shares_outstanding = 50_000_000  # 50M shares
+    sam_current_aum = 12_500_000_000  # $12.5B AUM
+    sam_operating_margin = 0.35  # 35% operating margin
+    
+    # Integration assumptions
+    integration_cost_one_time = 30_000_000  # $30M one-time
+    year1_synergy_realization = 0.70  # 70% of synergies realized in Year 1
+    revenue_synergy_pct = 0.02  # 2% cross-sell uplift
+    
+    # Calculate target operating income
+    target_operating_income = target_revenue * sam_operating_margin
+    
+    # Calculate synergies
+    cost_synergies_full = target_revenue * cost_synergy_pct
+    cost_synergies_year1 = cost_synergies_full * year1_synergy_realization
+    revenue_synergies = target_revenue * revenue_synergy_pct
+    
+    # Year 1 contribution (after integration costs)
+    year1_contribution = (
+        target_operating_income +
+        cost_synergies_year1 +
+        (revenue_synergies * sam_operating_margin) -
+        integration_cost_one_time
+    )
+    
+    # Year 2 contribution (full synergies, no integration costs)
+    year2_contribution = (
+        target_operating_income +
+        cost_synergies_full +
+        (revenue_synergies * sam_operating_margin)
+    )
+    
+    # EPS impact (assuming cash deal, no share dilution)
+    eps_impact_year1 = year1_contribution / sam_shares_outstanding
+    eps_impact_year2 = year2_contribution / sam_shares_outstanding
+    
+    # EPS accretion percentage
+    eps_accretion_year1_pct = (eps_impact_year1 / sam_baseline_eps) * 100
+    eps_accretion_year2_pct = (eps_impact_year2 / sam_baseline_eps) * 100
+    
+    # Combined AUM
+    combined_aum = sam_current_aum + target_aum
+    aum_growth_pct = (target_aum / sam_current_aum) * 100
+    
+    # Risk factors based on deal size
+    risk_level = "Low" if target_aum < 5_000_000_000 else "Medium" if target_aum < 20_000_000_000 else "High"
+    
+    return {
+        "simulation_summary": {
+            "target_aum_billions": round(target_aum / 1_000_000_000, 1),
+            "target_revenue_millions": round(target_revenue / 1_000_000, 1),
+            "cost_synergy_assumption_pct": cost_synergy_pct * 100
+        },
+        "year1_projection": {
+            "eps_accretion_pct": round(eps_accretion_year1_pct, 1),
+            "eps_impact_usd": round(eps_impact_year1, 2),
+            "synergies_realized_millions": round(cost_synergies_year1 / 1_000_000, 1),
+            "integration_costs_millions": round(integration_cost_one_time / 1_000_000, 1),
+            "net_contribution_millions": round(year1_contribution / 1_000_000, 1)
+        },
+        "year2_projection": {
+            "eps_accretion_pct": round(eps_accretion_year2_pct, 1),
+            "eps_impact_usd": round(eps_impact_year2, 2),
+            "full_synergies_millions": round(cost_synergies_full / 1_000_000, 1),
+            "net_contribution_millions": round(year2_contribution / 1_000_000, 1)
+        },
+        "strategic_impact": {
+            "combined_aum_billions": round(combined_aum / 1_000_000_000, 1),
+            "aum_growth_pct": round(aum_growth_pct, 1),
+            "revenue_synergies_millions": round(revenue_synergies / 1_000_000, 1)
+        },
+        "risk_assessment": {
+            "integration_risk_level": risk_level,
+            "key_risks": [
+                "Client retention during transition",
+                "Key personnel retention",
+                "System integration complexity",
+                "Regulatory approval timeline"
+            ],
+            "timeline_months": 12 if risk_level == "Low" else 18 if risk_level == "Medium" else 24
+        },
+        "recommendation": f"Based on {round(eps_accretion_year1_pct, 1)}% Year 1 EPS accretion, this acquisition appears financially attractive. Recommend detailed due diligence focusing on client retention and integration planning."
+    }
+
+
+MAX_GRID_POINTS = 100_000
+
+def grid_values(minimum: float, maximum: float, steps: int) -> list:
+    """Evenly spaced values from minimum to maximum inclusive (steps <= 1 gives [minimum])."""
+    steps = int(steps or 1)
+    if steps <= 1 or maximum == minimum:
+        return [minimum]
+    increment = (maximum - minimum) / (steps - 1)
+    return [minimum + i * increment for i in range(steps)]
+
+def simulate_grid(target_aum_min, target_aum_max, target_aum_steps,
+                  target_revenue_min, target_revenue_max, target_revenue_steps,
+                  cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps,
+                  max_points: int = MAX_GRID_POINTS):
+    """Yield (target_aum, target_revenue, cost_synergy_pct, simulation) for every grid point."""
+    aum_values = grid_values(target_aum_min, target_aum_max, target_aum_steps)
+    revenue_values = grid_values(target_revenue_min, target_revenue_max, target_revenue_steps)
+    synergy_values = grid_values(cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps)
+    
+    grid_points = len(aum_values) * len(revenue_values) * len(synergy_values)
+    if grid_points > max_points:
+        raise ValueError(f"Grid of {grid_points} points exceeds the {max_points} point limit")
+    
+    for target_aum in aum_values:
+        for target_revenue in revenue_values:
+            for cost_synergy_pct in synergy_values:
+                yield target_aum, target_revenue, cost_synergy_pct, simulate_acquisition(target_aum, target_revenue, cost_synergy_pct)
+
+class MaSimulationGrid:
+    def process(self, target_aum_min, target_aum_max, target_aum_steps,
+                target_revenue_min, target_revenue_max, target_revenue_steps,
+                cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps):
+        for target_aum, target_revenue, cost_synergy_pct, result in simulate_grid(
+                target_aum_min, target_aum_max, target_aum_steps,
+                target_revenue_min, target_revenue_max, target_revenue_steps,
+                cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps):
+            yield (
+                target_aum,
+                target_revenue,
+                cost_synergy_pct,
+                result["year1_projection"]["eps_accretion_pct"],
+                result["year2_projection"]["eps_accretion_pct"],
+                result["year1_projection"]["net_contribution_millions"],
+                result["year2_projection"]["net_contribution_millions"],
+                result["strategic_impact"]["combined_aum_billions"],
+                result["risk_assessment"]["integration_risk_level"],
+                result["risk_assessment"]["timeline_months"],
+                result
+            )
+$$;
+
+-- M&A Simulation Grid Tool - scalar wrapper returning the grid as an ARRAY for the
+-- ma_simulation_grid agent tool (agent function tools cannot call table functions)
+CREATE OR REPLACE FUNCTION SAM_DEMO.AI.MA_SIMULATION_GRID_TOOL(
+    target_aum_min FLOAT,
+    target_aum_max FLOAT,
+    target_aum_steps INT,
+    target_revenue_min FLOAT,
+    target_revenue_max FLOAT,
+    target_revenue_steps INT,
+    cost_synergy_pct_min FLOAT DEFAULT 0.20,
+    cost_synergy_pct_max FLOAT DEFAULT 0.20,
+    cost_synergy_pct_steps INT DEFAULT 1
+)
+RETURNS ARRAY
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+HANDLER = 'simulate_acquisition_grid'
+AS
+$$
+
+def simulate_acquisition(target_aum: float, target_revenue: float, cost_synergy_pct: float = 0.20) -> dict:
+    """
+    Simulate the financial impact of an acquisition on Simulated Asset Management.
+    
+    This model uses SAM's standard acquisition assumptions:
+    - Integration costs: $30M one-time (standard for mid-sized deals)
+    - Operating margin: 35% (SAM's current margin)
+    - Cost synergy realization: 70% in Year 1, 100% by Year 2
+    - Revenue synergy: Conservative 2% cross-sell uplift
+    - SAM baseline EPS: $2.50 (illustrative)
+    - SAM shares outstanding: 50M (illustrative)
+    
+    Args:
+        target_aum: Target company AUM in USD (e.g., 50000000000 for $50B)
+        target_revenue: Target company annual revenue in USD
+        cost_synergy_pct: Expected cost synergy as decimal (default 0.20 = 20%)
+    
+    Returns:
+        Dict with simulation results including EPS accretion, synergy value, timeline
+    """
+    
+    # SAM baseline assumptions (illustrative for demo)
+    sam_baseline_eps = 2.50  # Current EPS
+    sam_shares_outstanding = 50_000_000  # 50M shares
+    sam_current_aum = 12_500_000_000  # $12.5B AUM
+    sam_operating_margin = 0.35  # 35% operating margin
+    
+    # Integration assumptions
+    integration_cost_one_time = 30_000_000  # $30M one-time
+    year1_synergy_realization = 0.70  # 70% of synergies realized in Year 1
+    revenue_synergy_pct = 0.02  # 2% cross-sell uplift
+    
+    # Calculate target operating income
+    target_operating_income = target_revenue * sam_operating_margin
+    
+    # Calculate synergies
+    cost_synergies_full = target_revenue * cost_synergy_pct
+    cost_synergies_year1 = cost_synergies_full * year1_synergy_realization
+    revenue_synergies = target_revenue * revenue_synergy_pct
+    
+    # Year 1 contribution (after integration costs)
+    year1_contribution = (
+        target_operating_income +
+        cost_synergies_year1 +
+        (revenue_synergies * sam_operating_margin) -
+        integration_cost_one_time
+    )
+    
+    # Year 2 contribution (full synergies, no integration costs)
+    year2_contribution = (
+        target_operating_income +
+        cost_synergies_full +
+        (revenue_synergies * sam_operating_margin)
+    )
+    
+    # EPS impact (assuming cash deal, no share dilution)
+    eps_impact_year1 = year1_contribution / sam_shares_outstanding
+    eps_impact_year2 = year2_contribution / sam_shares_outstanding
+    
+    # EPS accretion percentage
+    eps_accretion_year1_pct = (eps_impact_year1 / sam_baseline_eps) * 100
+    eps_accretion_year2_pct = (eps_impact_year2 / sam_baseline_eps) * 100
+    
+    # Combined AUM
+    combined_aum = sam_current_aum + target_aum
+    aum_growth_pct = (target_aum / sam_current_aum) * 100
+    
+    # Risk factors based on deal size
+    risk_level = "Low" if target_aum < 5_000_000_000 else "Medium" if target_aum < 20_000_000_000 else "High"
+    
+    return {
+        "simulation_summary": {
+            "target_aum_billions": round(target_aum / 1_000_000_000, 1),
+            "target_revenue_millions": round(target_revenue / 1_000_000, 1),
+            "cost_synergy_assumption_pct": cost_synergy_pct * 100
+        },
+        "year1_projection": {
+            "eps_accretion_pct": round(eps_accretion_year1_pct, 1),
+            "eps_impact_usd": round(eps_impact_year1, 2),
+            "synergies_realized_millions": round(cost_synergies_year1 / 1_000_000, 1),
+            "integration_costs_millions": round(integration_cost_one_time / 1_000_000, 1),
+            "net_contribution_millions": round(year1_contribution / 1_000_000, 1)
+        },
+        "year2_projection": {
+            "eps_accretion_pct": round(eps_accretion_year2_pct, 1),
+            "eps_impact_usd": round(eps_impact_year2, 2),
+            "full_synergies_millions": round(cost_synergies_full / 1_000_000, 1),
+            "net_contribution_millions": round(year2_contribution / 1_000_000, 1)
+        },
+        "strategic_impact": {
+            "combined_aum_billions": round(combined_aum / 1_000_000_000, 1),
+            "aum_growth_pct": round(aum_growth_pct, 1),
+            "revenue_synergies_millions": round(revenue_synergies / 1_000_000, 1)
+        },
+        "risk_assessment": {
+            "integration_risk_level": risk_level,
+            "key_risks": [
+                "Client retention during transition",
+                "Key personnel retention",
+                "System integration complexity",
+                "Regulatory approval timeline"
+            ],
+            "timeline_months": 12 if risk_level == "Low" else 18 if risk_level == "Medium" else 24
+        },
+        "recommendation": f"Based on {round(eps_accretion_year1_pct, 1)}% Year 1 EPS accretion, this acquisition appears financially attractive. Recommend detailed due diligence focusing on client retention and integration planning."
+    }
+
+
+MAX_GRID_POINTS = 100_000
+
+def grid_values(minimum: float, maximum: float, steps: int) -> list:
+    """Evenly spaced values from minimum to maximum inclusive (steps <= 1 gives [minimum])."""
+    steps = int(steps or 1)
+    if steps <= 1 or maximum == minimum:
+        return [minimum]
+    increment = (maximum - minimum) / (steps - 1)
+    return [minimum + i * increment for i in range(steps)]
+
+def simulate_grid(target_aum_min, target_aum_max, target_aum_steps,
+                  target_revenue_min, target_revenue_max, target_revenue_steps,
+                  cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps,
+                  max_points: int = MAX_GRID_POINTS):
+    """Yield (target_aum, target_revenue, cost_synergy_pct, simulation) for every grid point."""
+    aum_values = grid_values(target_aum_min, target_aum_max, target_aum_steps)
+    revenue_values = grid_values(target_revenue_min, target_revenue_max, target_revenue_steps)
+    synergy_values = grid_values(cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps)
+    
+    grid_points = len(aum_values) * len(revenue_values) * len(synergy_values)
+    if grid_points > max_points:
+        raise ValueError(f"Grid of {grid_points} points exceeds the {max_points} point limit")
+    
+    for target_aum in aum_values:
+        for target_revenue in revenue_values:
+            for cost_synergy_pct in synergy_values:
+                yield target_aum, target_revenue, cost_synergy_pct, simulate_acquisition(target_aum, target_revenue, cost_synergy_pct)
+
+# The whole grid is returned to the agent in one response, so keep it small
+MAX_TOOL_GRID_POINTS = 500
+
+def simulate_acquisition_grid(target_aum_min, target_aum_max, target_aum_steps,
+                              target_revenue_min, target_revenue_max, target_revenue_steps,
+                              cost_synergy_pct_min=0.20, cost_synergy_pct_max=0.20,
+                              cost_synergy_pct_steps=1) -> list:
+    """Run simulate_acquisition over the grid and return one summary dict per point."""
+    return [
+        {
+            "target_aum_billions": round(target_aum / 1_000_000_000, 1),
+            "target_revenue_millions": round(target_revenue / 1_000_000, 1),
+            "cost_synergy_assumption_pct": round(cost_synergy_pct * 100, 1),
+            "year1_eps_accretion_pct": result["year1_projection"]["eps_accretion_pct"],
+            "year2_eps_accretion_pct": result["year2_projection"]["eps_accretion_pct"],
+            "year1_net_contribution_millions": result["year1_projection"]["net_contribution_millions"],
+            "year2_net_contribution_millions": result["year2_projection"]["net_contribution_millions"],
+            "combined_aum_billions": result["strategic_impact"]["combined_aum_billions"],
+            "integration_risk_level": result["risk_assessment"]["integration_risk_level"],
+            "timeline_months": result["risk_assessment"]["timeline_months"]
+        }
+        for target_aum, target_revenue, cost_synergy_pct, result in simulate_grid(
+            target_aum_min, target_aum_max, target_aum_steps,
+            target_revenue_min, target_revenue_max, target_revenue_steps,
+            cost_synergy_pct_min, cost_synergy_pct_max, cost_synergy_pct_steps,
+            max_points=MAX_TOOL_GRID_POINTS
+        )
+    ]
+$$;
+
 -- ============================================================================
 -- SECTION 10: Execute Setup
 -- ============================================================================